@@ -70,6 +70,7 @@ from conflowgen.analyses.container_flow_by_vehicle_instance_analysis_report impo
 
 # Cache for analyses and previews
 from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
+from conflowgen.data_summaries.data_summaries_cache import DataSummariesCacheStatistics
 
 # Specific classes for reports
 from conflowgen.reporting.output_style import DisplayAsMarkupLanguage, DisplayAsPlainText, DisplayAsMarkdown
@@ -81,6 +82,7 @@ from conflowgen.domain_models.distribution_models.container_dwell_time_distribut
 
 # List of enums
 from conflowgen.application.data_types.export_file_format import ExportFileFormat
+from conflowgen.application.data_types.export_compression import ExportCompression
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
 from conflowgen.domain_models.data_types.container_length import ContainerLength
 from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
@@ -102,6 +104,7 @@ from conflowgen.descriptive_datatypes import UsedYardCapacityOverTime
 from conflowgen.descriptive_datatypes import VehicleIdentifier
 from conflowgen.descriptive_datatypes import ContainerVolumeByVehicleType
 from conflowgen.descriptive_datatypes import ContainersTransportedByTruck
+from conflowgen.descriptive_datatypes import ContainerDwellTimeStatistics
 
 # Add metadata constants
 from .metadata import __version__
@@ -4,12 +4,14 @@ import abc
 import datetime
 import typing
 
+import numpy as np
 # noinspection PyProtectedMember
-from peewee import ModelSelect
+from peewee import Case, ModelSelect
 
+from conflowgen.domain_models.data_types.container_length import CONTAINER_LENGTH_TO_OCCUPIED_TEU
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
-from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
 from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.repositories.container_repository import ContainerRepository
 from conflowgen.domain_models.vehicle import LargeScheduledVehicle
 from conflowgen.tools import hashable
 
@@ -38,6 +40,35 @@ def get_hour_based_range(
     return result
 
 
+def get_hour_based_time_window_indices(points_in_time: np.ndarray) -> np.ndarray:
+    """
+    Args:
+        points_in_time: An array of type ``datetime64``
+
+    Returns:
+        For each point in time, the number of hours since the epoch of its hour-based time window
+    """
+    return points_in_time.astype("datetime64[h]").astype(np.int64)
+
+
+def get_hour_based_range_from_indices(
+        first_time_window_index: int,
+        number_of_time_windows: int
+) -> typing.List[datetime.datetime]:
+    """
+    Args:
+        first_time_window_index: The index of the first time window as returned by
+            :func:`get_hour_based_time_window_indices`
+        number_of_time_windows: The number of consecutive time windows
+
+    Returns:
+        The hour-based time windows, starting with the first time window
+    """
+    return (
+        np.datetime64(int(first_time_window_index), "h") + np.arange(number_of_time_windows)
+    ).astype("datetime64[us]").tolist()
+
+
 SECONDS_IN_WEEK = 604800
 
 
@@ -48,8 +79,66 @@ def get_week_based_range(start: datetime.date, end: datetime.date) -> typing.Lis
     ] + [end]
 
 
+# The epoch (1970-01-01) is a Thursday, so the Monday of its week is three days earlier.
+DAYS_FROM_MONDAY_TO_EPOCH = 3
+
+
+def get_week_based_time_window_indices(points_in_time: np.ndarray) -> np.ndarray:
+    """
+    Args:
+        points_in_time: An array of type ``datetime64``
+
+    Returns:
+        For each point in time, the number of weeks since the epoch of its week-based time window.
+        Like in :func:`get_week_based_time_window`, each week starts on Monday.
+    """
+    days_since_epoch = points_in_time.astype("datetime64[D]").astype(np.int64)
+    return (days_since_epoch + DAYS_FROM_MONDAY_TO_EPOCH) // 7
+
+
+def get_week_based_range_from_indices(
+        first_time_window_index: int,
+        number_of_time_windows: int
+) -> typing.List[datetime.date]:
+    """
+    Args:
+        first_time_window_index: The index of the first time window as returned by
+            :func:`get_week_based_time_window_indices`
+        number_of_time_windows: The number of consecutive time windows
+
+    Returns:
+        The Mondays of the week-based time windows, starting with the first time window
+    """
+    first_monday = np.datetime64(int(first_time_window_index) * 7 - DAYS_FROM_MONDAY_TO_EPOCH, "D")
+    return (first_monday + 7 * np.arange(number_of_time_windows)).tolist()
+
+
+def count_per_time_window(
+        time_window_indices: np.ndarray,
+        first_time_window_index: int,
+        number_of_time_windows: int
+) -> np.ndarray:
+    """
+    Args:
+        time_window_indices: The time window index of each event, e.g., of each container passing a gate
+        first_time_window_index: The index of the first time window to count for
+        number_of_time_windows: The number of consecutive time windows to count for. No event must lie outside of
+            these time windows.
+
+    Returns:
+        The number of events for each of the time windows
+    """
+    return np.bincount(
+        np.asarray(time_window_indices, dtype=np.int64) - int(first_time_window_index),
+        minlength=number_of_time_windows
+    )
+
+
 class AbstractAnalysis(abc.ABC):
 
+    #: The :class:`.DataSummariesCache` identifies instances by their attributes instead of their identity
+    cache_results_by_attributes = True
+
     def __init__(
             self,
             transportation_buffer: typing.Optional[float] = None
@@ -84,70 +173,42 @@ class AbstractAnalysis(abc.ABC):
             self.transportation_buffer = transportation_buffer
 
     @staticmethod
-    def _restrict_storage_requirement(selected_containers: ModelSelect, storage_requirement: typing.Any) -> ModelSelect:
-        if hashable(storage_requirement) and storage_requirement in set(StorageRequirement):
-            selected_containers = selected_containers.where(
-                Container.storage_requirement == storage_requirement
-            )
-        else:  # assume it is some kind of collection (list, set, ...)
-            selected_containers = selected_containers.where(
-                Container.storage_requirement << storage_requirement
-            )
-        return selected_containers
-
-    @staticmethod
-    def _restrict_container_delivered_by_vehicle_type(
-            selected_containers: ModelSelect, container_delivered_by_vehicle_type: typing.Any
-    ) -> (ModelSelect, list[ModeOfTransport]):
-        if hashable(container_delivered_by_vehicle_type) \
-                and container_delivered_by_vehicle_type in set(ModeOfTransport):
-            selected_containers = selected_containers.where(
-                Container.delivered_by == container_delivered_by_vehicle_type
-            )
-            list_of_vehicle_types = [container_delivered_by_vehicle_type]
-        else:  # assume it is some kind of collection (list, set, ...)
-            selected_containers = selected_containers.where(
-                Container.delivered_by << container_delivered_by_vehicle_type
-            )
-            list_of_vehicle_types = list(container_delivered_by_vehicle_type)
-        return selected_containers, list_of_vehicle_types
-
-    @staticmethod
-    def _restrict_container_picked_up_by_vehicle_type(
-            selected_containers: ModelSelect, container_picked_up_by_vehicle_type: typing.Any
-    ) -> (ModelSelect, list[ModeOfTransport]):
-        if container_picked_up_by_vehicle_type == "scheduled vehicles":
-            container_picked_up_by_vehicle_type = ModeOfTransport.get_scheduled_vehicles()
-            list_of_vehicle_types = container_picked_up_by_vehicle_type
-        elif hashable(container_picked_up_by_vehicle_type) \
-                and container_picked_up_by_vehicle_type in set(ModeOfTransport):
-            selected_containers = selected_containers.where(
-                Container.picked_up_by == container_picked_up_by_vehicle_type
-            )
-            list_of_vehicle_types = [container_picked_up_by_vehicle_type]
-        else:  # assume it is some kind of collection (list, set, ...)
-            selected_containers = selected_containers.where(
-                Container.picked_up_by << container_picked_up_by_vehicle_type
-            )
-            list_of_vehicle_types = list(container_picked_up_by_vehicle_type)
-        return selected_containers, list_of_vehicle_types
+    def _get_occupied_teu_expression() -> Case:
+        """
+        Returns:
+            The occupied TEU of a container as an SQL expression so that the database can sum it up.
+        """
+        return Case(Container.length, [
+            (Container.length.db_value(container_length), occupied_teu)
+            for container_length, occupied_teu in CONTAINER_LENGTH_TO_OCCUPIED_TEU.items()
+        ])
 
     @staticmethod
-    def _restrict_container_picked_up_by_initial_vehicle_type(
-            selected_containers: ModelSelect, container_picked_up_by_initial_vehicle_type: typing.Any
+    def _restrict_time_range(
+            selected_containers: ModelSelect,
+            start_date: typing.Optional[datetime.datetime],
+            end_date: typing.Optional[datetime.datetime]
     ) -> ModelSelect:
+        """
+        Args:
+            selected_containers: A query that selects from the container table
+            start_date: Only include containers that arrive after the given start time.
+            end_date: Only include containers that depart before the given end time.
 
-        if container_picked_up_by_initial_vehicle_type == "scheduled vehicles":
-            container_picked_up_by_initial_vehicle_type = ModeOfTransport.get_scheduled_vehicles()
-
-        if hashable(container_picked_up_by_initial_vehicle_type) \
-                and container_picked_up_by_initial_vehicle_type in set(ModeOfTransport):
+        Returns:
+            The query restricted to the containers within the time range.
+        """
+        # No field converts the parameters of the COALESCE expressions, so the times are converted by the fields
+        # they are stored in to be compared in the same format
+        if start_date:
             selected_containers = selected_containers.where(
-                Container.picked_up_by_initial == container_picked_up_by_initial_vehicle_type
+                ContainerRepository.get_cached_arrival_time_expression()
+                >= Container.cached_arrival_time.db_value(start_date)
             )
-        else:  # assume it is some kind of collection (list, set, ...)
+        if end_date:
             selected_containers = selected_containers.where(
-                Container.picked_up_by_initial << container_picked_up_by_initial_vehicle_type
+                ContainerRepository.get_cached_departure_time_expression()
+                <= Container.cached_departure_time.db_value(end_date)
             )
         return selected_containers
 
@@ -3,10 +3,14 @@ from __future__ import annotations
 import datetime
 import typing
 
+import numpy as np
+import pandas as pd
+
+from conflowgen.descriptive_datatypes import ContainerDwellTimeStatistics
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
 from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
-from conflowgen.domain_models.container import Container
 from conflowgen.analyses.abstract_analysis import AbstractAnalysis
+from conflowgen.analyses.container_snapshot import ContainerSnapshot
 from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
 
 
@@ -53,36 +57,168 @@ class ContainerDwellTimeAnalysis(AbstractAnalysis):
 
         Returns:
             A set of container dwell times.
+            As it is a set, containers with the same dwell time are only represented once.
+            For one dwell time per container, use :meth:`.get_container_dwell_times_in_hours`.
+        """
+        return set(self._get_container_dwell_times_as_array(
+            container_delivered_by_vehicle_type=container_delivered_by_vehicle_type,
+            container_picked_up_by_vehicle_type=container_picked_up_by_vehicle_type,
+            storage_requirement=storage_requirement,
+            start_date=start_date,
+            end_date=end_date
+        ).tolist())
+
+    @DataSummariesCache.cache_result
+    def get_container_dwell_times_in_hours(
+            self,
+            container_delivered_by_vehicle_type: typing.Union[
+                str, typing.Collection[ModeOfTransport], ModeOfTransport] = "all",
+            container_picked_up_by_vehicle_type: typing.Union[
+                str, typing.Collection[ModeOfTransport], ModeOfTransport] = "all",
+            storage_requirement: typing.Union[
+                str, typing.Collection[StorageRequirement], StorageRequirement] = "all",
+            start_date: typing.Optional[datetime.datetime] = None,
+            end_date: typing.Optional[datetime.datetime] = None
+    ) -> np.ndarray:
+        """
+        The containers are filtered like in :meth:`.get_container_dwell_times`, which describes the arguments.
+        Other than that method, this one returns one dwell time per container and avoids creating one
+        :class:`datetime.timedelta` for each container.
+
+        Returns:
+            An array of type ``float64`` with the dwell time of each container in hours.
+            The array is shared, so it must not be modified in place.
+        """
+        container_dwell_times = self._get_container_dwell_times_as_array(
+            container_delivered_by_vehicle_type=container_delivered_by_vehicle_type,
+            container_picked_up_by_vehicle_type=container_picked_up_by_vehicle_type,
+            storage_requirement=storage_requirement,
+            start_date=start_date,
+            end_date=end_date
+        )
+        return container_dwell_times / np.timedelta64(1, "h")
+
+    def get_container_dwell_time_statistics(
+            self,
+            container_delivered_by_vehicle_type: typing.Union[
+                str, typing.Collection[ModeOfTransport], ModeOfTransport] = "all",
+            container_picked_up_by_vehicle_type: typing.Union[
+                str, typing.Collection[ModeOfTransport], ModeOfTransport] = "all",
+            storage_requirement: typing.Union[
+                str, typing.Collection[StorageRequirement], StorageRequirement] = "all",
+            start_date: typing.Optional[datetime.datetime] = None,
+            end_date: typing.Optional[datetime.datetime] = None
+    ) -> ContainerDwellTimeStatistics:
+        """
+        The containers are filtered like in :meth:`.get_container_dwell_times`, which describes the arguments.
+        The dwell times are rounded to full hours before the statistics are computed.
+
+        Returns:
+            The summary statistics of the container dwell times in hours.
+            If no container is selected, all values are zero.
+        """
+        container_dwell_times_in_hours = np.round(self.get_container_dwell_times_in_hours(
+            container_delivered_by_vehicle_type=container_delivered_by_vehicle_type,
+            container_picked_up_by_vehicle_type=container_picked_up_by_vehicle_type,
+            storage_requirement=storage_requirement,
+            start_date=start_date,
+            end_date=end_date
+        ))
+        number_containers = len(container_dwell_times_in_hours)
+        if number_containers == 0:
+            return ContainerDwellTimeStatistics(
+                number_containers=0, minimum=0, average=0, maximum=0, standard_deviation=None
+            )
+        return ContainerDwellTimeStatistics(
+            number_containers=number_containers,
+            minimum=float(container_dwell_times_in_hours.min()),
+            average=float(container_dwell_times_in_hours.mean()),
+            maximum=float(container_dwell_times_in_hours.max()),
+            standard_deviation=(
+                float(container_dwell_times_in_hours.std(ddof=1)) if number_containers > 1 else None
+            )
+        )
+
+    def get_container_dwell_time_histogram(
+            self,
+            container_delivered_by_vehicle_type: typing.Union[
+                str, typing.Collection[ModeOfTransport], ModeOfTransport] = "all",
+            container_picked_up_by_vehicle_type: typing.Union[
+                str, typing.Collection[ModeOfTransport], ModeOfTransport] = "all",
+            storage_requirement: typing.Union[
+                str, typing.Collection[StorageRequirement], StorageRequirement] = "all",
+            start_date: typing.Optional[datetime.datetime] = None,
+            end_date: typing.Optional[datetime.datetime] = None,
+            bin_width_in_hours: int = 24
+    ) -> typing.Dict[int, int]:
         """
-        container_dwell_times: set[datetime.timedelta] = set()
+        The containers are filtered like in :meth:`.get_container_dwell_times`, which describes the other arguments.
+        Then, the dwell times are put into bins of the same width.
 
-        selected_containers = Container.select()
+        Args:
+            bin_width_in_hours:
+                The width of each bin in hours.
+
+        Returns:
+            For each bin, the lower bound of the dwell time in hours and the number of containers in that bin.
+            Bins between the shortest and the longest dwell time are included even if they are empty.
+        """
+        assert bin_width_in_hours > 0, "The bins must have a positive width"
+        container_dwell_times_in_hours = self.get_container_dwell_times_in_hours(
+            container_delivered_by_vehicle_type=container_delivered_by_vehicle_type,
+            container_picked_up_by_vehicle_type=container_picked_up_by_vehicle_type,
+            storage_requirement=storage_requirement,
+            start_date=start_date,
+            end_date=end_date
+        )
+        if len(container_dwell_times_in_hours) == 0:
+            return {}
+        bin_of_containers = np.floor(container_dwell_times_in_hours / bin_width_in_hours).astype(np.int64)
+        first_bin = int(bin_of_containers.min())
+        number_containers_per_bin = np.bincount(bin_of_containers - first_bin)
+        return {
+            (first_bin + i) * bin_width_in_hours: number_containers
+            for i, number_containers in enumerate(number_containers_per_bin.tolist())
+        }
+
+    @staticmethod
+    def _get_container_dwell_times_as_array(
+            container_delivered_by_vehicle_type: typing.Union[
+                str, typing.Collection[ModeOfTransport], ModeOfTransport],
+            container_picked_up_by_vehicle_type: typing.Union[
+                str, typing.Collection[ModeOfTransport], ModeOfTransport],
+            storage_requirement: typing.Union[
+                str, typing.Collection[StorageRequirement], StorageRequirement],
+            start_date: typing.Optional[datetime.datetime],
+            end_date: typing.Optional[datetime.datetime]
+    ) -> np.ndarray:
+        selected_containers = ContainerSnapshot.get_containers()
 
         if storage_requirement != "all":
-            selected_containers = self._restrict_storage_requirement(
-                selected_containers, storage_requirement
+            selected_containers = ContainerSnapshot.restrict_to_values(
+                selected_containers, "storage_requirement", storage_requirement
             )
 
         if container_delivered_by_vehicle_type != "all":
-            selected_containers, vehicle_types = self._restrict_container_delivered_by_vehicle_type(
-                selected_containers, container_delivered_by_vehicle_type
+            selected_containers = ContainerSnapshot.restrict_to_values(
+                selected_containers, "delivered_by", container_delivered_by_vehicle_type
             )
 
-        if container_picked_up_by_vehicle_type != "all":
-            selected_containers, vehicle_types = self._restrict_container_picked_up_by_vehicle_type(
-                selected_containers, container_picked_up_by_vehicle_type
+        # For "scheduled vehicles", no restriction has been applied so far.
+        if container_picked_up_by_vehicle_type not in ("all", "scheduled vehicles"):
+            selected_containers = ContainerSnapshot.restrict_to_values(
+                selected_containers, "picked_up_by", container_picked_up_by_vehicle_type
             )
 
-        container: Container
-        for container in selected_containers:
-            container_enters_yard = container.get_arrival_time()
-            container_leaves_yard = container.get_departure_time()
-            assert container_enters_yard < container_leaves_yard, "A container should enter the yard before leaving it"
-            if start_date and container_enters_yard < start_date:
-                continue
-            if end_date and container_leaves_yard > end_date:
-                continue
-            container_dwell_time = container_leaves_yard - container_enters_yard
-            container_dwell_times.add(container_dwell_time)
-
-        return container_dwell_times
+        container_enters_yard: pd.Series = selected_containers["arrival_time"]
+        container_leaves_yard: pd.Series = selected_containers["departure_time"]
+        assert (container_enters_yard < container_leaves_yard).all(), \
+            "A container should enter the yard before leaving it"
+
+        is_selected = np.ones(len(selected_containers), dtype=bool)
+        if start_date:
+            is_selected &= (container_enters_yard >= start_date).to_numpy()
+        if end_date:
+            is_selected &= (container_leaves_yard <= end_date).to_numpy()
+
+        return (container_leaves_yard - container_enters_yard).to_numpy()[is_selected]
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-import datetime
-import statistics
 import typing  # noqa: F401, pylint: disable=unused-import  # lgtm [py/unused-import]  # used in the docstring
 
+import numpy as np
 import pandas as pd
 import matplotlib.axis
 
@@ -61,23 +60,22 @@ class ContainerDwellTimeAnalysisReport(AbstractReportWithMatplotlib):
              The report in text format (possibly spanning over several lines).
         """
 
-        (
-            container_delivered_by_vehicle_type, container_dwell_times, container_picked_up_by_vehicle_type,
-            storage_requirement
-        ) = self._get_container_dwell_times(kwargs)
-
-        container_dwell_times_in_hours = [
-            int(round(dwell_time.total_seconds() / 3600)) for dwell_time in container_dwell_times
-        ]
-
-        number_containers = len(container_dwell_times_in_hours)
-        if number_containers:
-            minimum_container_dwell_time = min(container_dwell_times_in_hours)
-            maximum_container_dwell_timey = max(container_dwell_times_in_hours)
-            average_container_dwell_time = statistics.mean(container_dwell_times_in_hours)
-            stddev_container_dwell_time = statistics.stdev(container_dwell_times_in_hours)
-        else:
-            minimum_container_dwell_time = maximum_container_dwell_timey = average_container_dwell_time = 0
+        container_delivered_by_vehicle_type, container_picked_up_by_vehicle_type, storage_requirement, \
+            start_date, end_date = self._get_filters(kwargs)
+
+        container_dwell_time_statistics = self.analysis.get_container_dwell_time_statistics(
+            container_delivered_by_vehicle_type=container_delivered_by_vehicle_type,
+            container_picked_up_by_vehicle_type=container_picked_up_by_vehicle_type,
+            storage_requirement=storage_requirement,
+            start_date=start_date,
+            end_date=end_date
+        )
+        number_containers = container_dwell_time_statistics.number_containers
+        minimum_container_dwell_time = container_dwell_time_statistics.minimum
+        maximum_container_dwell_timey = container_dwell_time_statistics.maximum
+        average_container_dwell_time = container_dwell_time_statistics.average
+        stddev_container_dwell_time = container_dwell_time_statistics.standard_deviation
+        if stddev_container_dwell_time is None:
             stddev_container_dwell_time = -1
 
         # create string representation
@@ -126,18 +124,21 @@ class ContainerDwellTimeAnalysisReport(AbstractReportWithMatplotlib):
              The matplotlib axis of the histogram
         """
 
-        (
-            container_delivered_by_vehicle_type, container_dwell_times, container_picked_up_by_vehicle_type,
-            storage_requirement
-        ) = self._get_container_dwell_times(kwargs)
+        container_delivered_by_vehicle_type, container_picked_up_by_vehicle_type, storage_requirement, \
+            start_date, end_date = self._get_filters(kwargs)
+
+        container_dwell_times_in_hours = self.analysis.get_container_dwell_times_in_hours(
+            container_delivered_by_vehicle_type=container_delivered_by_vehicle_type,
+            container_picked_up_by_vehicle_type=container_picked_up_by_vehicle_type,
+            storage_requirement=storage_requirement,
+            start_date=start_date,
+            end_date=end_date
+        )
 
-        if len(container_dwell_times) == 0:
+        if len(container_dwell_times_in_hours) == 0:
             fig, ax = no_data_graph()
         else:
-            container_dwell_times_in_hours = [
-                int(round(dwell_time.total_seconds() / 3600)) for dwell_time in container_dwell_times
-            ]
-            series = pd.Series(list(container_dwell_times_in_hours))
+            series = pd.Series(np.round(container_dwell_times_in_hours).astype(np.int64))
             ax = series.plot.hist()
 
         title = ""
@@ -152,22 +153,15 @@ class ContainerDwellTimeAnalysisReport(AbstractReportWithMatplotlib):
         ax.set_title(title)
         return ax
 
-    def _get_container_dwell_times(self, kwargs):
+    @staticmethod
+    def _get_filters(kwargs):
         container_delivered_by_vehicle_type = kwargs.pop("container_delivered_by_vehicle_type", "all")
         container_picked_up_by_vehicle_type = kwargs.pop("container_picked_up_by_vehicle_type", "all")
         storage_requirement = kwargs.pop("storage_requirement", "all")
         start_date = kwargs.pop("start_date", None)
         end_date = kwargs.pop("end_date", None)
         assert len(kwargs) == 0, f"Keyword(s) {list(kwargs.keys())} have not been processed"
-
-        container_dwell_times: set[datetime.timedelta] = self.analysis.get_container_dwell_times(
-            container_delivered_by_vehicle_type=container_delivered_by_vehicle_type,
-            container_picked_up_by_vehicle_type=container_picked_up_by_vehicle_type,
-            storage_requirement=storage_requirement,
-            start_date=start_date,
-            end_date=end_date
-        )
         return (
-            container_delivered_by_vehicle_type, container_dwell_times, container_picked_up_by_vehicle_type,
-            storage_requirement
+            container_delivered_by_vehicle_type, container_picked_up_by_vehicle_type, storage_requirement,
+            start_date, end_date
         )
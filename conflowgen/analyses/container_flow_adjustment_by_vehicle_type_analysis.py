@@ -3,6 +3,8 @@ from __future__ import annotations
 import datetime
 import typing
 
+from peewee import fn
+
 from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
 from conflowgen.domain_models.container import Container
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
@@ -59,18 +61,23 @@ class ContainerFlowAdjustmentByVehicleTypeAnalysis(AbstractAnalysis):
             for vehicle_type_initial in ModeOfTransport
         }
 
-        # Iterate over all containers and count number of containers / used teu capacity
-        container: Container
-        for container in Container.select():
-            if start_date and container.get_arrival_time() < start_date:
-                continue
-            if end_date and container.get_departure_time() > end_date:
-                continue
-            vehicle_type_initial = container.picked_up_by_initial
-            vehicle_type_adjusted = container.picked_up_by
-            initial_to_adjusted_outbound_flow_in_containers[vehicle_type_initial][vehicle_type_adjusted] += 1
-            initial_to_adjusted_outbound_flow_in_teu[vehicle_type_initial][vehicle_type_adjusted] += \
-                container.occupied_teu
+        # Count the number of containers / used teu capacity for each combination of vehicle types
+        selected_containers = Container.select(
+            Container.picked_up_by_initial,
+            Container.picked_up_by,
+            fn.COUNT(Container.id),
+            fn.SUM(ContainerFlowAdjustmentByVehicleTypeAnalysis._get_occupied_teu_expression())
+        )
+        selected_containers = ContainerFlowAdjustmentByVehicleTypeAnalysis._restrict_time_range(
+            selected_containers, start_date, end_date
+        )
+        for vehicle_type_initial, vehicle_type_adjusted, number_containers, used_teu in selected_containers.group_by(
+                Container.picked_up_by_initial,
+                Container.picked_up_by
+        ).tuples():
+            initial_to_adjusted_outbound_flow_in_containers[vehicle_type_initial][vehicle_type_adjusted] += \
+                number_containers
+            initial_to_adjusted_outbound_flow_in_teu[vehicle_type_initial][vehicle_type_adjusted] += used_teu
 
         return ContainerVolumeFromOriginToDestination(
             containers=initial_to_adjusted_outbound_flow_in_containers,
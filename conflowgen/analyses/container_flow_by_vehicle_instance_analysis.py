@@ -3,11 +3,14 @@ from __future__ import annotations
 import datetime
 import typing
 
-from peewee import ModelSelect
+import pandas as pd
 
+from conflowgen.analyses.container_snapshot import ContainerSnapshot
 from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
 from conflowgen.domain_models.container import Container
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.large_vehicle_schedule import Schedule
+from conflowgen.domain_models.vehicle import LargeScheduledVehicle
 from conflowgen.analyses.abstract_analysis import AbstractAnalysis
 from conflowgen.descriptive_datatypes import VehicleIdentifier, FlowDirection
 
@@ -54,72 +57,100 @@ class ContainerFlowByVehicleInstanceAnalysis(AbstractAnalysis):
             for vehicle_type in ModeOfTransport
         }
 
-        vehicle_identifier_cache = {}
-
-        selected_containers: ModelSelect = Container.select().where(
-            (Container.delivered_by.in_(vehicle_types) | Container.picked_up_by.in_(vehicle_types))
-        )
-
-        container: Container
-        for container in selected_containers:
-            if start_date and container.get_arrival_time() < start_date:
-                continue
-            if end_date and container.get_departure_time() > end_date:
-                continue
-
-            if container.delivered_by_large_scheduled_vehicle is not None:  # if not transported by truck
-
-                if container.delivered_by_large_scheduled_vehicle not in vehicle_identifier_cache:
-                    vehicle_id_inbound = VehicleIdentifier(
-                        id=container.delivered_by_large_scheduled_vehicle.id,
-                        mode_of_transport=container.delivered_by,
-                        service_name=container.delivered_by_large_scheduled_vehicle.schedule.service_name,
-                        vehicle_name=container.delivered_by_large_scheduled_vehicle.vehicle_name,
-                        vehicle_arrival_time=container.get_arrival_time(),
-                    )
-                    vehicle_identifier_cache[container.delivered_by_large_scheduled_vehicle] = vehicle_id_inbound
-
-                vehicle_id_inbound = vehicle_identifier_cache[container.delivered_by_large_scheduled_vehicle]
-
-                if vehicle_id_inbound not in container_flow_by_vehicle[container.delivered_by]:
-                    container_flow_by_vehicle[container.delivered_by][vehicle_id_inbound] = {
-                        flow_direction: {
-                            "inbound": 0,
-                            "outbound": 0,
-                        }
-                        for flow_direction in FlowDirection
-                    }
-                container_flow_by_vehicle[
-                    container.delivered_by
-                ][vehicle_id_inbound][container.flow_direction]["inbound"] += container.occupied_teu
-
-            if container.picked_up_by_large_scheduled_vehicle is not None:  # if not transported by truck
-
-                if container.picked_up_by_large_scheduled_vehicle not in vehicle_identifier_cache:
-                    vehicle_id_outbound = VehicleIdentifier(
-                        id=container.picked_up_by_large_scheduled_vehicle.id,
-                        mode_of_transport=container.picked_up_by,
-                        service_name=container.picked_up_by_large_scheduled_vehicle.schedule.service_name,
-                        vehicle_name=container.picked_up_by_large_scheduled_vehicle.vehicle_name,
-                        vehicle_arrival_time=container.get_departure_time(),
-                    )
-                    vehicle_identifier_cache[container.picked_up_by_large_scheduled_vehicle] = vehicle_id_outbound
-
-                vehicle_id_outbound = vehicle_identifier_cache[container.picked_up_by_large_scheduled_vehicle]
-
-                if vehicle_id_outbound not in container_flow_by_vehicle[container.picked_up_by]:
-                    container_flow_by_vehicle[container.picked_up_by][vehicle_id_outbound] = {
-                        flow_direction: {
-                            "inbound": 0,
-                            "outbound": 0,
-                        }
-                        for flow_direction in FlowDirection
-                    }
-                container_flow_by_vehicle[
-                    container.picked_up_by][vehicle_id_outbound][container.flow_direction]["outbound"] += 1
+        vehicle_type_values = [vehicle_type.value for vehicle_type in vehicle_types]
+
+        containers = ContainerSnapshot.get_containers()
+        selected_containers = containers[
+            containers["delivered_by"].isin(vehicle_type_values) | containers["picked_up_by"].isin(vehicle_type_values)
+        ]
+        selected_containers = ContainerSnapshot.restrict_to_time_range(selected_containers, start_date, end_date)
+
+        # Trucks are not listed as vehicle instances
+        containers_delivered = selected_containers[
+            selected_containers["delivered_by"].isin(vehicle_type_values)
+            & selected_containers["delivered_by_large_scheduled_vehicle"].notna()
+        ]
+        containers_picked_up = selected_containers[
+            selected_containers["picked_up_by"].isin(vehicle_type_values)
+            & selected_containers["picked_up_by_large_scheduled_vehicle"].notna()
+        ]
+
+        large_scheduled_vehicles = {
+            vehicle_id: (service_name, vehicle_name)
+            for (vehicle_id, service_name, vehicle_name) in LargeScheduledVehicle.select(
+                LargeScheduledVehicle.id, Schedule.service_name, LargeScheduledVehicle.vehicle_name
+            ).join(Schedule).tuples()
+        }
+
+        # The vehicles are listed in the order in which they first deliver or pick up a container
+        vehicle_identifiers: typing.Dict[int, VehicleIdentifier] = {}
+        first_container_of_each_vehicle = pd.concat([
+            pd.DataFrame({
+                "container": containers_delivered["id"],
+                "is_outbound": False,
+                "vehicle": containers_delivered["delivered_by_large_scheduled_vehicle"],
+                "vehicle_type": containers_delivered["delivered_by"],
+                "vehicle_arrival_time": containers_delivered["arrival_time"],
+            }),
+            pd.DataFrame({
+                "container": containers_picked_up["id"],
+                "is_outbound": True,
+                "vehicle": containers_picked_up["picked_up_by_large_scheduled_vehicle"],
+                "vehicle_type": containers_picked_up["picked_up_by"],
+                "vehicle_arrival_time": containers_picked_up["departure_time"],
+            }),
+        ]).sort_values(["container", "is_outbound"]).drop_duplicates("vehicle")
+        for vehicle_id, vehicle_type, vehicle_arrival_time in zip(
+                first_container_of_each_vehicle["vehicle"].tolist(),
+                first_container_of_each_vehicle["vehicle_type"].tolist(),
+                first_container_of_each_vehicle["vehicle_arrival_time"].to_numpy().tolist()
+        ):
+            service_name, vehicle_name = large_scheduled_vehicles[vehicle_id]
+            vehicle_identifier = VehicleIdentifier(
+                id=vehicle_id,
+                mode_of_transport=ModeOfTransport(vehicle_type),
+                service_name=service_name,
+                vehicle_name=vehicle_name,
+                vehicle_arrival_time=vehicle_arrival_time,
+            )
+            vehicle_identifiers[vehicle_id] = vehicle_identifier
+            container_flow_by_vehicle[vehicle_identifier.mode_of_transport][vehicle_identifier] = {
+                flow_direction: {
+                    "inbound": 0,
+                    "outbound": 0,
+                }
+                for flow_direction in FlowDirection
+            }
+
+        # The inbound volume is measured in TEU, the outbound volume in boxes
+        inbound_volumes = containers_delivered.groupby(
+            ["delivered_by_large_scheduled_vehicle", "delivered_by", "picked_up_by"]
+        )["occupied_teu"].sum()
+        for (vehicle_id, delivered_by, picked_up_by), used_teu in inbound_volumes.items():
+            vehicle_identifier = vehicle_identifiers[vehicle_id]
+            flow_direction = self._get_flow_direction(delivered_by, picked_up_by)
+            container_flow_by_vehicle[
+                vehicle_identifier.mode_of_transport][vehicle_identifier][flow_direction]["inbound"] += float(used_teu)
+
+        outbound_volumes = containers_picked_up.groupby(
+            ["picked_up_by_large_scheduled_vehicle", "delivered_by", "picked_up_by"]
+        ).size()
+        for (vehicle_id, delivered_by, picked_up_by), number_containers in outbound_volumes.items():
+            vehicle_identifier = vehicle_identifiers[vehicle_id]
+            flow_direction = self._get_flow_direction(delivered_by, picked_up_by)
+            container_flow_by_vehicle[
+                vehicle_identifier.mode_of_transport][vehicle_identifier][flow_direction]["outbound"] += \
+                int(number_containers)
 
         for skipped_vehicle_type in set(ModeOfTransport) - set(vehicle_types):
             assert len(container_flow_by_vehicle[skipped_vehicle_type]) == 0
             del container_flow_by_vehicle[skipped_vehicle_type]
 
         return container_flow_by_vehicle
+
+    @staticmethod
+    def _get_flow_direction(delivered_by: str, picked_up_by: str) -> FlowDirection:
+        return Container(
+            delivered_by=ModeOfTransport(delivered_by),
+            picked_up_by=ModeOfTransport(picked_up_by)
+        ).flow_direction
@@ -4,6 +4,8 @@ import copy
 import datetime
 import typing
 
+from peewee import fn
+
 from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
 from conflowgen.domain_models.container import Container
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
@@ -43,16 +45,21 @@ class ContainerFlowByVehicleTypeAnalysis(AbstractAnalysis):
         }
         inbound_to_outbound_flow_in_teu = copy.deepcopy(inbound_to_outbound_flow_in_containers)
 
-        container: Container
-        for container in Container.select():
-            if start_date and container.get_arrival_time() < start_date:
-                continue
-            if end_date and container.get_departure_time() > end_date:
-                continue
-            inbound_vehicle_type = container.delivered_by
-            outbound_vehicle_type = container.picked_up_by
-            inbound_to_outbound_flow_in_containers[inbound_vehicle_type][outbound_vehicle_type] += 1
-            inbound_to_outbound_flow_in_teu[inbound_vehicle_type][outbound_vehicle_type] += container.occupied_teu
+        selected_containers = Container.select(
+            Container.delivered_by,
+            Container.picked_up_by,
+            fn.COUNT(Container.id),
+            fn.SUM(ContainerFlowByVehicleTypeAnalysis._get_occupied_teu_expression())
+        )
+        selected_containers = ContainerFlowByVehicleTypeAnalysis._restrict_time_range(
+            selected_containers, start_date, end_date
+        )
+        for inbound_vehicle_type, outbound_vehicle_type, number_containers, used_teu in selected_containers.group_by(
+                Container.delivered_by,
+                Container.picked_up_by
+        ).tuples():
+            inbound_to_outbound_flow_in_containers[inbound_vehicle_type][outbound_vehicle_type] += number_containers
+            inbound_to_outbound_flow_in_teu[inbound_vehicle_type][outbound_vehicle_type] += used_teu
 
         inbound_to_outbound_flow = ContainerVolumeFromOriginToDestination(
             containers=inbound_to_outbound_flow_in_containers,
@@ -4,9 +4,11 @@ import collections
 import datetime
 import typing
 
+from conflowgen.analyses.container_snapshot import ContainerSnapshot
 from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
-from conflowgen.domain_models.container import Container
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.large_vehicle_schedule import Schedule
+from conflowgen.domain_models.vehicle import LargeScheduledVehicle
 from conflowgen.analyses.abstract_analysis import AbstractAnalysis
 from conflowgen.descriptive_datatypes import VehicleIdentifier
 
@@ -53,30 +55,44 @@ class ContainerFlowVehicleTypeAdjustmentPerVehicleAnalysis(AbstractAnalysis):
         number_of_non_adjusted_containers_per_vehicle: typing.Dict[VehicleIdentifier, int] = collections.Counter()
         number_of_adjusted_containers_per_vehicle: typing.Dict[VehicleIdentifier, int] = collections.Counter()
 
-        selected_containers = Container.select()
+        selected_containers = ContainerSnapshot.get_containers()
 
         if initial_vehicle_type is not None and initial_vehicle_type != "all":
-            selected_containers = self._restrict_container_picked_up_by_initial_vehicle_type(
-                selected_containers, initial_vehicle_type
+            if initial_vehicle_type == "scheduled vehicles":
+                initial_vehicle_type = ModeOfTransport.get_scheduled_vehicles()
+            selected_containers = ContainerSnapshot.restrict_to_values(
+                selected_containers, "picked_up_by_initial", initial_vehicle_type
             )
 
-        if adjusted_vehicle_type is not None and adjusted_vehicle_type != "all":
-            selected_containers, list_of_vehicle_types = self._restrict_container_picked_up_by_vehicle_type(
-                selected_containers, adjusted_vehicle_type
+        # For "scheduled vehicles", no restriction has been applied so far.
+        if adjusted_vehicle_type is not None and adjusted_vehicle_type not in ("all", "scheduled vehicles"):
+            selected_containers = ContainerSnapshot.restrict_to_values(
+                selected_containers, "picked_up_by", adjusted_vehicle_type
             )
 
-        vehicle_identifiers: typing.List[VehicleIdentifier] = []
+        selected_containers = ContainerSnapshot.restrict_to_time_range(selected_containers, start_date, end_date)
 
-        container: Container
-        for container in selected_containers:
-            if start_date and container.get_arrival_time() < start_date:
-                continue
-            if end_date and container.get_departure_time() > end_date:
-                continue
+        large_scheduled_vehicles = {
+            vehicle_id: (service_name, vehicle_name)
+            for (vehicle_id, service_name, vehicle_name) in LargeScheduledVehicle.select(
+                LargeScheduledVehicle.id, Schedule.service_name, LargeScheduledVehicle.vehicle_name
+            ).join(Schedule).tuples()
+        }
 
-            vehicle_identifier = self._get_vehicle_identifier_for_vehicle_picking_up_the_container(container)
+        vehicle_identifiers: typing.List[VehicleIdentifier] = []
+
+        for (picked_up_by, picked_up_by_initial, picked_up_by_large_scheduled_vehicle, departure_time) in zip(
+                selected_containers["picked_up_by"].tolist(),
+                selected_containers["picked_up_by_initial"].tolist(),
+                selected_containers["picked_up_by_large_scheduled_vehicle"].tolist(),
+                selected_containers["departure_time"].to_numpy().tolist()
+        ):
+            vehicle_identifier = self._get_vehicle_identifier_for_vehicle_picking_up_the_container(
+                ModeOfTransport(picked_up_by), picked_up_by_large_scheduled_vehicle, departure_time,
+                large_scheduled_vehicles
+            )
 
-            container_vehicle_type_has_been_adjusted = (container.picked_up_by != container.picked_up_by_initial)
+            container_vehicle_type_has_been_adjusted = (picked_up_by != picked_up_by_initial)
 
             if container_vehicle_type_has_been_adjusted:
                 number_of_adjusted_containers_per_vehicle[vehicle_identifier] += 1
@@ -96,21 +112,27 @@ class ContainerFlowVehicleTypeAdjustmentPerVehicleAnalysis(AbstractAnalysis):
         return fraction_of_adjusted_containers
 
     @staticmethod
-    def _get_vehicle_identifier_for_vehicle_picking_up_the_container(container: Container) -> VehicleIdentifier:
-        if container.picked_up_by == ModeOfTransport.truck:
+    def _get_vehicle_identifier_for_vehicle_picking_up_the_container(
+            picked_up_by: ModeOfTransport,
+            picked_up_by_large_scheduled_vehicle: typing.Optional[int],
+            departure_time: datetime.datetime,
+            large_scheduled_vehicles: typing.Dict[int, typing.Tuple[str, str]]
+    ) -> VehicleIdentifier:
+        if picked_up_by == ModeOfTransport.truck:
             vehicle_identifier = VehicleIdentifier(
                 id=None,
                 mode_of_transport=ModeOfTransport.truck,
-                vehicle_arrival_time=container.get_departure_time(),
+                vehicle_arrival_time=departure_time,
                 service_name=None,
                 vehicle_name=None
             )
         else:
+            service_name, vehicle_name = large_scheduled_vehicles[picked_up_by_large_scheduled_vehicle]
             vehicle_identifier = VehicleIdentifier(
-                id=container.picked_up_by_large_scheduled_vehicle.id,
-                mode_of_transport=container.picked_up_by,
-                vehicle_arrival_time=container.get_departure_time(),
-                service_name=container.picked_up_by_large_scheduled_vehicle.schedule.service_name,
-                vehicle_name=container.picked_up_by_large_scheduled_vehicle.vehicle_name
+                id=picked_up_by_large_scheduled_vehicle,
+                mode_of_transport=picked_up_by,
+                vehicle_arrival_time=departure_time,
+                service_name=service_name,
+                vehicle_name=vehicle_name
             )
         return vehicle_identifier
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import datetime
+import enum
+import typing
+
+import pandas as pd
+
+from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
+from conflowgen.domain_models.base_model import database_proxy
+from conflowgen.domain_models.container import Container, FaultyDataException, NoPickupVehicleException
+from conflowgen.domain_models.data_types.container_length import CONTAINER_LENGTH_TO_OCCUPIED_TEU
+from conflowgen.domain_models.repositories.container_repository import ContainerRepository
+
+
+class ContainerSnapshot:
+    """
+    A columnar copy of the container table that is loaded with a single query.
+    It is kept in the :class:`.DataSummariesCache` so that all analyses share it until the cache is reset, e.g.,
+    because a new container flow has been generated or another database has been chosen.
+    It is never persisted in the SQLite database, only the results of the analyses are.
+
+    Each row of the :class:`pandas.DataFrame` represents one container.
+    The enum columns contain the database representation of the enum, e.g., ``ModeOfTransport.truck.value``.
+    The vehicle columns contain the id of the vehicle or ``<NA>``.
+    The arrival and departure times are stored as ``datetime64[us]``, i.e., as 64-bit integers counting the
+    microseconds since the epoch.
+    """
+
+    columns = (
+        "id",
+        "length",
+        "storage_requirement",
+        "delivered_by",
+        "picked_up_by",
+        "picked_up_by_initial",
+        "delivered_by_large_scheduled_vehicle",
+        "picked_up_by_large_scheduled_vehicle",
+        "delivered_by_truck",
+        "picked_up_by_truck",
+        "arrival_time",
+        "departure_time",
+    )
+
+    vehicle_columns = (
+        "delivered_by_large_scheduled_vehicle",
+        "picked_up_by_large_scheduled_vehicle",
+        "delivered_by_truck",
+        "picked_up_by_truck",
+    )
+
+    @classmethod
+    @DataSummariesCache.cache_result(persist=False)
+    def get_containers(cls) -> pd.DataFrame:
+        """
+        Returns:
+            All containers with one column for each attribute listed in :attr:`columns` plus the column
+            ``occupied_teu``.
+            The data frame is shared, so it must not be modified in place.
+        """
+        query = Container.select(
+            Container.id,
+            Container.length,
+            Container.storage_requirement,
+            Container.delivered_by,
+            Container.picked_up_by,
+            Container.picked_up_by_initial,
+            Container.delivered_by_large_scheduled_vehicle,
+            Container.picked_up_by_large_scheduled_vehicle,
+            Container.delivered_by_truck,
+            Container.picked_up_by_truck,
+            ContainerRepository.get_cached_arrival_time_expression(),
+            ContainerRepository.get_cached_departure_time_expression(),
+        ).order_by(
+            Container.id
+        )
+        # The raw rows are read from the cursor to avoid creating one Python object per enum value and timestamp
+        cursor = database_proxy.execute(query)
+        containers = pd.DataFrame.from_records(list(cursor), columns=cls.columns)
+
+        containers["id"] = containers["id"].astype("int64")
+        containers["length"] = containers["length"].astype("int64")
+        containers["occupied_teu"] = containers["length"].map({
+            container_length.value: occupied_teu
+            for container_length, occupied_teu in CONTAINER_LENGTH_TO_OCCUPIED_TEU.items()
+        }).astype("float64")
+        for column in ("storage_requirement", "delivered_by", "picked_up_by", "picked_up_by_initial"):
+            containers[column] = containers[column].astype("object")
+        for column in cls.vehicle_columns:
+            containers[column] = containers[column].astype("Int64")
+        for column in ("arrival_time", "departure_time"):
+            containers[column] = pd.to_datetime(containers[column], format="ISO8601").astype("datetime64[us]")
+        return containers
+
+    @staticmethod
+    def restrict_to_values(
+            containers: pd.DataFrame,
+            column: str,
+            values: typing.Union[enum.Enum, typing.Collection[enum.Enum]]
+    ) -> pd.DataFrame:
+        """
+        Args:
+            containers: The containers as provided by :meth:`get_containers`
+            column: The enum column to filter on, e.g., ``"delivered_by"``
+            values: Either a single enum value or a collection of enum values (as a list, set, or similar)
+
+        Returns:
+            The containers for which the column contains one of the values.
+        """
+        if isinstance(values, enum.Enum):
+            return containers[containers[column] == values.value]
+        return containers[containers[column].isin([value.value for value in values])]
+
+    @staticmethod
+    def restrict_to_time_range(
+            containers: pd.DataFrame,
+            start_date: typing.Optional[datetime.datetime],
+            end_date: typing.Optional[datetime.datetime]
+    ) -> pd.DataFrame:
+        """
+        Args:
+            containers: The containers as provided by :meth:`get_containers`
+            start_date: Only include containers that arrive after the given start time.
+            end_date: Only include containers that depart before the given end time.
+
+        Returns:
+            The containers within the time range.
+        """
+        if start_date:
+            ContainerSnapshot.check_arrival_times(containers)
+            containers = containers[containers["arrival_time"] >= start_date]
+        if end_date:
+            ContainerSnapshot.check_departure_times(containers)
+            containers = containers[containers["departure_time"] <= end_date]
+        return containers
+
+    @staticmethod
+    def check_arrival_times(containers: pd.DataFrame) -> None:
+        """
+        Args:
+            containers: The containers as provided by :meth:`get_containers`
+
+        Raises:
+            FaultyDataException: If the arrival time of a container is unknown, like
+                :meth:`.Container.get_arrival_time` does.
+        """
+        arrival_time_is_missing = containers["arrival_time"].isna()
+        if arrival_time_is_missing.any():
+            container = Container.get_by_id(int(containers["id"][arrival_time_is_missing].iloc[0]))
+            raise FaultyDataException(f"Faulty data: {container}")
+
+    @staticmethod
+    def check_departure_times(containers: pd.DataFrame) -> None:
+        """
+        Args:
+            containers: The containers as provided by :meth:`get_containers`
+
+        Raises:
+            NoPickupVehicleException: If the departure time of a container is unknown, like
+                :meth:`.Container.get_departure_time` does.
+        """
+        departure_time_is_missing = containers["departure_time"].isna()
+        if departure_time_is_missing.any():
+            container = Container.get_by_id(int(containers["id"][departure_time_is_missing].iloc[0]))
+            raise NoPickupVehicleException(container, container.picked_up_by)
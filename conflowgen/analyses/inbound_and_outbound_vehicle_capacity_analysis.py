@@ -6,8 +6,8 @@ import typing  # noqa: F401, pylint: disable=unused-import  # lgtm [py/unused-im
 
 import numpy as np
 
+from conflowgen.analyses.container_snapshot import ContainerSnapshot
 from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
-from conflowgen.domain_models.container import Container
 from conflowgen.descriptive_datatypes import OutboundUsedAndMaximumCapacity, ContainerVolumeByVehicleType
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
 from conflowgen.domain_models.vehicle import LargeScheduledVehicle
@@ -47,15 +47,14 @@ class InboundAndOutboundVehicleCapacityAnalysis(AbstractAnalysis):
         }
         inbound_container_volume_in_containers = copy.deepcopy(inbound_container_volume_in_teu)
 
-        container: Container
-        for container in Container.select():
-            if start_date and container.get_arrival_time() < start_date:
-                continue
-            if end_date and container.get_departure_time() > end_date:
-                continue
-            inbound_vehicle_type = container.delivered_by
-            inbound_container_volume_in_teu[inbound_vehicle_type] += container.occupied_teu
-            inbound_container_volume_in_containers[inbound_vehicle_type] += 1
+        containers = ContainerSnapshot.restrict_to_time_range(
+            ContainerSnapshot.get_containers(), start_date, end_date
+        )
+        occupied_teu_by_inbound_vehicle_type = containers.groupby("delivered_by")["occupied_teu"]
+        for inbound_vehicle_type, number_containers in occupied_teu_by_inbound_vehicle_type.size().items():
+            inbound_container_volume_in_containers[ModeOfTransport(inbound_vehicle_type)] += int(number_containers)
+        for inbound_vehicle_type, occupied_teu in occupied_teu_by_inbound_vehicle_type.sum().items():
+            inbound_container_volume_in_teu[ModeOfTransport(inbound_vehicle_type)] += float(occupied_teu)
 
         return ContainerVolumeByVehicleType(
             containers=inbound_container_volume_in_containers,
@@ -96,15 +95,16 @@ class InboundAndOutboundVehicleCapacityAnalysis(AbstractAnalysis):
             outbound_actually_moved_container_volume_in_teu
         )
 
-        container: Container
-        for container in Container.select():
-            if start_date and container.get_arrival_time() < start_date:
-                continue
-            if end_date and container.get_departure_time() > end_date:
-                continue
-            outbound_vehicle_type: ModeOfTransport = container.picked_up_by
-            outbound_actually_moved_container_volume_in_teu[outbound_vehicle_type] += container.occupied_teu
-            outbound_actually_moved_container_volume_in_containers[outbound_vehicle_type] += 1
+        containers = ContainerSnapshot.restrict_to_time_range(
+            ContainerSnapshot.get_containers(), start_date, end_date
+        )
+        occupied_teu_by_outbound_vehicle_type = containers.groupby("picked_up_by")["occupied_teu"]
+        for outbound_vehicle_type, number_containers in occupied_teu_by_outbound_vehicle_type.size().items():
+            outbound_actually_moved_container_volume_in_containers[ModeOfTransport(outbound_vehicle_type)] += \
+                int(number_containers)
+        for outbound_vehicle_type, occupied_teu in occupied_teu_by_outbound_vehicle_type.sum().items():
+            outbound_actually_moved_container_volume_in_teu[ModeOfTransport(outbound_vehicle_type)] += \
+                float(occupied_teu)
 
         large_scheduled_vehicle: LargeScheduledVehicle
         for large_scheduled_vehicle in LargeScheduledVehicle.select():
@@ -3,6 +3,8 @@ from __future__ import annotations
 import datetime
 import typing
 
+from peewee import JOIN, fn
+
 from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
 from conflowgen.descriptive_datatypes import VehicleIdentifier
 from conflowgen.domain_models.container import Container
@@ -56,7 +58,21 @@ class OutboundToInboundVehicleCapacityUtilizationAnalysis(AbstractAnalysis):
         """
         capacities: typing.Dict[VehicleIdentifier, InboundAndOutboundCapacity] = {}
 
-        selected_vehicles = LargeScheduledVehicle.select().join(Schedule)
+        selected_vehicles = LargeScheduledVehicle.select(
+            LargeScheduledVehicle,
+            Schedule,
+            fn.COALESCE(fn.SUM(self._get_occupied_teu_expression()), 0).alias("used_capacity_on_outbound_journey")
+        ).join(
+            Schedule
+        ).switch(
+            LargeScheduledVehicle
+        ).join(
+            Container, JOIN.LEFT_OUTER, on=(Container.picked_up_by_large_scheduled_vehicle == LargeScheduledVehicle.id)
+        ).group_by(
+            LargeScheduledVehicle.id
+        ).order_by(
+            LargeScheduledVehicle.id
+        )
         if vehicle_type is not None and vehicle_type not in ("scheduled vehicles", "all"):
             selected_vehicles = self._restrict_vehicle_type(selected_vehicles, vehicle_type)
 
@@ -67,6 +83,7 @@ class OutboundToInboundVehicleCapacityUtilizationAnalysis(AbstractAnalysis):
             vehicle_name = vehicle.vehicle_name
             vehicle_arrival_time = vehicle.get_arrival_time()
             used_capacity_on_inbound_journey = vehicle.inbound_container_volume
+            used_capacity_on_outbound_journey = vehicle.used_capacity_on_outbound_journey
 
             if start_date and vehicle_arrival_time < start_date:
                 continue
@@ -78,14 +95,6 @@ class OutboundToInboundVehicleCapacityUtilizationAnalysis(AbstractAnalysis):
             mode_of_transport = vehicle_schedule.vehicle_type
             service_name = vehicle_schedule.service_name
 
-            used_capacity_on_outbound_journey = 0
-
-            container: Container
-            for container in Container.select().where(
-                Container.picked_up_by_large_scheduled_vehicle == vehicle
-            ):
-                used_capacity_on_outbound_journey += container.occupied_teu
-
             vehicle_id = VehicleIdentifier(
                 id=vehicle.id,
                 mode_of_transport=mode_of_transport,
@@ -3,11 +3,12 @@ from __future__ import annotations
 import datetime
 import typing
 
+import numpy as np
+
+from conflowgen.analyses.container_snapshot import ContainerSnapshot
 from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
-from conflowgen.domain_models.container import Container
-from conflowgen.domain_models.vehicle import LargeScheduledVehicle
-from conflowgen.analyses.abstract_analysis import AbstractAnalysis, get_week_based_time_window, \
-    get_week_based_range
+from conflowgen.analyses.abstract_analysis import AbstractAnalysis, count_per_time_window, \
+    get_week_based_range_from_indices, get_week_based_time_window_indices
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
 
 
@@ -52,45 +53,39 @@ class QuaySideThroughputAnalysis(AbstractAnalysis):
 
         assert (inbound or outbound), "At least one of the two must be checked for"
 
-        containers_that_pass_quay_side: typing.List[datetime.datetime] = []
-
-        container: Container
-        for container in Container.select():
-            if start_date and container.get_arrival_time() < start_date:
-                continue
-            if end_date and container.get_departure_time() > end_date:
-                continue
-
-            if inbound:
-                mode_of_transport_at_container_arrival: ModeOfTransport = container.delivered_by
-                if mode_of_transport_at_container_arrival in cls.QUAY_SIDE_VEHICLES:
-                    vehicle: LargeScheduledVehicle = container.delivered_by_large_scheduled_vehicle
-                    time_of_container_crossing_quay_side = vehicle.scheduled_arrival
-                    containers_that_pass_quay_side.append(time_of_container_crossing_quay_side)
-
-            if outbound:
-                mode_of_transport_at_container_departure: ModeOfTransport = container.picked_up_by
-                if mode_of_transport_at_container_departure in cls.QUAY_SIDE_VEHICLES:
-                    vehicle: LargeScheduledVehicle = container.picked_up_by_large_scheduled_vehicle
-                    time_of_container_crossing_quay_side = vehicle.scheduled_arrival
-                    containers_that_pass_quay_side.append(time_of_container_crossing_quay_side)
+        containers = ContainerSnapshot.restrict_to_time_range(
+            ContainerSnapshot.get_containers(), start_date, end_date
+        )
+
+        # The containers cross the quay side when the vessel arrives, which is the arrival or departure time of the
+        # container respectively.
+        points_in_time_of_passing_quay_side: typing.List[np.ndarray] = []
+        if inbound:
+            containers_delivered_by_vessel = ContainerSnapshot.restrict_to_values(
+                containers, "delivered_by", cls.QUAY_SIDE_VEHICLES
+            )
+            points_in_time_of_passing_quay_side.append(containers_delivered_by_vessel["arrival_time"].to_numpy())
+        if outbound:
+            containers_picked_up_by_vessel = ContainerSnapshot.restrict_to_values(
+                containers, "picked_up_by", cls.QUAY_SIDE_VEHICLES
+            )
+            points_in_time_of_passing_quay_side.append(containers_picked_up_by_vessel["departure_time"].to_numpy())
+        containers_that_pass_quay_side = np.concatenate(points_in_time_of_passing_quay_side)
 
         if len(containers_that_pass_quay_side) == 0:
             return {}
 
-        first_arrival = min(containers_that_pass_quay_side)
-        last_pickup = max(containers_that_pass_quay_side)
-
-        first_time_window = get_week_based_time_window(first_arrival) - datetime.timedelta(weeks=1)
-        last_time_window = get_week_based_time_window(last_pickup) + datetime.timedelta(weeks=1)
+        time_window_of_containers = get_week_based_time_window_indices(containers_that_pass_quay_side)
 
-        quay_side_throughput: typing.Dict[datetime.date, float] = {
-            time_window: 0
-            for time_window in get_week_based_range(first_time_window, last_time_window)
-        }
+        first_time_window = time_window_of_containers.min() - 1
+        last_time_window = time_window_of_containers.max() + 1
+        number_of_time_windows = int(last_time_window - first_time_window) + 1
 
-        for time_of_container_crossing_quay_side in containers_that_pass_quay_side:
-            time_window_of_container = get_week_based_time_window(time_of_container_crossing_quay_side)
-            quay_side_throughput[time_window_of_container] += 1  # counted in boxes
+        quay_side_throughput = count_per_time_window(  # counted in boxes
+            time_window_of_containers, first_time_window, number_of_time_windows
+        )
 
-        return quay_side_throughput
+        return dict(zip(
+            get_week_based_range_from_indices(first_time_window, number_of_time_windows),
+            quay_side_throughput.tolist()
+        ))
@@ -3,9 +3,12 @@ from __future__ import annotations
 import datetime
 import typing
 
+import numpy as np
+
+from conflowgen.analyses.container_snapshot import ContainerSnapshot
 from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
-from conflowgen.domain_models.container import Container
-from conflowgen.analyses.abstract_analysis import AbstractAnalysis, get_hour_based_time_window, get_hour_based_range
+from conflowgen.analyses.abstract_analysis import AbstractAnalysis, count_per_time_window, \
+    get_hour_based_range_from_indices, get_hour_based_time_window_indices
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
 
 
@@ -37,56 +40,47 @@ class TruckGateThroughputAnalysis(AbstractAnalysis):
         """
         assert (inbound or outbound), "At least one of the two must be checked for"
 
-        containers_that_pass_truck_gate: typing.List[datetime.datetime] = []
-
-        selected_containers = Container.select()
+        containers = ContainerSnapshot.get_containers()
 
-        selected_containers = selected_containers.where(
-            (Container.delivered_by == ModeOfTransport.truck) | (Container.picked_up_by == ModeOfTransport.truck)
-        )
+        points_in_time_of_passing_truck_gate: typing.List[np.ndarray] = []
+        if inbound:
+            containers_delivered_by_truck = containers[containers["delivered_by"] == ModeOfTransport.truck.value]
+            points_in_time_of_passing_truck_gate.append(containers_delivered_by_truck["arrival_time"].to_numpy())
+        if outbound:
+            containers_picked_up_by_truck = containers[containers["picked_up_by"] == ModeOfTransport.truck.value]
+            points_in_time_of_passing_truck_gate.append(containers_picked_up_by_truck["departure_time"].to_numpy())
+        containers_that_pass_truck_gate = np.concatenate(points_in_time_of_passing_truck_gate)
 
-        container: Container
-        for container in selected_containers:
-            if inbound:
-                mode_of_transport_at_container_arrival: ModeOfTransport = container.delivered_by
-                if mode_of_transport_at_container_arrival == ModeOfTransport.truck:
-                    time_of_entering = container.get_arrival_time()
-                    if (
-                            (start_date is None or time_of_entering >= start_date)
-                            and (end_date is None or time_of_entering <= end_date)
-                    ):
-                        containers_that_pass_truck_gate.append(time_of_entering)
-
-            if outbound:
-                mode_of_transport_at_container_departure: ModeOfTransport = container.picked_up_by
-                if mode_of_transport_at_container_departure == ModeOfTransport.truck:
-                    time_of_leaving = container.get_departure_time()
-                    if (
-                            (start_date is None or time_of_leaving >= start_date)
-                            and (end_date is None or time_of_leaving <= end_date)
-                    ):
-                        containers_that_pass_truck_gate.append(time_of_leaving)
+        if start_date is not None:
+            containers_that_pass_truck_gate = containers_that_pass_truck_gate[
+                containers_that_pass_truck_gate >= np.datetime64(start_date)
+            ]
+        if end_date is not None:
+            containers_that_pass_truck_gate = containers_that_pass_truck_gate[
+                containers_that_pass_truck_gate <= np.datetime64(end_date)
+            ]
 
         if len(containers_that_pass_truck_gate) == 0:
             return {}
 
-        first_arrival = min(containers_that_pass_truck_gate)
-        last_pickup = max(containers_that_pass_truck_gate)
+        time_window_of_containers = get_hour_based_time_window_indices(containers_that_pass_truck_gate)
+
+        first_arrival = time_window_of_containers.min()
+        last_pickup = time_window_of_containers.max()
         if start_date is not None:
-            first_arrival = min(start_date, first_arrival)
+            first_arrival = min(first_arrival, get_hour_based_time_window_indices(np.datetime64(start_date)))
         if end_date is not None:
-            last_pickup = max(end_date, last_pickup)
+            last_pickup = max(last_pickup, get_hour_based_time_window_indices(np.datetime64(end_date)))
 
-        first_time_window = get_hour_based_time_window(first_arrival) - datetime.timedelta(hours=1)
-        last_time_window = get_hour_based_time_window(last_pickup) + datetime.timedelta(hours=1)
+        first_time_window = first_arrival - 1
+        last_time_window = last_pickup + 1
+        number_of_time_windows = int(last_time_window - first_time_window) + 1
 
-        truck_gate_throughput: typing.Dict[datetime.datetime, float] = {
-            time_window: 0
-            for time_window in get_hour_based_range(first_time_window, last_time_window, True)
-        }
-
-        for time_of_container_crossing_quay_side in containers_that_pass_truck_gate:
-            time_window_of_container = get_hour_based_time_window(time_of_container_crossing_quay_side)
-            truck_gate_throughput[time_window_of_container] += 1  # counted in boxes
+        truck_gate_throughput = count_per_time_window(  # counted in boxes
+            time_window_of_containers, first_time_window, number_of_time_windows
+        )
 
-        return truck_gate_throughput
+        return dict(zip(
+            get_hour_based_range_from_indices(first_time_window, number_of_time_windows),
+            truck_gate_throughput.tolist()
+        ))
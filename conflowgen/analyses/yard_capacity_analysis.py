@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-import datetime
 import typing
 
+import numpy as np
+
+from conflowgen.analyses.container_snapshot import ContainerSnapshot
 from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
 from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
 from conflowgen.descriptive_datatypes import UsedYardCapacityOverTime
-from conflowgen.domain_models.container import Container
-from conflowgen.analyses.abstract_analysis import AbstractAnalysis, get_hour_based_time_window, get_hour_based_range
+from conflowgen.analyses.abstract_analysis import AbstractAnalysis, get_hour_based_time_window_indices, \
+    get_hour_based_range_from_indices
 
 
 class YardCapacityAnalysis(AbstractAnalysis):
@@ -53,53 +55,49 @@ class YardCapacityAnalysis(AbstractAnalysis):
             used yard capacity in TEU over the time. The second dictionary represents the used yard capacity
             in terms of the number of boxes over the time.
         """
-        selected_containers = Container.select()
+        selected_containers = ContainerSnapshot.get_containers()
 
         if storage_requirement is not None and storage_requirement != "all":
-            selected_containers = self._restrict_storage_requirement(selected_containers, storage_requirement)
-
-        container_stays: typing.List[typing.Tuple[datetime.datetime, datetime.datetime, float]] = []
-
-        container: Container
-        for container in selected_containers:
-            container_stays.append(
-                (
-                    container.get_arrival_time(),
-                    container.get_departure_time(),
-                    container.occupied_teu
-                )
+            selected_containers = ContainerSnapshot.restrict_to_values(
+                selected_containers, "storage_requirement", storage_requirement
             )
 
-        if len(container_stays) == 0:
+        if len(selected_containers) == 0:
             return UsedYardCapacityOverTime(teu={}, containers={})
 
-        first_arrival, _, _ = min(container_stays, key=lambda x: x[0])
-        _, last_pickup, _ = max(container_stays, key=lambda x: x[1])
-
-        first_time_window = get_hour_based_time_window(first_arrival) - datetime.timedelta(hours=1)
-        last_time_window = get_hour_based_time_window(last_pickup) + datetime.timedelta(hours=1)
-
-        used_yard_capacity_teu: typing.Dict[datetime.datetime, float] = {
-            time_window: 0
-            for time_window in get_hour_based_range(
-                first_time_window, last_time_window, include_end=(not smoothen_peaks)
-            )
-        }
-
-        used_yard_capacity_boxes: typing.Dict[datetime.datetime, int] = {
-            time_window: 0
-            for time_window in get_hour_based_range(
-                first_time_window, last_time_window, include_end=(not smoothen_peaks)
-            )
-        }
-
-        for (container_enters_yard, container_leaves_yard, teu_factor_of_container) in container_stays:
-            time_window_at_entering = get_hour_based_time_window(container_enters_yard)
-            time_window_at_leaving = get_hour_based_time_window(container_leaves_yard)
-            for time_window in get_hour_based_range(
-                    time_window_at_entering, time_window_at_leaving, include_end=(not smoothen_peaks)
-            ):
-                used_yard_capacity_teu[time_window] += teu_factor_of_container
-                used_yard_capacity_boxes[time_window] += 1
-
-        return UsedYardCapacityOverTime(teu=used_yard_capacity_teu, containers=used_yard_capacity_boxes)
+        # Containers without an arrival or departure time cannot be put into a time window
+        ContainerSnapshot.check_arrival_times(selected_containers)
+        ContainerSnapshot.check_departure_times(selected_containers)
+
+        time_window_at_entering = get_hour_based_time_window_indices(selected_containers["arrival_time"].to_numpy())
+        time_window_at_leaving = get_hour_based_time_window_indices(selected_containers["departure_time"].to_numpy())
+        teu_factor_of_containers = selected_containers["occupied_teu"].to_numpy()
+
+        first_time_window = time_window_at_entering.min() - 1
+        last_time_window = time_window_at_leaving.max() + 1
+        number_of_time_windows = int(last_time_window - first_time_window) + (0 if smoothen_peaks else 1)
+
+        # A container occupies the yard from the time window it enters up to the time window it leaves.
+        # The time window it leaves is only included if the peaks are not smoothened.
+        # Instead of incrementing each of these time windows, the change of the used yard capacity is recorded at
+        # the first and after the last occupied time window so that the prefix sum yields the used yard capacity.
+        first_occupied_time_window = time_window_at_entering - first_time_window
+        after_last_occupied_time_window = time_window_at_leaving - first_time_window + (0 if smoothen_peaks else 1)
+        after_last_occupied_time_window = np.maximum(first_occupied_time_window, after_last_occupied_time_window)
+        used_yard_capacity_teu = np.cumsum(
+            np.bincount(first_occupied_time_window, weights=teu_factor_of_containers,
+                        minlength=number_of_time_windows + 1)
+            - np.bincount(after_last_occupied_time_window, weights=teu_factor_of_containers,
+                          minlength=number_of_time_windows + 1)
+        )[:number_of_time_windows]
+        used_yard_capacity_boxes = np.cumsum(
+            np.bincount(first_occupied_time_window, minlength=number_of_time_windows + 1)
+            - np.bincount(after_last_occupied_time_window, minlength=number_of_time_windows + 1)
+        )[:number_of_time_windows]
+
+        time_windows = get_hour_based_range_from_indices(first_time_window, number_of_time_windows)
+
+        return UsedYardCapacityOverTime(
+            teu=dict(zip(time_windows, used_yard_capacity_teu.tolist())),
+            containers=dict(zip(time_windows, used_yard_capacity_boxes.tolist()))
+        )
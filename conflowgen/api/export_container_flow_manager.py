@@ -4,6 +4,7 @@ import typing
 
 from conflowgen.application.services.export_container_flow_service import \
     ExportContainerFlowService
+from conflowgen.application.data_types.export_compression import ExportCompression
 from conflowgen.application.data_types.export_file_format import ExportFileFormat
 
 
@@ -22,7 +23,10 @@ class ExportContainerFlowManager:
             folder_name: str,
             path_to_export_folder: typing.Optional[str] = None,
             file_format: typing.Optional[ExportFileFormat] = None,
-            overwrite: bool = False
+            overwrite: bool = False,
+            chunk_size: typing.Optional[int] = None,
+            max_workers: int = 1,
+            compression: typing.Optional[ExportCompression] = None
     ) -> str:
         """
         This extracts the container movement data from the SQL database to a folder of choice in a tabular data format.
@@ -36,9 +40,25 @@ class ExportContainerFlowManager:
                 defaults to ``<project root>/data/exports/``
             file_format: Desired tabular format, defaults to :class:`ExportFileFormat.csv`.
             overwrite: Whether to overwrite previously exported data, defaults to False
+            chunk_size: If set, each table is read from the database and appended to its CSV file in chunks of
+                this many rows, e.g., 100,000, so that the memory needed does not depend on the number of generated
+                containers.
+                In this case, the columns of each table are always ordered like the fields of the table and
+                columns of optional information are included even if no row contains such information.
+                Only :class:`ExportFileFormat.csv` is supported.
+                Defaults to None, i.e., each table is exported at once.
+            max_workers: If larger than 1, the tables are exported in parallel by up to this many processes, each
+                with its own read-only connection to the database.
+                This requires a SQLite database that is stored in a file.
+                Defaults to 1, i.e., the tables are exported one after another.
+            compression: If set, the files are compressed while they are written, see :class:`ExportCompression`.
+                Only :class:`ExportFileFormat.csv` can be compressed file by file, e.g., to ``containers.csv.gz``,
+                while :class:`ExportCompression.zip` bundles the files of any format in a single archive.
+                Defaults to None, i.e., the files are not compressed.
 
         Returns:
-            The path to the folder where the tabular data is located
+            The path to the folder where the tabular data is located, or the path to the archive if
+            :class:`ExportCompression.zip` is used
         """
         if file_format is None:
             file_format = ExportFileFormat.csv
@@ -46,6 +66,9 @@ class ExportContainerFlowManager:
             folder_name=folder_name,
             path_to_export_folder=path_to_export_folder,
             file_format=file_format,
-            overwrite=overwrite
+            overwrite=overwrite,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            compression=compression
         )
         return path_to_target_folder
@@ -0,0 +1,44 @@
+import enum
+
+import enum_tools
+
+
+@enum_tools.documentation.document_enum
+class ExportCompression(enum.Enum):
+    """
+    The export compression reduces the size of the exported files, e.g., before they are copied to other machines.
+    The files are compressed while they are written, so the uncompressed files are never stored on the hard drive.
+    """
+
+    gzip = "gz"
+    """
+    Each CSV file is compressed with gzip, e.g., ``containers.csv.gz``.
+    This is fast and widely supported.
+    """
+
+    bz2 = "bz2"
+    """
+    Each CSV file is compressed with bzip2, e.g., ``containers.csv.bz2``.
+    The files are usually smaller than with gzip but compressing them takes longer.
+    """
+
+    xz = "xz"
+    """
+    Each CSV file is compressed with xz (LZMA), e.g., ``containers.csv.xz``.
+    The files are usually the smallest but compressing them takes the longest.
+    """
+
+    zstd = "zst"
+    """
+    Each CSV file is compressed with Zstandard, e.g., ``containers.csv.zst``.
+    It compresses about as well as gzip but much faster.
+    This requires the package ``zstandard`` to be installed.
+    """
+
+    zip = "zip"
+    """
+    All files, including ``metadata.yaml``, are written into a single zip archive next to where the folder would be
+    created, e.g., ``<folder name>.zip``.
+    The archive contains the folder so that unpacking it restores the same structure as an export without compression.
+    This works for any file format.
+    """
@@ -36,3 +36,24 @@ class ExportFileFormat(enum.Enum):
     which is less than what large terminals nowadays handle within a month. Even with a hypothetical TEU factor of 2,
     this only reaches 1,572,864 TEU throughput per year.
     """
+
+    parquet = "parquet"
+    """
+    The Parquet file format stores each column in a compressed and typed manner.
+    Enum values with text values, e.g., the mode of transport, are stored as dictionary-encoded categories.
+    As Parquet only keeps dictionaries of text values, the container length is read back as a plain integer column.
+    Timestamps are stored as timestamps and numbers with missing values as nullable integers.
+    Thus, the files are much smaller than CSV files and are read in quickly, e.g., by pandas, Apache Spark, or a data
+    lake.
+    The explanation of each column is stored as metadata of the column.
+    This requires the package ``pyarrow`` to be installed, e.g., with ``pip install conflowgen[parquet]``.
+    """
+
+    feather = "feather"
+    """
+    The Feather file format, also known as the Arrow IPC file format, stores the columns in the same typed manner as
+    the Parquet file format.
+    Unlike Parquet, all enum values are kept as categories, including the container length.
+    It is optimized for fast reading and writing rather than for a small file size.
+    This requires the package ``pyarrow`` to be installed, e.g., with ``pip install conflowgen[parquet]``.
+    """
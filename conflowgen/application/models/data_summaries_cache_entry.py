@@ -0,0 +1,46 @@
+from peewee import AutoField, BlobField, CharField, CompositeKey, IntegerField, TextField
+
+from conflowgen.domain_models.base_model import BaseModel
+from conflowgen.metadata import __version__
+
+
+class DataSummariesContentVersion(BaseModel):
+    """
+    This table should only have a single entry.
+    """
+    id = AutoField()
+
+    version = IntegerField(
+        default=0,
+        help_text="Increased whenever the input data or the generated data changes so that persisted data summaries "
+                  "of an older version are not used anymore"
+    )
+
+    conflowgen_version = CharField(
+        default=__version__,
+        help_text="The ConFlowGen version that computed the persisted data summaries"
+    )
+
+
+class DataSummariesCacheEntry(BaseModel):
+    """
+    This table contains the persisted results of data summaries (analyses and previews).
+    """
+    function = TextField(
+        help_text="The module and qualified name of the function that computed the result"
+    )
+
+    arguments = TextField(
+        help_text="The canonical representation of the arguments the function has been called with"
+    )
+
+    content_version = IntegerField(
+        help_text="The content version of the database at the time the result has been computed"
+    )
+
+    result = BlobField(
+        help_text="The pickled result"
+    )
+
+    class Meta:
+        primary_key = CompositeKey("function", "arguments")
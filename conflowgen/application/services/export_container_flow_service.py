@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import bz2
+import concurrent.futures
 import enum
+import gzip
+import importlib.util
+import io
 import logging
+import lzma
 import os
+import urllib.request
+import zipfile
 from functools import lru_cache
-from typing import Dict, Type, Optional
+from typing import TYPE_CHECKING, BinaryIO, Dict, Iterator, List, Optional, TextIO, Tuple, Type
 
 import numpy as np
 import pandas as pd
@@ -13,19 +21,26 @@ import yaml
 # noinspection PyProtectedMember
 from peewee import ModelSelect
 
+from conflowgen.application.data_types.export_compression import ExportCompression
 from conflowgen.application.data_types.export_file_format import ExportFileFormat
 from conflowgen.domain_models.arrival_information import TruckArrivalInformationForDelivery, \
     TruckArrivalInformationForPickup
-from conflowgen.domain_models.base_model import BaseModel
+from conflowgen.domain_models.base_model import BaseModel, database_proxy
 from conflowgen.domain_models.container import Container
 from conflowgen.domain_models.data_types.container_length import ContainerLength
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
 from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
+from conflowgen.domain_models.field_types.container_length import ContainerLengthField
+from conflowgen.domain_models.field_types.mode_of_transport import ModeOfTransportField
+from conflowgen.domain_models.field_types.storage_requirement import StorageRequirementField
 from conflowgen.domain_models.large_vehicle_schedule import Destination
 from conflowgen.domain_models.vehicle import DeepSeaVessel, LargeScheduledVehicle, Feeder, Barge, Train, Truck, \
     AbstractLargeScheduledVehicle
 from conflowgen.application.models.container_flow_generation_properties import ContainerFlowGenerationProperties
 
+if TYPE_CHECKING:
+    import pyarrow
+
 EXPORTS_DEFAULT_DIR = os.path.join(
     os.path.dirname(os.path.realpath(__file__)),
     os.pardir,
@@ -43,6 +58,45 @@ class CastingException(Exception):
     pass
 
 
+class ChunkedExportNotSupportedException(Exception):
+    pass
+
+
+class CompressionNotSupportedException(Exception):
+    pass
+
+
+class FileFormatNotSupportedException(Exception):
+    pass
+
+
+def _open_database_read_only(path_to_database: str) -> None:
+    """
+    Opens a separate read-only connection in a worker process of a parallel export.
+    As the database uses the write-ahead log, several processes can read from it at the same time.
+    """
+    database = peewee.SqliteDatabase(
+        "file:" + urllib.request.pathname2url(path_to_database) + "?mode=ro",
+        uri=True,
+        pragmas={
+            'cache_size': -32 * 1024,  # counted in KiB, thus this means 32 MB cache
+            'query_only': 1
+        }
+    )
+    database_proxy.initialize(database)
+    database.bind(ExportContainerFlowService.get_exported_models())
+
+
+def _export_table_in_worker(
+        table_name: str,
+        path_to_file: str,
+        file_format: ExportFileFormat,
+        chunk_size: Optional[int]
+) -> str:
+    ExportContainerFlowService().export_table(table_name, path_to_file, file_format, chunk_size)
+    return path_to_file
+
+
 class ExportContainerFlowService:
     logger = logging.getLogger("conflowgen")
 
@@ -51,21 +105,115 @@ class ExportContainerFlowService:
     def debug_once(cls, msg: str):
         cls.logger.debug(msg)
 
+    # The save functions write to the file name unless an already opened binary file is provided, e.g., a member of a
+    # zip archive. For CSV files, the file name may end with the suffix of an ExportCompression, e.g. '.csv.gz'.
+
     @classmethod
-    def _save_as_csv(cls, df: pd.DataFrame, file_name: str) -> None:
-        assert file_name.endswith(".csv")
+    def _save_as_csv(cls, df: pd.DataFrame, file_name: str, file: Optional[BinaryIO] = None) -> None:
+        assert cls._remove_compression_suffix(file_name).endswith(".csv")
         # noinspection PyTypeChecker
-        df.to_csv(file_name)
+        df.to_csv(file_name if file is None else file)
+
+    @classmethod
+    def _save_as_csv_in_chunks(
+            cls,
+            model: Type[BaseModel],
+            file_name: str,
+            chunk_size: int,
+            file: Optional[BinaryIO] = None
+    ) -> None:
+        assert cls._remove_compression_suffix(file_name).endswith(".csv")
+        if file is None:
+            with cls._open_text_file_for_writing(file_name) as text_file:
+                cls._write_csv_in_chunks(model, text_file, chunk_size)
+        else:
+            text_file = io.TextIOWrapper(file, encoding="utf-8", newline="")
+            cls._write_csv_in_chunks(model, text_file, chunk_size)
+            text_file.detach()  # this flushes the text, the file itself is closed by the caller
+
+    @classmethod
+    def _write_csv_in_chunks(cls, model: Type[BaseModel], text_file: TextIO, chunk_size: int) -> None:
+        is_first_chunk = True
+        for df in cls._iterate_table_in_chunks(model, chunk_size):
+            # noinspection PyTypeChecker
+            df.to_csv(text_file, header=is_first_chunk)
+            is_first_chunk = False
+        if is_first_chunk:  # the table is empty, so only the header is written
+            # noinspection PyTypeChecker
+            cls._convert_to_typed_columns(pd.DataFrame(), model).rename_axis("id").to_csv(text_file)
 
     @classmethod
-    def _save_as_xls(cls, df: pd.DataFrame, file_name: str):
+    def _save_as_xls(cls, df: pd.DataFrame, file_name: str, file: Optional[BinaryIO] = None):
         assert file_name.endswith(".xls")
-        df.to_excel(file_name)
+        df.to_excel(file_name if file is None else file)
 
     @classmethod
-    def _save_as_xlsx(cls, df: pd.DataFrame, file_name: str):
+    def _save_as_xlsx(cls, df: pd.DataFrame, file_name: str, file: Optional[BinaryIO] = None):
         assert file_name.endswith(".xlsx")
-        df.to_excel(file_name)
+        df.to_excel(file_name if file is None else file)
+
+    @classmethod
+    def _save_as_parquet(cls, df: pd.DataFrame, file_name: str, file: Optional[BinaryIO] = None):
+        assert file_name.endswith(".parquet")
+        import pyarrow.parquet  # pylint: disable=import-outside-toplevel,redefined-outer-name
+        pyarrow.parquet.write_table(cls._convert_to_arrow_table(df), file_name if file is None else file)
+
+    @classmethod
+    def _save_as_feather(cls, df: pd.DataFrame, file_name: str, file: Optional[BinaryIO] = None):
+        assert file_name.endswith(".feather")
+        import pyarrow.feather  # pylint: disable=import-outside-toplevel,redefined-outer-name
+        pyarrow.feather.write_feather(cls._convert_to_arrow_table(df), file_name if file is None else file)
+
+    @staticmethod
+    def _remove_compression_suffix(file_name: str) -> str:
+        for compression in ExportCompression:
+            if file_name.endswith("." + compression.value):
+                return file_name[:-len(compression.value) - 1]
+        return file_name
+
+    @staticmethod
+    def _open_text_file_for_writing(file_name: str) -> TextIO:
+        """
+        Opens the file and, if the file name ends with the suffix of an ExportCompression, compresses the text while
+        it is written.
+        """
+        if file_name.endswith("." + ExportCompression.gzip.value):
+            return gzip.open(file_name, "wt", encoding="utf-8", newline="")
+        if file_name.endswith("." + ExportCompression.bz2.value):
+            return bz2.open(file_name, "wt", encoding="utf-8", newline="")
+        if file_name.endswith("." + ExportCompression.xz.value):
+            return lzma.open(file_name, "wt", encoding="utf-8", newline="")
+        if file_name.endswith("." + ExportCompression.zstd.value):
+            import zstandard  # pylint: disable=import-outside-toplevel
+            return zstandard.open(file_name, "wt", encoding="utf-8", newline="")
+        return open(file_name, "w", encoding="utf-8", newline="")  # pylint: disable=consider-using-with
+
+    @classmethod
+    def _convert_to_arrow_table(cls, df: pd.DataFrame) -> pyarrow.Table:
+        """
+        Args:
+            df: The table to save. The explanations of the columns and the general metadata are taken from
+                ``df.attrs``, see :meth:`_add_typed_columns_and_metadata`.
+
+        Returns:
+            The table with the explanation of each column as the column metadata ``description`` and the general
+            metadata as the table metadata ``conflowgen``.
+        """
+        import pyarrow  # pylint: disable=import-outside-toplevel,redefined-outer-name
+        column_descriptions = df.attrs.get("column_descriptions", {})
+        general_metadata = df.attrs.get("general")
+        df = df.copy(deep=False)
+        df.attrs = {}  # the metadata is stored in the schema instead of being serialized by pandas
+        table = pyarrow.Table.from_pandas(df, preserve_index=True)
+        fields = [
+            field.with_metadata({"description": column_descriptions[field.name]})
+            if field.name in column_descriptions else field
+            for field in table.schema
+        ]
+        table_metadata = dict(table.schema.metadata or {})
+        if general_metadata is not None:
+            table_metadata[b"conflowgen"] = yaml.dump(general_metadata).encode("utf-8")
+        return pyarrow.Table.from_arrays(table.columns, schema=pyarrow.schema(fields, metadata=table_metadata))
 
     enums_to_convert = (
         ContainerLength,
@@ -73,6 +221,19 @@ class ExportContainerFlowService:
         ModeOfTransport
     )
 
+    # For typed file formats, the values of these fields are stored as categories.
+    enum_field_types = {
+        ContainerLengthField: ContainerLength,
+        StorageRequirementField: StorageRequirement,
+        ModeOfTransportField: ModeOfTransport
+    }
+
+    # These file formats store the type of each column.
+    typed_file_formats = (
+        ExportFileFormat.parquet,
+        ExportFileFormat.feather
+    )
+
     # For a row, this foreign key is resolved and leads to a flat representation.
     foreign_keys_to_resolve = {
         # Each of barge, feeder, deep sea vessel, and train are treated equally
@@ -139,25 +300,34 @@ class ExportContainerFlowService:
         "trains": Train,
     }
 
+    models_of_tables = {
+        "containers": Container,
+        **large_schedule_vehicles_as_subtype,
+        "trucks": Truck,
+    }
+
+    # The name of the table in the metadata if it differs from the name of the table
+    metadata_names_of_tables = {
+        "containers": "container"
+    }
+
     def __init__(self):
         self.save_as_file_format_mapping = {
             ExportFileFormat.csv: self._save_as_csv,
             ExportFileFormat.xls: self._save_as_xls,
-            ExportFileFormat.xlsx: self._save_as_xlsx
+            ExportFileFormat.xlsx: self._save_as_xlsx,
+            ExportFileFormat.parquet: self._save_as_parquet,
+            ExportFileFormat.feather: self._save_as_feather
         }
 
     @classmethod
     def _convert_table_to_pandas_dataframe(
             cls,
-            model: Type[BaseModel] | ModelSelect,
-            resolved_column: str | None = None
+            model: Type[BaseModel] | ModelSelect
     ) -> pd.DataFrame:
 
-        if resolved_column is not None:
-            cls.debug_once(f"This is a nested call to resolve the column '{resolved_column}'")
-
-        # extract data from sql database
-        data = list(model.select().dicts())
+        # extract data from sql database, the foreign keys to resolve are joined within the same query
+        query = model.select()
 
         if isinstance(model, ModelSelect):
             model = model.model
@@ -166,28 +336,23 @@ class ExportContainerFlowService:
         if model in cls.foreign_keys_to_resolve.keys():
             foreign_keys_to_resolve = cls.foreign_keys_to_resolve[model]
 
-        # resolve some foreign keys
-        for i, row in enumerate(data):
-            for column, value in list(row.items()):
-                if column not in foreign_keys_to_resolve.keys():  # This is not a foreign key to resolve
-                    continue
-                if value is None:  # The foreign key points to nothing, thus no resolution
-                    continue
+        resolved_columns = {}
+        if foreign_keys_to_resolve:
+            query, resolved_columns = cls._join_foreign_keys_to_resolve(query, model, foreign_keys_to_resolve)
+
+        data = list(query.dicts())
+
+        # a foreign key that points to nothing is not resolved, so the joined columns are left out for that row
+        for column, nested_columns in resolved_columns.items():
+            is_resolved = False
+            for row in data:
+                if row[column] is None:
+                    for nested_column in nested_columns:
+                        del row[nested_column]
+                else:
+                    is_resolved = True
+            if is_resolved:
                 cls.debug_once(f"Resolving column {column} of model {model}...")
-                model_of_column = foreign_keys_to_resolve[column]
-                nested_model_select = model_of_column.select().where(
-                    model_of_column.id == value
-                )
-                nested_df = cls._convert_table_to_pandas_dataframe(
-                    nested_model_select,
-                    resolved_column=column
-                )  # Recursively resolve the relationship
-                assert len(nested_df) == 1, "Only 1:1 relationships between tables are supported"
-                nested_values = nested_df.iloc[0]
-                for nested_column in nested_df.columns:
-                    assert nested_column not in data[i].keys(), "Do not accidentally overwrite a column by a nested " \
-                                                                "column"
-                    data[i][nested_column] = nested_values[nested_column]
 
         # convert enums to their value
         for i, row in enumerate(data):
@@ -237,6 +402,76 @@ class ExportContainerFlowService:
 
         return df_table
 
+    @classmethod
+    def _join_foreign_keys_to_resolve(
+            cls,
+            query: ModelSelect,
+            model: Type[BaseModel],
+            foreign_keys_to_resolve: Dict[str, Type[BaseModel]]
+    ) -> Tuple[ModelSelect, Dict[str, List[str]]]:
+        """
+        Args:
+            query: The query selecting the rows of the model
+            model: The model the query selects from
+            foreign_keys_to_resolve: For each foreign key column to resolve, the referenced model
+
+        Returns:
+            The query with the referenced tables left-joined and, for each resolved foreign key column, the columns
+            that have been added to each row.
+            The columns of the referenced tables are dropped and renamed as if they were exported on their own,
+            except for their id.
+        """
+        existing_columns = set(model._meta.fields.keys())  # pylint: disable=protected-access
+        resolved_columns = {}
+        for column, model_of_column in foreign_keys_to_resolve.items():
+            nested_model = model_of_column.alias(f"resolved_{column}")
+            query = query.join_from(
+                model, nested_model, peewee.JOIN.LEFT_OUTER, on=(getattr(model, column) == nested_model.id)
+            )
+            nested_columns = []
+            for field in model_of_column._meta.sorted_fields:  # pylint: disable=protected-access
+                if field.name == "id" or field.name in cls.columns_to_drop.get(model_of_column, []):
+                    continue
+                nested_column = cls.columns_to_rename.get(model_of_column, {}).get(field.name, field.name)
+                assert nested_column not in existing_columns, "Do not accidentally overwrite a column by a nested " \
+                                                              "column"
+                existing_columns.add(nested_column)
+                query = query.select_extend(getattr(nested_model, field.name).alias(nested_column))
+                nested_columns.append(nested_column)
+            resolved_columns[column] = nested_columns
+        return query, resolved_columns
+
+    @classmethod
+    def _iterate_table_in_chunks(cls, model: Type[BaseModel], chunk_size: int) -> Iterator[pd.DataFrame]:
+        """
+        The rows are paged through by their primary key (keyset pagination) so that each query only reads the rows of
+        the next chunk, no matter how many rows have been read before.
+
+        Args:
+            model: The exported model
+            chunk_size: The maximum number of rows of each chunk
+
+        Returns:
+            The chunks with the same typed columns as created by :meth:`_convert_to_typed_columns` so that each chunk
+            has the same columns.
+        """
+        primary_key = model._meta.primary_key  # pylint: disable=protected-access
+        last_primary_key = None
+        while True:
+            keys_query = model.select(primary_key).order_by(primary_key).limit(chunk_size)
+            if last_primary_key is not None:
+                keys_query = keys_query.where(primary_key > last_primary_key)
+            keys = [key for (key, ) in keys_query.tuples()]
+            if len(keys) == 0:
+                return
+            df = cls._convert_table_to_pandas_dataframe(
+                model.select().where(primary_key.between(keys[0], keys[-1])).order_by(primary_key)
+            )
+            yield cls._convert_to_typed_columns(df, model)
+            if len(keys) < chunk_size:
+                return
+            last_primary_key = keys[-1]
+
     @classmethod
     def _convert_sql_database_to_pandas_dataframe(cls) -> Dict[str, pd.DataFrame]:
 
@@ -256,6 +491,121 @@ class ExportContainerFlowService:
         result["trucks"] = df_trucks
         return result
 
+    @classmethod
+    def get_exported_models(cls) -> List[Type[BaseModel]]:
+        """
+        Returns:
+            All models that are read during an export, including the resolved models and the models of the metadata.
+        """
+        exported_models = list(cls.models_of_tables.values()) + [ContainerFlowGenerationProperties]
+        for foreign_keys_to_resolve in cls.foreign_keys_to_resolve.values():
+            exported_models.extend(foreign_keys_to_resolve.values())
+        return list(dict.fromkeys(exported_models))
+
+    def export_table(
+            self,
+            table_name: str,
+            path_to_file: str,
+            file_format: ExportFileFormat,
+            chunk_size: Optional[int],
+            file: Optional[BinaryIO] = None
+    ) -> None:
+        """
+        Exports a single table, e.g., ``"containers"``, to the given file.
+        If an already opened binary file is provided, e.g., a member of a zip archive, the table is written to it
+        instead and the path to the file only determines the file name.
+        """
+        model = self.models_of_tables[table_name]
+        if chunk_size is not None:
+            self._save_as_csv_in_chunks(model, path_to_file, chunk_size, file=file)
+            return
+        df = self._convert_table_to_pandas_dataframe(model)
+        if len(df) == 0:
+            self.logger.info(f"No content found for the {table_name} table, the file will be empty.")
+        if file_format in self.typed_file_formats:
+            df = self._add_typed_columns_and_metadata({table_name: df})[table_name]
+        # noinspection PyArgumentList
+        self.save_as_file_format_mapping[file_format](df, path_to_file, file=file)
+
+    @classmethod
+    def _get_fields_of_columns(cls, model: Type[BaseModel]) -> Dict[str, peewee.Field]:
+        """
+        Args:
+            model: The exported model
+
+        Returns:
+            For each exported column, including the columns of resolved foreign keys, the field it originates from.
+        """
+        fields_of_columns = {}
+        for field in model._meta.sorted_fields:  # pylint: disable=protected-access
+            if field.name in cls.foreign_keys_to_resolve.get(model, {}):
+                model_of_column = cls.foreign_keys_to_resolve[model][field.name]
+                for nested_column, nested_field in cls._get_fields_of_columns(model_of_column).items():
+                    if nested_column != "id" and nested_column not in cls.columns_to_drop.get(model, []):
+                        fields_of_columns[nested_column] = nested_field
+            if field.name not in cls.columns_to_drop.get(model, []):
+                fields_of_columns[field.name] = field
+        if model in cls.columns_to_rename:
+            fields_of_columns = {
+                cls.columns_to_rename[model].get(column, column): field
+                for column, field in fields_of_columns.items()
+            }
+        return fields_of_columns
+
+    @classmethod
+    def _convert_to_typed_columns(cls, df: pd.DataFrame, model: Type[BaseModel]) -> pd.DataFrame:
+        """
+        Args:
+            df: The table as created by :meth:`_convert_table_to_pandas_dataframe`
+            model: The exported model
+
+        Returns:
+            The table with categories for enum values, timestamps, nullable integers, and nullable booleans.
+            The columns are ordered like the fields of the model.
+            Columns that are missing because no row references the resolved table are added so that the columns are
+            the same for each export.
+        """
+        fields_of_columns = {
+            column: field
+            for column, field in cls._get_fields_of_columns(model).items()
+            if column != df.index.name and column != "id"
+        }
+        df = df.reindex(
+            columns=list(fields_of_columns) + [column for column in df.columns if column not in fields_of_columns]
+        )
+        for column, field in fields_of_columns.items():
+            if type(field) in cls.enum_field_types:
+                enum_type = cls.enum_field_types[type(field)]
+                df[column] = pd.Categorical(df[column], categories=[value.value for value in enum_type])
+            elif isinstance(field, peewee.DateTimeField):
+                df[column] = pd.to_datetime(df[column]).astype("datetime64[us]")
+            elif isinstance(field, peewee.BooleanField):
+                df[column] = df[column].astype("boolean")
+            elif isinstance(field, (peewee.IntegerField, peewee.ForeignKeyField)):
+                df[column] = df[column].astype("Int64")
+        return df
+
+    @classmethod
+    def _add_typed_columns_and_metadata(cls, dfs: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """
+        Args:
+            dfs: The tables as created by :meth:`_convert_sql_database_to_pandas_dataframe`
+
+        Returns:
+            The tables with typed columns and with the metadata in ``df.attrs`` so that typed file formats can store
+            it next to the data.
+        """
+        metadata = cls._get_metadata()
+        typed_dfs = {}
+        for table_name, df in dfs.items():
+            typed_df = cls._convert_to_typed_columns(df, cls.models_of_tables[table_name])
+            typed_df.attrs["column_descriptions"] = metadata.get(
+                cls.metadata_names_of_tables.get(table_name, table_name), {}
+            )
+            typed_df.attrs["general"] = metadata["general"]
+            typed_dfs[table_name] = typed_df
+        return typed_dfs
+
     @classmethod
     def _get_metadata_of_model(
             cls, model: type[peewee.Model], metadata: Optional[dict] = None, single: bool = False, resolve: bool = True,
@@ -304,9 +654,23 @@ class ExportContainerFlowService:
             folder_name: str,
             path_to_export_folder: Optional[str],
             file_format: ExportFileFormat,
-            overwrite: bool
+            overwrite: bool,
+            chunk_size: Optional[int] = None,
+            max_workers: int = 1,
+            compression: Optional[ExportCompression] = None
     ) -> str:
 
+        assert max_workers >= 1, "At least one worker is needed"
+        self._check_file_format(file_format)
+        self._check_compression(file_format, compression)
+        if chunk_size is not None:
+            assert chunk_size > 0, "Each chunk must contain at least one row"
+            if file_format != ExportFileFormat.csv:
+                raise ChunkedExportNotSupportedException(
+                    f"Only the file format '.{ExportFileFormat.csv.value}' can be exported in chunks, "
+                    f"not '.{file_format.value}'"
+                )
+
         if path_to_export_folder is None:
             path_to_export_folder = EXPORTS_DEFAULT_DIR
 
@@ -316,6 +680,11 @@ class ExportContainerFlowService:
         else:
             self.logger.info(f"Using existing export folder at {path_to_export_folder}")
 
+        if compression == ExportCompression.zip:
+            return self._export_to_zip_archive(
+                folder_name, path_to_export_folder, file_format, overwrite, chunk_size, max_workers
+            )
+
         path_to_target_folder = os.path.join(
             path_to_export_folder,
             folder_name
@@ -330,17 +699,38 @@ class ExportContainerFlowService:
             os.mkdir(path_to_target_folder)
 
         file_format_str_repr = str(file_format.value)
-        self.logger.info(f"Converting SQL database into file format '.{file_format_str_repr}'")
-        dfs = self._convert_sql_database_to_pandas_dataframe()
-        for file_name, df in dfs.items():
-            full_file_name = file_name + "." + file_format_str_repr
-            path_to_file = os.path.join(
-                path_to_target_folder,
-                full_file_name
+        path_to_database = self._get_path_to_database_for_parallel_export() if max_workers > 1 else None
+        if path_to_database is not None:
+            self.logger.info(f"Exporting SQL database into file format '.{file_format_str_repr}' with up to "
+                             f"{max_workers} processes")
+            self._export_tables_in_parallel(
+                path_to_database, path_to_target_folder, file_format, chunk_size, max_workers, compression
             )
-            self.logger.debug(f"Saving file {full_file_name}")
-            # noinspection PyArgumentList
-            self.save_as_file_format_mapping[file_format](df, path_to_file)
+        elif chunk_size is not None:
+            self.logger.info(f"Exporting SQL database into file format '.{file_format_str_repr}' in chunks of "
+                             f"{chunk_size} rows")
+            for file_name in self.models_of_tables:
+                full_file_name = self._get_full_file_name(file_name, file_format, compression)
+                path_to_file = os.path.join(
+                    path_to_target_folder,
+                    full_file_name
+                )
+                self.logger.debug(f"Saving file {full_file_name}")
+                self.export_table(file_name, path_to_file, file_format, chunk_size)
+        else:
+            self.logger.info(f"Converting SQL database into file format '.{file_format_str_repr}'")
+            dfs = self._convert_sql_database_to_pandas_dataframe()
+            if file_format in self.typed_file_formats:
+                dfs = self._add_typed_columns_and_metadata(dfs)
+            for file_name, df in dfs.items():
+                full_file_name = self._get_full_file_name(file_name, file_format, compression)
+                path_to_file = os.path.join(
+                    path_to_target_folder,
+                    full_file_name
+                )
+                self.logger.debug(f"Saving file {full_file_name}")
+                # noinspection PyArgumentList
+                self.save_as_file_format_mapping[file_format](df, path_to_file)
 
         self._save_metadata(path_to_target_folder)
         self.logger.debug("Saving file metadata.yaml")
@@ -348,6 +738,130 @@ class ExportContainerFlowService:
         self.logger.info("Export has finished successfully.")
         return path_to_target_folder
 
+    @classmethod
+    def _check_file_format(cls, file_format: ExportFileFormat) -> None:
+        if file_format in (ExportFileFormat.parquet, ExportFileFormat.feather) \
+                and importlib.util.find_spec("pyarrow") is None:
+            raise FileFormatNotSupportedException(
+                f"The file format '.{file_format.value}' requires the package 'pyarrow' to be installed, e.g., with "
+                f"'pip install conflowgen[parquet]'."
+            )
+
+    @classmethod
+    def _check_compression(cls, file_format: ExportFileFormat, compression: Optional[ExportCompression]) -> None:
+        if compression is None or compression == ExportCompression.zip:
+            return
+        if file_format != ExportFileFormat.csv:
+            raise CompressionNotSupportedException(
+                f"Only the file format '.{ExportFileFormat.csv.value}' can be compressed file by file, "
+                f"'.{file_format.value}' is already compressed. Use '{ExportCompression.zip}' to bundle the files "
+                f"in a single archive instead."
+            )
+        if compression == ExportCompression.zstd and importlib.util.find_spec("zstandard") is None:
+            raise CompressionNotSupportedException(
+                f"The compression '{compression}' requires the package 'zstandard' to be installed."
+            )
+
+    @staticmethod
+    def _get_full_file_name(
+            file_name: str,
+            file_format: ExportFileFormat,
+            compression: Optional[ExportCompression] = None
+    ) -> str:
+        full_file_name = file_name + "." + str(file_format.value)
+        if compression is not None and compression != ExportCompression.zip:
+            full_file_name += "." + compression.value
+        return full_file_name
+
+    def _export_to_zip_archive(
+            self,
+            folder_name: str,
+            path_to_export_folder: str,
+            file_format: ExportFileFormat,
+            overwrite: bool,
+            chunk_size: Optional[int],
+            max_workers: int
+    ) -> str:
+        """
+        Each file is compressed while it is written into the archive, so the tables are exported one after another.
+
+        Returns:
+            The path to the zip archive
+        """
+        path_to_archive = os.path.join(
+            path_to_export_folder,
+            folder_name + "." + ExportCompression.zip.value
+        )
+        if os.path.isfile(path_to_archive):
+            if overwrite:
+                self.logger.info(f"The archive {path_to_archive} already exists, overwriting it.")
+            else:
+                raise ExportOnlyAllowedToNotExistingFolderException(path_to_archive)
+        if max_workers > 1:
+            self.logger.info("The files are written into a single archive, so the tables are exported one after "
+                             "another.")
+
+        self.logger.info(f"Exporting SQL database into file format '.{file_format.value}' within the archive "
+                         f"{path_to_archive}")
+        with zipfile.ZipFile(path_to_archive, "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+            for file_name in self.models_of_tables:
+                full_file_name = self._get_full_file_name(file_name, file_format)
+                self.logger.debug(f"Saving file {full_file_name}")
+                with zip_file.open(folder_name + "/" + full_file_name, "w", force_zip64=True) as file:
+                    self.export_table(file_name, full_file_name, file_format, chunk_size, file=file)
+            self.logger.debug("Saving file metadata.yaml")
+            with zip_file.open(folder_name + "/metadata.yaml", "w") as file:
+                file.write(yaml.dump(self._get_metadata()).encode("utf-8"))
+
+        self.logger.info("Export has finished successfully.")
+        return path_to_archive
+
+    @classmethod
+    def _get_path_to_database_for_parallel_export(cls) -> Optional[str]:
+        """
+        Returns:
+            The path to the SQLite database file if the worker processes can open it themselves, otherwise None.
+        """
+        database = database_proxy.obj
+        if not isinstance(database, peewee.SqliteDatabase) or database.database in ("", ":memory:") \
+                or database.database.startswith("file:"):
+            cls.logger.info("Only a SQLite database stored in a file can be exported in parallel, so the tables are "
+                            "exported one after another.")
+            return None
+        return os.path.abspath(database.database)
+
+    def _export_tables_in_parallel(
+            self,
+            path_to_database: str,
+            path_to_target_folder: str,
+            file_format: ExportFileFormat,
+            chunk_size: Optional[int],
+            max_workers: int,
+            compression: Optional[ExportCompression]
+    ) -> None:
+        """
+        Each table is exported by a separate process with its own read-only connection to the database.
+        The tables are submitted in the order of :attr:`models_of_tables` which starts with the largest table, i.e.,
+        the containers.
+        """
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(max_workers, len(self.models_of_tables)),
+                initializer=_open_database_read_only,
+                initargs=(path_to_database, )
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _export_table_in_worker,
+                    file_name,
+                    os.path.join(path_to_target_folder, self._get_full_file_name(file_name, file_format, compression)),
+                    file_format,
+                    chunk_size
+                )
+                for file_name in self.models_of_tables
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                self.logger.debug(f"Saved file {os.path.basename(future.result())}")
+
     @classmethod
     def _save_metadata(cls, path_to_target_folder: str):
         path_to_metadata_file = os.path.join(
@@ -0,0 +1,223 @@
+"""
+Builds the keys for the :class:`.DataSummariesCache`.
+The keys of the results kept in memory are hashable tuples, the keys of the persisted results are strings that are
+stable across processes.
+
+Instances of classes that set the class attribute ``cache_results_by_attributes`` to :obj:`True`, such as the
+analyses and previews, are identified by their attributes (e.g., the transportation buffer) instead of their
+identity.
+Thus, two instances with the same attributes share the cached results.
+The keys of the results kept in memory never keep the arguments alive: database records are represented by their
+class and primary key and other objects that are only identified by their identity by a weak reference.
+"""
+from __future__ import annotations
+
+import datetime
+import enum
+import typing
+import weakref
+
+import peewee
+
+
+class NotCanonicalizableException(Exception):
+    """
+    The value cannot be represented in a way that is stable across processes, e.g., because it is a database record.
+    """
+    pass
+
+
+_PRIMITIVE_TYPES = (type(None), bool, int, float, str)
+_TIME_TYPES = (datetime.datetime, datetime.date, datetime.time, datetime.timedelta)
+
+
+def get_function_identifier(func: typing.Callable) -> str:
+    """
+    Args:
+        func: The decorated function
+
+    Returns:
+        The module and the qualified name of the function, e.g.,
+        ``"conflowgen.analyses.yard_capacity_analysis.YardCapacityAnalysis.get_used_yard_capacity_over_time"``
+    """
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+def is_cached_by_attributes(value: typing.Any) -> bool:
+    """
+    Args:
+        value: An argument of a data summary function
+
+    Returns:
+        Whether the value is identified by its attributes instead of its identity.
+    """
+    return getattr(type(value), "cache_results_by_attributes", False) and hasattr(value, "__dict__")
+
+
+def is_bound_instance(func: typing.Callable, position: int, argument: typing.Any) -> bool:
+    """
+    Args:
+        func: The decorated function
+        position: The position of the argument
+        argument: The argument
+
+    Returns:
+        Whether the argument is the instance the function is bound to.
+    """
+    return (
+        position == 0
+        and not isinstance(argument, type)
+        and getattr(type(argument), func.__name__, None) is not None
+        and hasattr(argument, "__dict__")
+    )
+
+
+def freeze(value: typing.Any) -> typing.Hashable:
+    """
+    Args:
+        value: An argument of a data summary function, e.g., a list, a dict, or a database record
+
+    Returns:
+        A small hashable value that is equal for equal arguments, independent of the order of sets and dicts.
+        Database records are replaced by their class and primary key.
+        Objects that are only identified by their identity, e.g., a manager, are replaced by a weak reference.
+
+    Raises:
+        TypeError: If the value or one of the values it contains is not hashable and cannot be frozen.
+    """
+    if isinstance(value, list):
+        return list, tuple(freeze(element) for element in value)
+    if isinstance(value, tuple):
+        return tuple(freeze(element) for element in value)
+    if isinstance(value, set):
+        return set, frozenset(freeze(element) for element in value)
+    if isinstance(value, dict):
+        return dict, frozenset((freeze(key), freeze(element)) for key, element in value.items())
+    if is_cached_by_attributes(value):
+        return freeze_instance(value)
+    if isinstance(value, peewee.Model) and value.get_id() is not None:
+        return type(value), value.get_id()
+    hash(value)
+    if type(value).__hash__ is object.__hash__ and not isinstance(value, type):
+        try:
+            return weakref.ref(value)
+        except TypeError:  # the object does not support weak references
+            return value
+    return value
+
+
+def freeze_instance(instance: typing.Any) -> typing.Hashable:
+    """
+    Args:
+        instance: An instance that is identified by its attributes, e.g., an analysis or a preview
+
+    Returns:
+        The class of the instance together with its attributes.
+        Attributes that cannot be frozen are identified by their identity.
+    """
+    attributes = []
+    for name, attribute in sorted(vars(instance).items()):
+        try:
+            attributes.append((name, freeze(attribute)))
+        except TypeError:
+            attributes.append((name, id(attribute)))
+    return type(instance), tuple(attributes)
+
+
+def get_memory_key(
+        func: typing.Callable,
+        args: typing.Tuple[typing.Any, ...],
+        kwargs: typing.Dict[str, typing.Any]
+) -> typing.Hashable:
+    """
+    Args:
+        func: The function that is decorated
+        args: The positional arguments, possibly starting with the instance the function is bound to
+        kwargs: The keyword arguments
+
+    Returns:
+        The key of the result in memory.
+        The arguments are frozen so that the key does not keep them alive, and only as a last resort their
+        representation is used.
+    """
+    keyword_arguments = tuple(sorted(kwargs.items())) if kwargs else ()
+    try:
+        key = (func, freeze(args), freeze(keyword_arguments))
+        hash(key)
+        return key
+    except TypeError:
+        return func, repr(args), repr(kwargs)
+
+
+def canonicalize(value: typing.Any) -> str:
+    """
+    Args:
+        value: An argument of a data summary function
+
+    Returns:
+        A representation of the value that does not depend on memory addresses or on the order of sets and dicts.
+
+    Raises:
+        NotCanonicalizableException: If the value is of a type that has no stable representation.
+    """
+    if isinstance(value, enum.Enum):
+        return f"{type(value).__qualname__}.{value.name}"
+    if isinstance(value, _PRIMITIVE_TYPES + _TIME_TYPES):
+        return repr(value)
+    if isinstance(value, type):
+        return get_function_identifier(value)
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__ + "(" + ",".join(canonicalize(element) for element in value) + ")"
+    if isinstance(value, (set, frozenset)):
+        return type(value).__name__ + "(" + ",".join(sorted(canonicalize(element) for element in value)) + ")"
+    if isinstance(value, dict):
+        return "dict(" + ",".join(sorted(
+            canonicalize(key) + ":" + canonicalize(element) for key, element in value.items()
+        )) + ")"
+    if is_cached_by_attributes(value):
+        return canonicalize_instance(value)
+    raise NotCanonicalizableException(f"No stable representation for {type(value)}")
+
+
+def canonicalize_instance(instance: typing.Any) -> str:
+    """
+    Args:
+        instance: The object a data summary method is bound to, e.g., an analysis
+
+    Returns:
+        The class of the instance and all of its attributes that can be canonicalized, e.g., the transportation
+        buffer or a nested preview. Other attributes such as repositories or loggers are skipped.
+    """
+    attributes = []
+    for name, attribute in sorted(vars(instance).items()):
+        try:
+            attributes.append(name + "=" + canonicalize(attribute))
+        except NotCanonicalizableException:
+            continue
+    return get_function_identifier(type(instance)) + "(" + ",".join(attributes) + ")"
+
+
+def canonicalize_arguments(
+        func: typing.Callable,
+        args: typing.Sequence[typing.Any],
+        kwargs: typing.Dict[str, typing.Any]
+) -> str:
+    """
+    Args:
+        func: The decorated function
+        args: The positional arguments, possibly starting with the instance the function is bound to
+        kwargs: The keyword arguments
+
+    Returns:
+        The canonical representation of all arguments.
+
+    Raises:
+        NotCanonicalizableException: If any of the arguments has no stable representation.
+    """
+    canonical_args = []
+    for position, argument in enumerate(args):
+        if is_bound_instance(func, position, argument):
+            canonical_args.append(canonicalize_instance(argument))
+        else:
+            canonical_args.append(canonicalize(argument))
+    return "(" + ",".join(canonical_args) + ")" + canonicalize(kwargs)
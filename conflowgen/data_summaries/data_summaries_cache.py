@@ -1,6 +1,56 @@
 # Decorator class for preview and analysis result caching
+from __future__ import annotations
+
+import collections
+import sys
+import time
+import typing
 from functools import wraps
 
+from conflowgen.data_summaries.cache_key import NotCanonicalizableException, canonicalize_arguments, \
+    get_function_identifier, get_memory_key
+from conflowgen.data_summaries.persistent_data_summaries_cache import PersistentDataSummariesCache
+
+
+class DataSummariesCacheStatistics(typing.NamedTuple):
+    """
+    Describes how well the cache works for a single function.
+    """
+
+    #: How often the result was taken from the cache (including results loaded from the SQLite database)
+    hits: int
+
+    #: How often the result had to be computed
+    misses: int
+
+    #: The total time spent on computing the results in seconds
+    compute_time_in_seconds: float
+
+
+def estimate_size_in_bytes(value: typing.Any, _depth: int = 0) -> int:
+    """
+    Args:
+        value: A cached result
+
+    Returns:
+        An estimation of the memory the value occupies, including the values it contains.
+    """
+    if callable(getattr(value, "memory_usage", None)):  # pandas data frames and series
+        memory_usage = value.memory_usage(deep=True)
+        return int(memory_usage.sum()) if hasattr(memory_usage, "sum") else int(memory_usage)
+    if hasattr(value, "nbytes"):  # numpy arrays
+        return int(value.nbytes)
+    size = sys.getsizeof(value)
+    if _depth < 10:
+        if isinstance(value, dict):
+            size += sum(
+                estimate_size_in_bytes(key, _depth + 1) + estimate_size_in_bytes(element, _depth + 1)
+                for key, element in value.items()
+            )
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            size += sum(estimate_size_in_bytes(element, _depth + 1) for element in value)
+    return size
+
 
 class DataSummariesCache:
     """
@@ -13,48 +63,242 @@ class DataSummariesCache:
     decorator.
     The cache is automatically reset when input data changes or a new database is used. This can also be done manually
     by calling :meth:`.DataSummariesCache.reset_cache`.
+
+    Optionally, the results can also be persisted in the SQLite database, see
+    :meth:`.DataSummariesCache.enable_persistent_cache`.
+
+    The number of cached results and the memory they occupy can be limited with
+    :meth:`.DataSummariesCache.set_limits`.
+    If a limit is exceeded, the least recently used results are evicted first.
+    How well the cache works for each function is reported by :meth:`.DataSummariesCache.get_statistics`.
+    Functions can be excluded from caching with :meth:`.DataSummariesCache.exclude_function`.
     """
 
-    cached_results = {}
+    cached_results: typing.OrderedDict[typing.Hashable, typing.Any] = collections.OrderedDict()
     _hit_counter = {}  # For internal testing purposes
+    persistent_cache_enabled = False
+
+    #: The maximum number of cached results, unlimited if :obj:`None`
+    max_entries: typing.Optional[int] = 10_000
+
+    #: The maximum memory the cached results may occupy in bytes, unlimited if :obj:`None`
+    max_memory_in_bytes: typing.Optional[int] = None
+
+    _size_of_cached_results: typing.Dict[typing.Hashable, int] = {}
+    _total_size_of_cached_results = 0
+    _statistics: typing.Dict[str, DataSummariesCacheStatistics] = {}
+    _excluded_functions: typing.Set[str] = set()
 
     # Decorator function to accept function as argument, and return cached result if available or compute and cache
     # result
     @classmethod
-    def cache_result(cls, func):
+    def cache_result(cls, func: typing.Optional[typing.Callable] = None, *, persist: bool = True):
         """
         Decorator function to accept function as argument, and return cached result if available or compute and cache
         result.
+
+        Args:
+            func: The decorated function
+            persist: Whether the results may be persisted in the SQLite database if the persistent cache is enabled.
+                Use ``@DataSummariesCache.cache_result(persist=False)`` for large intermediate results, e.g., a copy
+                of the container table, that would only inflate the database.
         """
+        if func is None:
+            return lambda decorated_function: cls.cache_result(decorated_function, persist=persist)
+
+        function_identifier = get_function_identifier(func)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Create key from function id, name and arguments
-            key = str(id(func)) + repr(args) + repr(kwargs)
-
             # Adjust hit counter
             function_name = func.__name__
             if function_name not in cls._hit_counter:
                 cls._hit_counter[function_name] = 0
             cls._hit_counter[function_name] += 1
 
+            if function_identifier in cls._excluded_functions:
+                return cls._compute(function_identifier, func, args, kwargs)
+
+            # Create key from function and arguments
+            key = get_memory_key(func, args, kwargs)
+
             # Check if key exists in cache
             if key in cls.cached_results:
+                cls.cached_results.move_to_end(key)
+                cls._record(function_identifier, hits=1)
                 return cls.cached_results[key]
 
+            # If not, check whether the result has been persisted before
+            persistent_key = None
+            if persist and cls.persistent_cache_enabled and PersistentDataSummariesCache.is_available():
+                try:
+                    persistent_key = (function_identifier, canonicalize_arguments(func, args, kwargs))
+                except NotCanonicalizableException:
+                    persistent_key = None
+            if persistent_key is not None:
+                is_persisted, result = PersistentDataSummariesCache.load(*persistent_key)
+                if is_persisted:
+                    cls._record(function_identifier, hits=1)
+                    cls._add(key, result)
+                    return result
+
             # If not, compute result
-            result = func(*args, **kwargs)
+            result = cls._compute(function_identifier, func, args, kwargs)
 
             # Cache new result
-            cls.cached_results[key] = result
+            cls._add(key, result)
+            if persistent_key is not None:
+                PersistentDataSummariesCache.store(*persistent_key, result)
             return result
 
         return wrapper
 
+    @classmethod
+    def _compute(cls, function_identifier: str, func: typing.Callable, args, kwargs) -> typing.Any:
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        cls._record(function_identifier, misses=1, compute_time_in_seconds=time.perf_counter() - start)
+        return result
+
+    @classmethod
+    def _record(cls, function_identifier: str, hits: int = 0, misses: int = 0, compute_time_in_seconds: float = 0):
+        statistics = cls._statistics.get(function_identifier, DataSummariesCacheStatistics(0, 0, 0))
+        cls._statistics[function_identifier] = DataSummariesCacheStatistics(
+            hits=statistics.hits + hits,
+            misses=statistics.misses + misses,
+            compute_time_in_seconds=statistics.compute_time_in_seconds + compute_time_in_seconds
+        )
+
+    @classmethod
+    def _add(cls, key: typing.Hashable, result: typing.Any) -> None:
+        cls.cached_results[key] = result
+        if cls.max_memory_in_bytes is not None:
+            size = estimate_size_in_bytes(result)
+            cls._size_of_cached_results[key] = size
+            cls._total_size_of_cached_results += size
+        cls._evict()
+
+    @classmethod
+    def _remove(cls, key: typing.Hashable) -> None:
+        del cls.cached_results[key]
+        cls._total_size_of_cached_results -= cls._size_of_cached_results.pop(key, 0)
+
+    @classmethod
+    def _evict(cls) -> None:
+        while len(cls.cached_results) > 0 and (
+                (cls.max_entries is not None and len(cls.cached_results) > cls.max_entries)
+                or (cls.max_memory_in_bytes is not None
+                    and cls._total_size_of_cached_results > cls.max_memory_in_bytes)
+        ):
+            least_recently_used_key = next(iter(cls.cached_results))
+            cls._remove(least_recently_used_key)
+
+    @classmethod
+    def set_limits(
+            cls,
+            max_entries: typing.Optional[int] = 10_000,
+            max_memory_in_bytes: typing.Optional[int] = None
+    ) -> None:
+        """
+        Limits the size of the cache.
+        If a limit is exceeded, the least recently used results are evicted until the cache fits again.
+
+        Args:
+            max_entries: The maximum number of cached results, unlimited if :obj:`None`
+            max_memory_in_bytes: The maximum memory the cached results may occupy in bytes, unlimited if :obj:`None`.
+                As the memory of each result is only estimated, this is a rough limit.
+        """
+        assert max_entries is None or max_entries >= 0
+        assert max_memory_in_bytes is None or max_memory_in_bytes >= 0
+        cls.max_entries = max_entries
+        cls.max_memory_in_bytes = max_memory_in_bytes
+        cls._size_of_cached_results = {}
+        if max_memory_in_bytes is not None:
+            cls._size_of_cached_results = {
+                key: estimate_size_in_bytes(result)
+                for key, result in cls.cached_results.items()
+            }
+        cls._total_size_of_cached_results = sum(cls._size_of_cached_results.values())
+        cls._evict()
+
+    @classmethod
+    def get_statistics(cls) -> typing.Dict[str, DataSummariesCacheStatistics]:
+        """
+        Returns:
+            For each function that has been called, identified by its module and qualified name, how often the cached
+            result has been used, how often it had to be computed, and how long the computations took.
+            The statistics are kept when the cache is reset.
+        """
+        return dict(cls._statistics)
+
+    @classmethod
+    def reset_statistics(cls) -> None:
+        """
+        Resets the statistics reported by :meth:`.DataSummariesCache.get_statistics`.
+        """
+        cls._statistics = {}
+
+    @classmethod
+    def exclude_function(cls, func: typing.Union[typing.Callable, str]) -> None:
+        """
+        Results of the function are not cached anymore, e.g., because they are too large or only used once.
+
+        Args:
+            func: The decorated function or its module and qualified name
+        """
+        function_identifier = func if isinstance(func, str) else get_function_identifier(func)
+        cls._excluded_functions.add(function_identifier)
+        if not isinstance(func, str):
+            wrapped_function = getattr(func, "__wrapped__", func)
+            for key in [key for key in cls.cached_results if key[0] is wrapped_function]:
+                cls._remove(key)
+
+    @classmethod
+    def include_function(cls, func: typing.Union[typing.Callable, str]) -> None:
+        """
+        Results of a function that has been excluded with :meth:`.DataSummariesCache.exclude_function` are cached
+        again.
+
+        Args:
+            func: The decorated function or its module and qualified name
+        """
+        function_identifier = func if isinstance(func, str) else get_function_identifier(func)
+        cls._excluded_functions.discard(function_identifier)
+
     # Reset cache
     @classmethod
     def reset_cache(cls):
         """
         Resets the cache.
         """
-        cls.cached_results = {}
+        cls.cached_results = collections.OrderedDict()
+        cls._size_of_cached_results = {}
+        cls._total_size_of_cached_results = 0
         cls._hit_counter = {}
+        # The persisted results become outdated even if they are not persisted at the moment, e.g., because a new
+        # container flow is generated while the persistent cache is disabled
+        if cls.persistent_cache_enabled:
+            is_persisted = PersistentDataSummariesCache.is_available()
+        else:
+            is_persisted = PersistentDataSummariesCache.has_tables()
+        if is_persisted:
+            PersistentDataSummariesCache.increase_content_version()
+
+    @classmethod
+    def enable_persistent_cache(cls):
+        """
+        Additionally persists the results in the currently opened SQLite database so that they can be reused by
+        other processes, e.g., when a notebook is restarted, as long as the data does not change.
+        Only results of functions whose arguments have a stable representation (such as numbers, dates, and enum
+        values) are persisted.
+        As the results are stored with :mod:`pickle`, only enable this for databases from trusted sources.
+        """
+        cls.persistent_cache_enabled = True
+
+    @classmethod
+    def disable_persistent_cache(cls):
+        """
+        Stops loading results from and storing results in the SQLite database.
+        Results that have already been persisted are kept, but they are still invalidated whenever the cache is reset.
+        """
+        cls.persistent_cache_enabled = False
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import logging
+import pickle
+import typing
+
+from conflowgen.application.models.data_summaries_cache_entry import DataSummariesCacheEntry, \
+    DataSummariesContentVersion
+from conflowgen.domain_models.base_model import database_proxy
+from conflowgen.metadata import __version__
+
+
+class PersistentDataSummariesCache:
+    """
+    Persists the results of data summaries in two side tables of the currently opened SQLite database.
+    Each result is stored together with the content version of the database.
+    The content version is increased whenever the :class:`.DataSummariesCache` is reset while a database is opened,
+    i.e., whenever input distributions are set or a container flow is generated.
+    Results of an older content version are never returned.
+    Results computed by another ConFlowGen version are removed when the database is opened because the data
+    summaries might have changed in between.
+
+    The results are stored with :mod:`pickle`, so only open databases from trusted sources while this cache is
+    enabled.
+    """
+
+    logger = logging.getLogger("conflowgen")
+
+    #: The database for which the side tables have been created last
+    _database_with_tables = None
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """
+        Returns:
+            Whether a database is opened so that results can be loaded from it and stored in it.
+        """
+        database = database_proxy.obj
+        if database is None or database.is_closed():
+            return False
+        if cls._database_with_tables is not database:
+            database.create_tables([DataSummariesContentVersion, DataSummariesCacheEntry], safe=True)
+            cls._remove_results_of_other_versions()
+            cls._database_with_tables = database
+        return True
+
+    @classmethod
+    def has_tables(cls) -> bool:
+        """
+        Returns:
+            Whether the side tables exist in the currently opened database, independent of whether results are
+            persisted at the moment.
+        """
+        database = database_proxy.obj
+        if database is None or database.is_closed():
+            return False
+        return cls._database_with_tables is database or database.table_exists(DataSummariesContentVersion)
+
+    @classmethod
+    def _remove_results_of_other_versions(cls) -> None:
+        with database_proxy.atomic():
+            content_version = DataSummariesContentVersion.get_or_none()
+            if content_version is not None and content_version.conflowgen_version == __version__:
+                return
+            DataSummariesCacheEntry.delete().execute()
+            if content_version is None:
+                DataSummariesContentVersion.create()
+            else:
+                content_version.conflowgen_version = __version__
+                content_version.save()
+
+    @classmethod
+    def get_content_version(cls) -> int:
+        content_version = DataSummariesContentVersion.get_or_none()
+        if content_version is None:
+            return 0
+        return content_version.version
+
+    @classmethod
+    def increase_content_version(cls) -> None:
+        """
+        Marks all persisted results as outdated and removes them.
+        """
+        with database_proxy.atomic():
+            content_version = DataSummariesContentVersion.get_or_none()
+            if content_version is None:
+                content_version = DataSummariesContentVersion.create()
+            content_version.version += 1
+            content_version.save()
+            DataSummariesCacheEntry.delete().where(
+                DataSummariesCacheEntry.content_version < content_version.version
+            ).execute()
+
+    @classmethod
+    def load(cls, function: str, arguments: str) -> typing.Tuple[bool, typing.Any]:
+        """
+        Args:
+            function: The stable identifier of the function
+            arguments: The canonical representation of the arguments
+
+        Returns:
+            Whether a result of the current content version exists and, if so, the result.
+        """
+        entry = DataSummariesCacheEntry.get_or_none(
+            (DataSummariesCacheEntry.function == function)
+            & (DataSummariesCacheEntry.arguments == arguments)
+            & (DataSummariesCacheEntry.content_version == cls.get_content_version())
+        )
+        if entry is None:
+            return False, None
+        return True, pickle.loads(entry.result)
+
+    @classmethod
+    def store(cls, function: str, arguments: str, result: typing.Any) -> None:
+        """
+        Args:
+            function: The stable identifier of the function
+            arguments: The canonical representation of the arguments
+            result: The result to persist. If it cannot be pickled, it is not persisted.
+        """
+        try:
+            pickled_result = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            cls.logger.debug(f"The result of {function} cannot be persisted: {error}")
+            return
+        DataSummariesCacheEntry.insert(
+            function=function,
+            arguments=arguments,
+            content_version=cls.get_content_version(),
+            result=pickled_result
+        ).on_conflict_replace().execute()
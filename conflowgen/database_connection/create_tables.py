@@ -1,8 +1,12 @@
+import contextlib
 import logging
+import typing
 
 import peewee
 
 from conflowgen.application.models.container_flow_generation_properties import ContainerFlowGenerationProperties
+from conflowgen.application.models.data_summaries_cache_entry import DataSummariesCacheEntry, \
+    DataSummariesContentVersion
 from conflowgen.application.models.random_seed_store import RandomSeedStore
 from conflowgen.domain_models.arrival_information import TruckArrivalInformationForPickup, \
     TruckArrivalInformationForDelivery
@@ -19,6 +23,17 @@ from conflowgen.domain_models.vehicle import DeepSeaVessel, Feeder, LargeSchedul
 
 logger = logging.getLogger("conflowgen")
 
+# The foreign keys of the container table are already indexed by peewee. These additional indexes are not declared in
+# the Meta class of the model so that they can be dropped while the container flow is bulk loaded and created again
+# afterwards.
+CONTAINER_SECONDARY_INDEXES = {
+    "container_delivered_by_picked_up_by": (Container.delivered_by, Container.picked_up_by),
+    "container_picked_up_by": (Container.picked_up_by, ),
+    "container_storage_requirement": (Container.storage_requirement, ),
+    "container_cached_arrival_time": (Container.cached_arrival_time, ),
+    "container_cached_departure_time": (Container.cached_departure_time, ),
+}
+
 
 def create_tables(sql_db_connection: peewee.Database) -> peewee.Database:
     logger.debug("Creating all tables...")
@@ -43,9 +58,45 @@ def create_tables(sql_db_connection: peewee.Database) -> peewee.Database:
         StorageRequirementDistribution,
         ContainerDwellTimeDistribution,
         RandomSeedStore,
+        DataSummariesContentVersion,
+        DataSummariesCacheEntry,
     ])
     for table_with_index in (
         Destination,
     ):
         table_with_index.initialize_index()
+    create_secondary_indexes(sql_db_connection)
     return sql_db_connection
+
+
+def create_secondary_indexes(sql_db_connection: peewee.Database) -> None:
+    """
+    Creates the secondary indexes of the container table unless they exist already. This is also used to add the
+    indexes to databases that have been created with a previous version.
+    """
+    logger.debug("Creating secondary indexes...")
+    for index_name, fields in CONTAINER_SECONDARY_INDEXES.items():
+        sql_db_connection.execute(Container.index(*fields, name=index_name))
+
+
+def drop_secondary_indexes(sql_db_connection: peewee.Database) -> None:
+    """
+    Drops the secondary indexes of the container table so that inserting and updating many containers is faster.
+    """
+    logger.debug("Dropping secondary indexes...")
+    for index_name in CONTAINER_SECONDARY_INDEXES:
+        sql_db_connection.execute_sql(f'DROP INDEX IF EXISTS "{index_name}"')
+
+
+@contextlib.contextmanager
+def secondary_indexes_dropped(sql_db_connection: peewee.Database) -> typing.Iterator[None]:
+    """
+    Drops the secondary indexes of the container table while many containers are inserted or updated and creates them
+    again afterwards, even if an error occurs.
+    Queries that filter the containers should not run in between as they cannot use the indexes.
+    """
+    drop_secondary_indexes(sql_db_connection)
+    try:
+        yield
+    finally:
+        create_secondary_indexes(sql_db_connection)
@@ -8,7 +8,7 @@ from peewee import SqliteDatabase
 
 from conflowgen.application.models.container_flow_generation_properties import ContainerFlowGenerationProperties
 from conflowgen.application.repositories.random_seed_store_repository import get_initialised_random_object
-from conflowgen.database_connection.create_tables import create_tables
+from conflowgen.database_connection.create_tables import create_tables, create_secondary_indexes
 from conflowgen.domain_models.base_model import database_proxy
 from conflowgen.domain_models.container import Container
 from conflowgen.domain_models.distribution_seeders import seed_all_distributions
@@ -112,6 +112,7 @@ class SqliteDatabaseConnection:
             seed_all_distributions(**seeder_options)
         else:
             self.logger.debug(f"Open existing database at {self.path_to_sqlite_database}")
+            create_secondary_indexes(self.sqlite_db_connection)
 
         container_flow_properties: ContainerFlowGenerationProperties | None = \
             ContainerFlowGenerationProperties.get_or_none()
@@ -121,6 +121,27 @@ class UsedYardCapacityOverTime(typing.NamedTuple):
     containers: typing.Dict[datetime.datetime, int]
 
 
+class ContainerDwellTimeStatistics(typing.NamedTuple):
+    """
+    Summarizes the container dwell times, all expressed in hours.
+    """
+
+    #: The number of containers the statistics are based on
+    number_containers: int
+
+    #: The shortest container dwell time
+    minimum: float
+
+    #: The average container dwell time
+    average: float
+
+    #: The longest container dwell time
+    maximum: float
+
+    #: The sample standard deviation of the container dwell times, not set if there are less than two containers
+    standard_deviation: typing.Optional[float]
+
+
 class ContainersTransportedByTruck(typing.NamedTuple):
     """
     Represents the containers moved by trucks.
@@ -0,0 +1,76 @@
+"""
+Helpers to write many rows at once instead of issuing one SQL statement per row.
+"""
+from __future__ import annotations
+
+from typing import Sequence, Type
+
+from peewee import Case, Field, chunked
+
+from conflowgen.domain_models.base_model import BaseModel, database_proxy
+
+#: Older SQLite builds only allow 999 bound parameters per statement, so each batch is sized to stay below that.
+SQLITE_MAX_VARIABLE_NUMBER = 999
+
+
+def _get_batch_size(number_of_columns: int) -> int:
+    return max(1, SQLITE_MAX_VARIABLE_NUMBER // max(1, number_of_columns))
+
+
+def bulk_insert(model_list: Sequence[BaseModel]) -> None:
+    """
+    Inserts unsaved model instances of the same model class with multi-row INSERT statements inside one transaction.
+    Afterward, each instance carries the id it has been assigned by the database, just like after ``Model.create``.
+
+    SQLite assigns consecutive row ids to the rows of a single multi-row INSERT statement (no row is deleted
+    in-between), so the ids are derived from the id of the last inserted row of each batch.
+    """
+    if not model_list:
+        return
+    model_class: Type[BaseModel] = type(model_list[0])
+    meta = model_class._meta  # pylint: disable=protected-access
+    primary_key = meta.primary_key
+    fields = [
+        field for field_name, field in meta.fields.items()
+        if not (meta.auto_increment and field_name == primary_key.name)
+    ]
+    attributes = [field.name for field in fields]
+    batch_size = _get_batch_size(len(fields))
+    with database_proxy.atomic():
+        for batch in chunked(model_list, batch_size):
+            rows = [[model.__data__.get(attribute) for attribute in attributes] for model in batch]
+            last_id = model_class.insert_many(rows, fields=fields).execute()
+            if meta.auto_increment:
+                first_id = last_id - len(batch) + 1
+                for offset, model in enumerate(batch):
+                    setattr(model, primary_key.name, first_id + offset)
+            for model in batch:
+                model._dirty.clear()  # pylint: disable=protected-access
+
+
+def bulk_update(model_list: Sequence[BaseModel], fields: Sequence[Field]) -> None:
+    """
+    Writes the given fields of already saved model instances of the same model class back to the database.
+    Each batch is written with a single UPDATE statement that picks the new value for each row with a CASE expression.
+    The values are taken as they are stored in the instances so that no foreign key is lazily loaded.
+    """
+    if not model_list:
+        return
+    model_class: Type[BaseModel] = type(model_list[0])
+    meta = model_class._meta  # pylint: disable=protected-access
+    primary_key = meta.primary_key
+    # Each field needs two parameters per row (id and value) and the WHERE clause needs one more parameter per row.
+    batch_size = _get_batch_size(2 * len(fields) + 1)
+    with database_proxy.atomic():
+        for batch in chunked(model_list, batch_size):
+            ids = [model.get_id() for model in batch]
+            update = {
+                field: Case(primary_key, [
+                    (model_id, field.db_value(model.__data__.get(field.name)))
+                    for model_id, model in zip(ids, batch)
+                ])
+                for field in fields
+            }
+            model_class.update(update).where(primary_key.in_(ids)).execute()
+            for model in batch:
+                model._dirty.difference_update(field.name for field in fields)  # pylint: disable=protected-access
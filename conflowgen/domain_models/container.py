@@ -105,12 +105,14 @@ class Container(BaseModel):
     cached_arrival_time: datetime.datetime = DateTimeField(
         default=None,
         null=True,
-        help_text="This field is used to cache the arrival time for faster evaluation of analyses."
+        help_text="This field is used to cache the arrival time for faster evaluation of analyses. It is set for all "
+                  "containers at the end of the container flow generation."
     )
     cached_departure_time: datetime.datetime = DateTimeField(
         default=None,
         null=True,
-        help_text="This field is used to cache the departure time for faster evaluation of analyses."
+        help_text="This field is used to cache the departure time for faster evaluation of analyses. It is set for all "
+                  "containers at the end of the container flow generation."
     )
 
     @property
@@ -149,7 +151,6 @@ class Container(BaseModel):
             raise FaultyDataException(f"Faulty data: {self}")
 
         self.cached_arrival_time = container_arrival_time
-        self.save()
         return container_arrival_time
 
     def get_departure_time(self) -> datetime.datetime:
@@ -172,7 +173,6 @@ class Container(BaseModel):
             raise NoPickupVehicleException(self, self.picked_up_by)
 
         self.cached_departure_time = container_departure_time
-        self.save()
         return container_departure_time
 
     def __repr__(self):
@@ -6,6 +6,7 @@ import typing
 from typing import Dict, MutableSequence, Sequence, Type
 
 from conflowgen.application.services.vehicle_capacity_manager import VehicleCapacityManager
+from conflowgen.domain_models.bulk_operations import bulk_insert
 from conflowgen.domain_models.container import Container
 from conflowgen.domain_models.distribution_repositories.container_length_distribution_repository import \
     ContainerLengthDistributionRepository
@@ -61,6 +62,7 @@ class ContainerFactory:
     ) -> Sequence[Container]:
         """
         Creates all containers a large vehicle delivers to a terminal.
+        The containers are first drawn in memory and then written to the database in bulk.
         """
 
         self.vehicle_capacity_manager.reset_cache()
@@ -81,7 +83,7 @@ class ContainerFactory:
         self._load_distribution_approximators(maximum_number_of_containers, delivered_by)
 
         while free_capacity_in_teu > self.ignored_capacity:
-            container = self._create_single_container_for_large_scheduled_vehicle(
+            container = self._draw_single_container_for_large_scheduled_vehicle(
                 delivered_by_large_scheduled_vehicle_as_subtype=large_scheduled_vehicle_as_subtype
             )
             created_containers.append(container)
@@ -98,6 +100,8 @@ class ContainerFactory:
                 large_scheduled_vehicle_as_subtype
             )
 
+        bulk_insert(created_containers)
+
         free_capacity = self.vehicle_capacity_manager.get_free_capacity_for_inbound_journey(
             large_scheduled_vehicle_as_subtype
         )
@@ -138,11 +142,11 @@ class ContainerFactory:
                 weight = 4
         return weight
 
-    def _create_single_container_for_large_scheduled_vehicle(
+    def _draw_single_container_for_large_scheduled_vehicle(
             self,
             delivered_by_large_scheduled_vehicle_as_subtype: Type[AbstractLargeScheduledVehicle]
     ) -> Container:
-        """Creates a generic single container delivered by a specific large scheduled vehicle"""
+        """Draws a generic single container delivered by a specific large scheduled vehicle without saving it"""
 
         delivered_by = delivered_by_large_scheduled_vehicle_as_subtype.get_mode_of_transport()
         delivered_by_large_scheduled_vehicle = \
@@ -152,7 +156,7 @@ class ContainerFactory:
 
         picked_up_by = self.distribution_approximators["picked_up_by"].sample()
 
-        container = Container.create(
+        container = Container(
             weight=weight,
             length=length,
             storage_requirement=storage_requirement,
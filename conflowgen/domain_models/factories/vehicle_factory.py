@@ -3,10 +3,12 @@ The VehicleFactory including its exceptions.
 """
 import datetime
 import uuid
-from typing import Union, Optional
+from typing import List, Union, Optional, Sequence
 
 from conflowgen.domain_models.arrival_information import \
     TruckArrivalInformationForDelivery, TruckArrivalInformationForPickup
+from conflowgen.domain_models.base_model import database_proxy
+from conflowgen.domain_models.bulk_operations import bulk_insert
 from conflowgen.domain_models.large_vehicle_schedule import Schedule
 from conflowgen.domain_models.vehicle import DeepSeaVessel, Feeder, LargeScheduledVehicle, Train, Truck, Barge
 
@@ -75,6 +77,57 @@ class VehicleFactory:
         )
         return truck
 
+    @staticmethod
+    def create_trucks(
+            delivers_container: bool,
+            picks_up_container: bool,
+            truck_arrival_information_for_delivery: Optional[Sequence[TruckArrivalInformationForDelivery]] = None,
+            truck_arrival_information_for_pickup: Optional[Sequence[TruckArrivalInformationForPickup]] = None
+    ) -> List[Truck]:
+        """Works like :meth:`create_truck` but creates many trucks at once. The arrival information which has not been
+        saved yet is inserted together with the trucks in bulk. The returned trucks are in the same order as the
+        arrival information and carry the ids assigned by the database."""
+
+        if (not delivers_container) and (not picks_up_container):
+            raise UnnecessaryVehicleException(
+                "These trucks neither deliver nor pick up a container, thus they don't need to be generated")
+        if delivers_container and (
+                truck_arrival_information_for_delivery is None or None in truck_arrival_information_for_delivery):
+            raise MissingInformationException("Information regarding the truck arrival for delivery is missing.")
+        if picks_up_container and (
+                truck_arrival_information_for_pickup is None or None in truck_arrival_information_for_pickup):
+            raise MissingInformationException("Information regarding the truck arrival for pickup is missing.")
+
+        number_trucks = len(
+            truck_arrival_information_for_delivery if delivers_container else truck_arrival_information_for_pickup
+        )
+        if truck_arrival_information_for_delivery is None:
+            truck_arrival_information_for_delivery = [None] * number_trucks
+        if truck_arrival_information_for_pickup is None:
+            truck_arrival_information_for_pickup = [None] * number_trucks
+        if len(truck_arrival_information_for_delivery) != len(truck_arrival_information_for_pickup):
+            raise MissingInformationException("The arrival information for delivery and pickup do not match in size.")
+
+        with database_proxy.atomic():
+            for arrival_information in (truck_arrival_information_for_delivery, truck_arrival_information_for_pickup):
+                bulk_insert([
+                    information for information in arrival_information
+                    if information is not None and information.id is None
+                ])
+            trucks = [
+                Truck(
+                    delivers_container=delivers_container,
+                    picks_up_container=picks_up_container,
+                    truck_arrival_information_for_delivery=information_for_delivery,
+                    truck_arrival_information_for_pickup=information_for_pickup
+                )
+                for information_for_delivery, information_for_pickup in zip(
+                    truck_arrival_information_for_delivery, truck_arrival_information_for_pickup
+                )
+            ]
+            bulk_insert(trucks)
+        return trucks
+
     def _create_large_vehicle(
             self,
             capacity_in_teu: int,
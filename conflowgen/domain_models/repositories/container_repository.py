@@ -0,0 +1,81 @@
+from peewee import Function, fn
+
+from conflowgen.domain_models.arrival_information import TruckArrivalInformationForDelivery, \
+    TruckArrivalInformationForPickup
+from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.vehicle import LargeScheduledVehicle, Truck
+
+
+class ContainerRepository:
+
+    @staticmethod
+    def get_arrival_time_expression() -> Function:
+        """
+        Returns:
+            An SQL expression that looks up the arrival time of a container at the vehicle that delivers it.
+        """
+        arrival_time_by_truck = TruckArrivalInformationForDelivery.select(
+            TruckArrivalInformationForDelivery.realized_container_delivery_time
+        ).join(
+            Truck, on=(Truck.truck_arrival_information_for_delivery == TruckArrivalInformationForDelivery.id)
+        ).where(
+            Truck.id == Container.delivered_by_truck
+        )
+        arrival_time_by_large_scheduled_vehicle = LargeScheduledVehicle.select(
+            LargeScheduledVehicle.scheduled_arrival
+        ).where(
+            LargeScheduledVehicle.id == Container.delivered_by_large_scheduled_vehicle
+        )
+        return fn.COALESCE(arrival_time_by_truck, arrival_time_by_large_scheduled_vehicle)
+
+    @staticmethod
+    def get_departure_time_expression() -> Function:
+        """
+        Returns:
+            An SQL expression that looks up the departure time of a container at the vehicle that picks it up.
+        """
+        departure_time_by_truck = TruckArrivalInformationForPickup.select(
+            TruckArrivalInformationForPickup.realized_container_pickup_time
+        ).join(
+            Truck, on=(Truck.truck_arrival_information_for_pickup == TruckArrivalInformationForPickup.id)
+        ).where(
+            Truck.id == Container.picked_up_by_truck
+        )
+        departure_time_by_large_scheduled_vehicle = LargeScheduledVehicle.select(
+            LargeScheduledVehicle.scheduled_arrival
+        ).where(
+            LargeScheduledVehicle.id == Container.picked_up_by_large_scheduled_vehicle
+        )
+        return fn.COALESCE(departure_time_by_truck, departure_time_by_large_scheduled_vehicle)
+
+    @classmethod
+    def get_cached_arrival_time_expression(cls) -> Function:
+        """
+        Returns:
+            An SQL expression for the arrival time of a container that prefers :attr:`Container.cached_arrival_time`
+            and only looks up the arrival time at the vehicle if it has not been materialized.
+        """
+        return fn.COALESCE(Container.cached_arrival_time, cls.get_arrival_time_expression())
+
+    @classmethod
+    def get_cached_departure_time_expression(cls) -> Function:
+        """
+        Returns:
+            An SQL expression for the departure time of a container that prefers
+            :attr:`Container.cached_departure_time` and only looks up the departure time at the vehicle if it has not
+            been materialized.
+        """
+        return fn.COALESCE(Container.cached_departure_time, cls.get_departure_time_expression())
+
+    @classmethod
+    def materialize_cached_times(cls) -> None:
+        """
+        Sets :attr:`Container.cached_arrival_time` and :attr:`Container.cached_departure_time` for all containers
+        with a single set-based UPDATE statement. The times are looked up at the vehicles the containers are delivered
+        by and picked up by.
+        This way, analyses can read the times directly from the container table.
+        """
+        Container.update(
+            cached_arrival_time=cls.get_arrival_time_expression(),
+            cached_departure_time=cls.get_departure_time_expression(),
+        ).execute()
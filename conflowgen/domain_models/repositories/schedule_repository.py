@@ -1,6 +1,8 @@
+from __future__ import annotations
+
 import datetime
 import typing
-from typing import List, Type
+from typing import Dict, List, Tuple, Type
 import logging
 
 from conflowgen.application.services.vehicle_capacity_manager import VehicleCapacityManager
@@ -9,6 +11,7 @@ from conflowgen.domain_models.container import Container
 from conflowgen.domain_models.data_types.container_length import ContainerLength
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
 from conflowgen.domain_models.repositories.large_scheduled_vehicle_repository import LargeScheduledVehicleRepository
+from conflowgen.domain_models.repositories.vehicle_departure_index import VehicleDepartureIndex
 from conflowgen.domain_models.vehicle import LargeScheduledVehicle, AbstractLargeScheduledVehicle
 
 
@@ -18,6 +21,52 @@ class ScheduleRepository:
         self.logger = logging.getLogger("conflowgen")
         self.large_scheduled_vehicle_repository = LargeScheduledVehicleRepository()
         self.vehicle_capacity_manager = VehicleCapacityManager()
+        self.departure_index: Dict[ModeOfTransport, VehicleDepartureIndex] | None = None
+        self.departure_index_by_flow_direction: Dict[
+            Tuple[ModeOfTransport, FlowDirection], VehicleDepartureIndex
+        ] = {}
+
+    def load_departure_index(self) -> None:
+        """Loads all vehicles that move according to a schedule into memory, sorted by their scheduled arrival for
+        each vehicle type. As long as the index is loaded, :meth:`get_departing_vehicles` looks up the vehicles by
+        bisection instead of querying the database. The index must be reset or reloaded whenever vehicles are added
+        or removed.
+
+        The capacity available for the outbound journey depends on the flow direction of the container, e.g., during
+        the ramp-up period transshipment containers only get a share of the capacity.
+        Thus, each flow direction works on its own copy of the index, and as soon as
+        :meth:`block_capacity_for_outbound_journey` reports that the capacity of a vehicle is exhausted for a flow
+        direction, that vehicle is dropped from the copy of that flow direction.
+        """
+        self.departure_index = {}
+        self.departure_index_by_flow_direction = {}
+        for vehicle_type in ModeOfTransport.get_scheduled_vehicles():
+            large_scheduled_vehicle_as_subtype = AbstractLargeScheduledVehicle.map_mode_of_transport_to_class(
+                vehicle_type
+            )
+            # Selecting the columns of LargeScheduledVehicle as well avoids lazy loading of each vehicle later on
+            vehicles = large_scheduled_vehicle_as_subtype.select(
+                large_scheduled_vehicle_as_subtype, LargeScheduledVehicle
+            ).join(
+                LargeScheduledVehicle
+            )
+            self.departure_index[vehicle_type] = VehicleDepartureIndex(vehicles)
+        self.logger.debug("Loaded departure index with "
+                          f"{sum(len(index) for index in self.departure_index.values())} vehicles")
+
+    def reset_departure_index(self) -> None:
+        self.departure_index = None
+        self.departure_index_by_flow_direction = {}
+
+    def _get_departure_index(
+            self,
+            vehicle_type: ModeOfTransport,
+            flow_direction: FlowDirection
+    ) -> VehicleDepartureIndex:
+        key = (vehicle_type, flow_direction)
+        if key not in self.departure_index_by_flow_direction:
+            self.departure_index_by_flow_direction[key] = self.departure_index[vehicle_type].copy()
+        return self.departure_index_by_flow_direction[key]
 
     def set_transportation_buffer(self, transportation_buffer: float):
         self.vehicle_capacity_manager.set_transportation_buffer(transportation_buffer)
@@ -44,16 +93,8 @@ class ScheduleRepository:
         """
         assert start <= end
 
-        # Get type, i.e. Feeder, DeepSeaVessel, etc.
-        large_scheduled_vehicle_as_subtype = AbstractLargeScheduledVehicle.map_mode_of_transport_to_class(
-            vehicle_type
-        )
-
         # Get all vehicles in the time range
-        vehicles = large_scheduled_vehicle_as_subtype.select().join(LargeScheduledVehicle).where(
-            (large_scheduled_vehicle_as_subtype.large_scheduled_vehicle.scheduled_arrival >= start)
-            & (large_scheduled_vehicle_as_subtype.large_scheduled_vehicle.scheduled_arrival <= end)
-        )
+        vehicles = self._get_vehicles_arriving_within(start, end, vehicle_type, flow_direction)
 
         # Check for each of the vehicles how much it has already loaded
         required_capacity_in_teu = ContainerLength.get_teu_factor(required_capacity)
@@ -74,14 +115,36 @@ class ScheduleRepository:
 
         return vehicles_with_sufficient_capacity
 
+    def _get_vehicles_arriving_within(
+            self,
+            start: datetime.datetime,
+            end: datetime.datetime,
+            vehicle_type: ModeOfTransport,
+            flow_direction: FlowDirection
+    ) -> typing.Iterable[Type[AbstractLargeScheduledVehicle]]:
+        if self.departure_index is not None:
+            return self._get_departure_index(vehicle_type, flow_direction).get_vehicles_arriving_within(start, end)
+
+        # Get type, i.e. Feeder, DeepSeaVessel, etc.
+        large_scheduled_vehicle_as_subtype = AbstractLargeScheduledVehicle.map_mode_of_transport_to_class(
+            vehicle_type
+        )
+        return large_scheduled_vehicle_as_subtype.select().join(LargeScheduledVehicle).where(
+            (large_scheduled_vehicle_as_subtype.large_scheduled_vehicle.scheduled_arrival >= start)
+            & (large_scheduled_vehicle_as_subtype.large_scheduled_vehicle.scheduled_arrival <= end)
+        )
+
     def block_capacity_for_outbound_journey(
             self,
             vehicle: Type[AbstractLargeScheduledVehicle],
             container: Container,
     ) -> bool:
-        """Updates the cache for faster execution
+        """Updates the cache for faster execution. Vehicles with exhausted capacity are dropped from the departure index.
         """
-        return self.vehicle_capacity_manager.block_capacity_for_outbound_journey(
+        vehicle_capacity_is_exhausted = self.vehicle_capacity_manager.block_capacity_for_outbound_journey(
             vehicle=vehicle,
             container=container
         )
+        if vehicle_capacity_is_exhausted and self.departure_index is not None:
+            self._get_departure_index(vehicle.get_mode_of_transport(), container.flow_direction).remove(vehicle)
+        return vehicle_capacity_is_exhausted
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import bisect
+import datetime
+from typing import Iterable, List, Type
+
+from conflowgen.domain_models.vehicle import AbstractLargeScheduledVehicle
+
+
+class VehicleDepartureIndex:
+    """
+    Keeps the vehicles of one vehicle type sorted by their scheduled arrival so that all vehicles arriving within a
+    time range are found by bisection.
+    Vehicles which cannot take any further containers are removed so that they are not scanned again.
+    """
+
+    def __init__(self, vehicles: Iterable[Type[AbstractLargeScheduledVehicle]]):
+        # noinspection PyUnresolvedReferences
+        self.vehicles: List[Type[AbstractLargeScheduledVehicle]] = sorted(
+            vehicles,
+            key=lambda vehicle: (vehicle.large_scheduled_vehicle.scheduled_arrival, vehicle.large_scheduled_vehicle.id)
+        )
+        # noinspection PyUnresolvedReferences
+        self.scheduled_arrivals: List[datetime.datetime] = [
+            vehicle.large_scheduled_vehicle.scheduled_arrival for vehicle in self.vehicles
+        ]
+
+    def __len__(self) -> int:
+        return len(self.vehicles)
+
+    def copy(self) -> VehicleDepartureIndex:
+        return VehicleDepartureIndex(self.vehicles)
+
+    def get_vehicles_arriving_within(
+            self,
+            start: datetime.datetime,
+            end: datetime.datetime
+    ) -> List[Type[AbstractLargeScheduledVehicle]]:
+        index_of_first_vehicle = bisect.bisect_left(self.scheduled_arrivals, start)
+        index_after_last_vehicle = bisect.bisect_right(self.scheduled_arrivals, end)
+        return self.vehicles[index_of_first_vehicle:index_after_last_vehicle]
+
+    def remove(self, vehicle: Type[AbstractLargeScheduledVehicle]) -> None:
+        """Removes the vehicle if it is still part of the index."""
+        # noinspection PyUnresolvedReferences
+        scheduled_arrival = vehicle.large_scheduled_vehicle.scheduled_arrival
+        index_of_first_vehicle = bisect.bisect_left(self.scheduled_arrivals, scheduled_arrival)
+        index_after_last_vehicle = bisect.bisect_right(self.scheduled_arrivals, scheduled_arrival)
+        for i in range(index_of_first_vehicle, index_after_last_vehicle):
+            if self.vehicles[i] == vehicle:
+                del self.vehicles[i]
+                del self.scheduled_arrivals[i]
+                return
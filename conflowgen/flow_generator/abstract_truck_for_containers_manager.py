@@ -1,9 +1,13 @@
 from __future__ import annotations
 import abc
+import datetime
+import collections
 import logging
 import math
 import typing
 
+import numpy as np
+
 from conflowgen.tools.weekly_distribution import WeeklyDistribution
 from ..application.repositories.random_seed_store_repository import get_initialised_random_object
 from ..domain_models.data_types.storage_requirement import StorageRequirement
@@ -26,10 +30,16 @@ class UnknownDistributionPropertyException(Exception):
 
 
 class AbstractTruckForContainersManager(abc.ABC):
+
+    #: The number of trucks that are written to the database together.
+    batch_size = 10000
+
     def __init__(self):
         self.logger = logging.getLogger("conflowgen")
 
         self.seeded_random = get_initialised_random_object(self.__class__.__name__)
+        # The vectorized sampling is derived from the same seed so that the results stay reproducible
+        self.seeded_numpy_random = np.random.default_rng(self.seeded_random.getrandbits(64))
 
         self.container_dwell_time_distribution_repository = ContainerDwellTimeDistributionRepository()
         self.container_dwell_time_distributions: \
@@ -50,6 +60,10 @@ class AbstractTruckForContainersManager(abc.ABC):
         self.vehicle_factory = VehicleFactory()
         self.time_window_length_in_hours: typing.Optional[int] = None
 
+        self.time_window_probabilities: typing.Dict[
+            typing.Tuple[ModeOfTransport, ModeOfTransport, StorageRequirement, int], typing.Tuple[np.ndarray, np.ndarray]
+        ] = {}
+
     @abc.abstractmethod
     def _get_container_dwell_time_distribution(
             self,
@@ -73,6 +87,7 @@ class AbstractTruckForContainersManager(abc.ABC):
 
         self.container_dwell_time_distributions = self.container_dwell_time_distribution_repository.get_distributions()
         self._update_truck_arrival_and_container_dwell_time_distributions(hour_of_the_week_fraction_pairs)
+        self.time_window_probabilities = {}
 
     def _update_truck_arrival_and_container_dwell_time_distributions(
             self,
@@ -118,16 +133,11 @@ class AbstractTruckForContainersManager(abc.ABC):
             StorageRequirement, WeeklyDistribution]:
         pass
 
-    def _get_time_window_of_truck_arrival(
+    def _get_time_window_probabilities(
             self,
             container_dwell_time_distribution: ContinuousDistribution,
-            truck_arrival_distribution_slice: typing.Dict[int, float],
-            _debug_check_distribution_property: typing.Optional[str] = None
-    ) -> int:
-        """
-        Returns:
-            Number of hours after the earliest possible slot
-        """
+            truck_arrival_distribution_slice: typing.Dict[int, float]
+    ) -> typing.Tuple[typing.List[int], typing.Sequence[float]]:
         time_windows_for_truck_arrival = list(truck_arrival_distribution_slice.keys())
 
         truck_arrival_probabilities = list(truck_arrival_distribution_slice.values())
@@ -144,6 +154,70 @@ class AbstractTruckForContainersManager(abc.ABC):
                 f"No truck slots available! {truck_arrival_probabilities} and {total_probabilities} just do not match."
             )
 
+        return time_windows_for_truck_arrival, total_probabilities
+
+    def _draw_time_windows_of_truck_arrivals(
+            self,
+            containers: typing.Sequence[Container],
+            starts_of_distribution_slices: typing.Sequence[datetime.datetime]
+    ) -> np.ndarray:
+        """
+        Draws the time window of the truck arrival for many containers at once. The probabilities only depend on the
+        vehicle types, the storage requirement, and the hour of the week the distribution slice starts at.
+        Thus, the containers are grouped by these properties and the time windows of each group are drawn in one go.
+
+        Returns:
+            Number of hours after the earliest possible slot for each container
+        """
+        container_indices_by_group = collections.defaultdict(list)
+        for i, (container, start) in enumerate(zip(containers, starts_of_distribution_slices)):
+            hour_of_the_week = WeeklyDistribution.get_hour_of_the_week(start)
+            group = (container.delivered_by, container.picked_up_by, container.storage_requirement, hour_of_the_week)
+            container_indices_by_group[group].append(i)
+
+        selected_time_windows = np.zeros(len(containers), dtype=np.int64)
+        for group, container_indices in container_indices_by_group.items():
+            if group not in self.time_window_probabilities:
+                first_container_index = container_indices[0]
+                container_dwell_time_distribution, truck_arrival_distribution = self._get_distributions(
+                    containers[first_container_index]
+                )
+                truck_arrival_distribution_slice = truck_arrival_distribution.get_distribution_slice(
+                    starts_of_distribution_slices[first_container_index]
+                )
+                time_windows, total_probabilities = self._get_time_window_probabilities(
+                    container_dwell_time_distribution, truck_arrival_distribution_slice
+                )
+                total_probabilities = np.array(total_probabilities, dtype=np.float64)
+                self.time_window_probabilities[group] = (
+                    np.array(time_windows, dtype=np.int64),
+                    total_probabilities / total_probabilities.sum()
+                )
+            time_windows, probabilities = self.time_window_probabilities[group]
+            selected_time_windows[container_indices] = self.seeded_numpy_random.choice(
+                time_windows, size=len(container_indices), p=probabilities
+            )
+        return selected_time_windows
+
+    def _draw_random_time_components(self, number_of_containers: int) -> np.ndarray:
+        """Draws the arrival within the selected time window for many containers at once."""
+        close_to_time_window_length = self.time_window_length_in_hours - (1 / 60)
+        return self.seeded_numpy_random.uniform(0, close_to_time_window_length, size=number_of_containers)
+
+    def _get_time_window_of_truck_arrival(
+            self,
+            container_dwell_time_distribution: ContinuousDistribution,
+            truck_arrival_distribution_slice: typing.Dict[int, float],
+            _debug_check_distribution_property: typing.Optional[str] = None
+    ) -> int:
+        """
+        Returns:
+            Number of hours after the earliest possible slot
+        """
+        time_windows_for_truck_arrival, total_probabilities = self._get_time_window_probabilities(
+            container_dwell_time_distribution, truck_arrival_distribution_slice
+        )
+
         selected_time_window: int
         if _debug_check_distribution_property:
             hours_with_arrivals = self._drop_where_zero(truck_arrival_distribution_slice, total_probabilities)
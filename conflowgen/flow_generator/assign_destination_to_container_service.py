@@ -6,6 +6,7 @@ import typing
 from peewee import fn
 
 from conflowgen.application.repositories.random_seed_store_repository import get_initialised_random_object
+from conflowgen.domain_models.bulk_operations import bulk_update
 from conflowgen.domain_models.container import Container
 from conflowgen.domain_models.distribution_repositories.container_destination_distribution_repository import \
     ContainerDestinationDistributionRepository
@@ -50,22 +51,25 @@ class AssignDestinationToContainerService:
             self.logger.debug(f"Assign destinations to containers that leave the terminal with the service "
                               f"'{schedule.service_name}' of the vehicle type {schedule.vehicle_type}, "
                               f"progress: {i+1} / {number_iterations} ({100*(i + 1)/number_iterations:.2f}%)")
-            containers_moving_according_to_schedule: typing.Iterable[Container] = Container.select().join(
+            containers_moving_according_to_schedule: typing.List[Container] = list(Container.select().join(
                 LargeScheduledVehicle, on=Container.picked_up_by_large_scheduled_vehicle
             ).where(
                 Container.picked_up_by_large_scheduled_vehicle.schedule == schedule
             ).order_by(
                 fn.assign_random_value(Container.id)
-            )
+            ))
             distribution_for_schedule = self.distribution[schedule]
             destinations = list(distribution_for_schedule.keys())
             frequency_of_destinations = list(distribution_for_schedule.values())
 
+            # Drawing all destinations at once consumes the random numbers in the same order as drawing them one by
+            # one, so the outcome does not change.
+            sampled_destinations = self.seeded_random.choices(
+                population=destinations,
+                weights=frequency_of_destinations,
+                k=len(containers_moving_according_to_schedule)
+            )
             container: Container
-            for container in containers_moving_according_to_schedule:
-                sampled_destination = self.seeded_random.choices(
-                    population=destinations,
-                    weights=frequency_of_destinations
-                )[0]
+            for container, sampled_destination in zip(containers_moving_according_to_schedule, sampled_destinations):
                 container.destination = sampled_destination
-                container.save()
+            bulk_update(containers_moving_according_to_schedule, [Container.destination])
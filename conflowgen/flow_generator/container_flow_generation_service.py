@@ -4,11 +4,14 @@ import logging
 from conflowgen.application.reports.container_flow_statistics_report import ContainerFlowStatisticsReport
 from conflowgen.application.repositories.container_flow_generation_properties_repository import \
     ContainerFlowGenerationPropertiesRepository
+from conflowgen.database_connection.create_tables import secondary_indexes_dropped
+from conflowgen.domain_models.base_model import database_proxy
 from conflowgen.flow_generator.assign_destination_to_container_service import \
     AssignDestinationToContainerService
 from conflowgen.flow_generator.large_scheduled_vehicle_creation_service import \
     LargeScheduledVehicleCreationService
 from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.repositories.container_repository import ContainerRepository
 from conflowgen.domain_models.vehicle import LargeScheduledVehicle, Truck
 from conflowgen.flow_generator.allocate_space_for_containers_delivered_by_truck_service import \
     AllocateSpaceForContainersDeliveredByTruckService
@@ -90,16 +93,13 @@ class ContainerFlowGenerationService:
     def container_flow_data_exists() -> bool:
         return len(Container.select().limit(1)) == 1
 
-    def generate(self):
-        self.logger.info("Resetting preview and analysis cache...")
-        DataSummariesCache.reset_cache()
-        self.logger.info("Remove previous data...")
-        self.clear_previous_container_flow()
+    def _generate_container_flow(self):
         self.logger.info("Reloading properties and distributions...")
         self._update_generation_properties_and_distributions()
 
         self.logger.info("Create fleet including their delivered containers for given time range for each schedule...")
-        self.large_scheduled_vehicle_creation_service.create()
+        with secondary_indexes_dropped(database_proxy):
+            self.large_scheduled_vehicle_creation_service.create()
 
         self.logger.info("Loading status of vehicles adhering to a schedule:")
         report = ContainerFlowStatisticsReport(transportation_buffer=self.transportation_buffer)
@@ -132,6 +132,21 @@ class ContainerFlowGenerationService:
         self.logger.info("Assign containers to next destinations...")
         self.assign_destination_to_container_service.assign()
 
+        self.logger.info("Store the arrival and departure time of each container...")
+        with secondary_indexes_dropped(database_proxy):
+            ContainerRepository.materialize_cached_times()
+
+    def generate(self):
+        self.logger.info("Resetting preview and analysis cache...")
+        DataSummariesCache.reset_cache()
+        self.logger.info("Remove previous data...")
+        self.clear_previous_container_flow()
+        try:
+            self._generate_container_flow()
+        finally:
+            # Some data summaries might have been cached while the container flow was still being generated
+            DataSummariesCache.reset_cache()
+
         self.logger.info("Container flow generation finished")
 
         self.logger.info("Final capacity status of vehicles adhering to a schedule:")
@@ -7,6 +7,7 @@ import logging
 
 from peewee import fn
 
+from conflowgen.domain_models.base_model import database_proxy
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
 from conflowgen.domain_models.factories.container_factory import ContainerFactory
 from conflowgen.domain_models.factories.fleet_factory import FleetFactory
@@ -58,12 +59,14 @@ class LargeScheduledVehicleCreationService:
                               f"'{schedule.vehicle_type}', "
                               f"progress: {i} / {number_schedules} ({i / number_schedules:.2%})")
 
-            # noinspection PyArgumentList,PyTypeChecker
-            vehicles: List[Type[AbstractLargeScheduledVehicle]] = self.fleet_creator[schedule.vehicle_type](
-                schedule=schedule,
-                latest_at=self.container_flow_end_date,
-                first_at=self.container_flow_start_date
-            )
+            # All vehicles of a schedule and the containers they deliver are written within one transaction
+            with database_proxy.atomic():
+                # noinspection PyArgumentList,PyTypeChecker
+                vehicles: List[Type[AbstractLargeScheduledVehicle]] = self.fleet_creator[schedule.vehicle_type](
+                    schedule=schedule,
+                    latest_at=self.container_flow_end_date,
+                    first_at=self.container_flow_start_date
+                )
 
-            for vehicle in vehicles:
-                self.container_factory.create_containers_for_large_scheduled_vehicle(vehicle)
+                for vehicle in vehicles:
+                    self.container_factory.create_containers_for_large_scheduled_vehicle(vehicle)
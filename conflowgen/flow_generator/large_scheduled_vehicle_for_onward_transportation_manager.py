@@ -13,6 +13,7 @@ from ..application.repositories.random_seed_store_repository import get_initiali
 from ..domain_models.data_types.container_length import ContainerLength
 from ..domain_models.data_types.storage_requirement import StorageRequirement
 from ..domain_models.arrival_information import TruckArrivalInformationForDelivery
+from ..domain_models.bulk_operations import bulk_update
 from ..domain_models.container import Container
 from ..domain_models.distribution_repositories.container_dwell_time_distribution_repository import \
     ContainerDwellTimeDistributionRepository
@@ -26,6 +27,9 @@ from ..tools.continuous_distribution import ContinuousDistribution, multiply_dis
 
 class LargeScheduledVehicleForOnwardTransportationManager:
 
+    #: The number of containers for which the assignment is kept in memory before it is written to the database.
+    write_buffer_size = 10000
+
     def __init__(self):
         self.seeded_random = get_initialised_random_object(self.__class__.__name__)
 
@@ -40,6 +44,9 @@ class LargeScheduledVehicleForOnwardTransportationManager:
             Dict[ModeOfTransport, Dict[ModeOfTransport, Dict[StorageRequirement, ContinuousDistribution]]] | None \
             = None
 
+        self.containers_to_update: Dict[int, Container] = {}
+        self.vehicles_with_exhausted_capacity: Dict[int, LargeScheduledVehicle] = {}
+
     def reload_properties(
             self,
             transportation_buffer: float,
@@ -70,12 +77,45 @@ class LargeScheduledVehicleForOnwardTransportationManager:
 
         This method might be quite time-consuming because it repeatedly checks how many containers are already placed
         on a vehicle to obey the load restriction (maximum capacity of the vehicle available for the terminal).
+        The departing vehicles are looked up in a departure index that is loaded once for the whole run.
+        The assignments are kept in a write buffer and are written to the database in bulk.
         """
+        self.vehicle_capacity_manager.reset_cache()
+        self.schedule_repository.load_departure_index()
+        try:
+            self._assign_departing_vehicles()
+            self._flush_write_buffer()
+        finally:
+            self.containers_to_update = {}
+            self.vehicles_with_exhausted_capacity = {}
+            self.schedule_repository.reset_departure_index()
+
+    def _flush_write_buffer(self) -> None:
+        """Writes all buffered container assignments and exhausted vehicles to the database."""
+        bulk_update(
+            list(self.containers_to_update.values()),
+            fields=[
+                Container.picked_up_by,
+                Container.picked_up_by_large_scheduled_vehicle,
+                Container.emergency_pickup,
+            ]
+        )
+        bulk_update(
+            list(self.vehicles_with_exhausted_capacity.values()),
+            fields=[LargeScheduledVehicle.capacity_exhausted_while_determining_onward_transportation]
+        )
+        self.containers_to_update = {}
+        self.vehicles_with_exhausted_capacity = {}
+
+    def _buffer_container_update(self, container: Container) -> None:
+        self.containers_to_update[container.id] = container
+        if len(self.containers_to_update) >= self.write_buffer_size:
+            self._flush_write_buffer()
+
+    def _assign_departing_vehicles(self) -> None:
         number_assigned_containers = 0
         number_not_assignable_containers = 0
 
-        self.vehicle_capacity_manager.reset_cache()
-
         self.logger.info("Assign containers to departing vehicles that move according to a schedule...")
 
         # Get all containers in a random order which are picked up by a LargeScheduledVehicle
@@ -184,11 +224,11 @@ class LargeScheduledVehicleForOnwardTransportationManager:
         vehicle_type = vehicle.get_mode_of_transport()
         container.picked_up_by_large_scheduled_vehicle = large_scheduled_vehicle
         container.picked_up_by = vehicle_type
-        container.save()
         vehicle_capacity_is_exhausted = self.schedule_repository.block_capacity_for_outbound_journey(vehicle, container)
         if vehicle_capacity_is_exhausted:
             large_scheduled_vehicle.capacity_exhausted_while_determining_onward_transportation = True
-            large_scheduled_vehicle.save()
+            self.vehicles_with_exhausted_capacity[large_scheduled_vehicle.id] = large_scheduled_vehicle
+        self._buffer_container_update(container)
 
     def _draw_vehicle(
             self,
@@ -283,7 +323,7 @@ class LargeScheduledVehicleForOnwardTransportationManager:
 
         # These are the default values if no suitable vehicle could be found in the next lines
         container.picked_up_by = ModeOfTransport.truck
-        container.save()
+        self._buffer_container_update(container)
 
         # get alternative vehicles
         vehicle_types_and_their_fraction = self.mode_of_transport_distribution[container.delivered_by].copy()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence
 
 from peewee import fn
 
@@ -9,6 +9,8 @@ from .abstract_truck_for_containers_manager import AbstractTruckForContainersMan
 from ..domain_models.data_types.container_length import ContainerLength
 from ..domain_models.data_types.storage_requirement import StorageRequirement
 from ..domain_models.arrival_information import TruckArrivalInformationForDelivery
+from ..domain_models.base_model import database_proxy
+from ..domain_models.bulk_operations import bulk_update
 from ..domain_models.container import Container
 from ..domain_models.data_types.mode_of_transport import ModeOfTransport
 from ..domain_models.vehicle import LargeScheduledVehicle
@@ -55,7 +57,6 @@ class TruckForExportContainersManager(AbstractTruckForContainersManager):
         """
 
         container_dwell_time_distribution, truck_arrival_distribution = self._get_distributions(container)
-        minimum_dwell_time_in_hours = container_dwell_time_distribution.minimum
         maximum_dwell_time_in_hours = container_dwell_time_distribution.maximum
 
         # Example: Given the container departs at 10:15, do not check for the hour that has already started.
@@ -89,6 +90,21 @@ class TruckForExportContainersManager(AbstractTruckForContainersManager):
             else:
                 raise UnknownDistributionPropertyException(f"Unknown: {_debug_check_distribution_property}")
 
+        return self._get_truck_arrival_time(
+            container, container_departure_time, delivery_time_window_start, random_time_component
+        )
+
+    def _get_truck_arrival_time(
+            self,
+            container: Container,
+            container_departure_time: datetime.datetime,
+            delivery_time_window_start: int,
+            random_time_component: float
+    ) -> datetime.datetime:
+        container_dwell_time_distribution = self._get_distributions(container)[0]
+        minimum_dwell_time_in_hours = container_dwell_time_distribution.minimum
+        maximum_dwell_time_in_hours = container_dwell_time_distribution.maximum
+
         truck_arrival_time = (
                 # go back to the earliest time window
                 container_departure_time.replace(minute=0, second=0, microsecond=0)
@@ -110,43 +126,75 @@ class TruckForExportContainersManager(AbstractTruckForContainersManager):
 
         return truck_arrival_time
 
+    def _get_container_delivery_times(
+            self,
+            containers: Sequence[Container],
+            container_departure_times: Sequence[datetime.datetime]
+    ) -> List[datetime.datetime]:
+        """Draws the delivery times of many containers at once, see :meth:`_get_container_delivery_time`."""
+        starts_of_distribution_slices = [
+            container_departure_time.replace(minute=0, second=0, microsecond=0)
+            - datetime.timedelta(hours=self._get_distributions(container)[0].maximum)
+            for container, container_departure_time in zip(containers, container_departure_times)
+        ]
+        delivery_time_window_starts = self._draw_time_windows_of_truck_arrivals(
+            containers, starts_of_distribution_slices
+        )
+        random_time_components = self._draw_random_time_components(len(containers))
+        return [
+            self._get_truck_arrival_time(
+                container, container_departure_time, int(delivery_time_window_start), float(random_time_component)
+            )
+            for container, container_departure_time, delivery_time_window_start, random_time_component in zip(
+                containers, container_departure_times, delivery_time_window_starts, random_time_components
+            )
+        ]
+
     def generate_trucks_for_delivering(self) -> None:
         """Looks for all containers that are supposed to be delivered by truck and creates the corresponding truck.
         """
-        containers = Container.select().where(
+        # The join avoids lazily loading the vehicle of each container one after another
+        containers: List[Container] = list(Container.select(Container, LargeScheduledVehicle).join(
+            LargeScheduledVehicle, on=Container.picked_up_by_large_scheduled_vehicle
+        ).where(
             Container.delivered_by == ModeOfTransport.truck
         ).order_by(
             fn.assign_random_value(Container.id)
-        )
-        number_containers = containers.count()
+        ))
+        number_containers = len(containers)
         self.logger.info(
             f"In total {number_containers} containers are delivered by truck, creating these trucks now...")
-        teu_total = 0
-        for i, container in enumerate(containers):
-            i += 1
-            if i % 1000 == 0 or i == 1 or i == number_containers:
+
+        # assume that the vessel arrival time changes are not communicated on time so that the trucks which deliver
+        # a container for that vessel drop off the container too early
+        container_pickup_times: List[datetime.datetime] = [
+            container.picked_up_by_large_scheduled_vehicle.scheduled_arrival
+            for container in containers
+        ]
+        truck_arrival_times = self._get_container_delivery_times(containers, container_pickup_times)
+
+        with database_proxy.atomic():
+            for batch_start in range(0, number_containers, self.batch_size):
+                batch_end = min(batch_start + self.batch_size, number_containers)
+                containers_in_batch = containers[batch_start:batch_end]
+                trucks = self.vehicle_factory.create_trucks(
+                    delivers_container=True,
+                    picks_up_container=False,
+                    truck_arrival_information_for_delivery=[
+                        TruckArrivalInformationForDelivery(
+                            planned_container_delivery_time_at_window_start=truck_arrival_time,
+                            realized_container_delivery_time=truck_arrival_time
+                        )
+                        for truck_arrival_time in truck_arrival_times[batch_start:batch_end]
+                    ],
+                    truck_arrival_information_for_pickup=None
+                )
+                for container, truck in zip(containers_in_batch, trucks):
+                    container.delivered_by_truck = truck
+                bulk_update(containers_in_batch, [Container.delivered_by_truck])
                 self.logger.info(
-                    f"Progress: {i} / {number_containers} ({i / number_containers:.2%}) trucks generated "
-                    f"to deliver containers to the terminal.")
-            picked_up_with: LargeScheduledVehicle = container.picked_up_by_large_scheduled_vehicle
-
-            # assume that the vessel arrival time changes are not communicated on time so that the trucks which deliver
-            # a container for that vessel drop off the container too early
-            container_pickup_time: datetime.datetime = picked_up_with.scheduled_arrival
-
-            truck_arrival_time = self._get_container_delivery_time(container, container_pickup_time)
-            truck_arrival_information_for_delivery = TruckArrivalInformationForDelivery.create(
-                planned_container_delivery_time_at_window_start=truck_arrival_time,
-                realized_container_delivery_time=truck_arrival_time
-            )
-            truck = self.vehicle_factory.create_truck(
-                delivers_container=True,
-                picks_up_container=False,
-                truck_arrival_information_for_delivery=truck_arrival_information_for_delivery,
-                truck_arrival_information_for_pickup=None
-            )
-            container.delivered_by_truck = truck
-            container.save()
-            teu_total += ContainerLength.get_teu_factor(container.length)
+                    f"Progress: {batch_end} / {number_containers} ({batch_end / number_containers:.2%}) trucks "
+                    f"generated to deliver containers to the terminal.")
+        teu_total = sum(ContainerLength.get_teu_factor(container.length) for container in containers)
         self.logger.info(f"All {number_containers} trucks that deliver a container are created now, moving "
                          f"{teu_total} TEU.")
@@ -1,5 +1,5 @@
 import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence
 
 from peewee import fn
 
@@ -8,6 +8,8 @@ from .abstract_truck_for_containers_manager import AbstractTruckForContainersMan
 from ..domain_models.data_types.container_length import ContainerLength
 from ..domain_models.data_types.storage_requirement import StorageRequirement
 from ..domain_models.arrival_information import TruckArrivalInformationForPickup
+from ..domain_models.base_model import database_proxy
+from ..domain_models.bulk_operations import bulk_update
 from ..domain_models.container import Container
 from ..domain_models.data_types.mode_of_transport import ModeOfTransport
 from ..domain_models.vehicle import LargeScheduledVehicle
@@ -39,8 +41,6 @@ class TruckForImportContainersManager(AbstractTruckForContainersManager):
     ) -> datetime.datetime:
 
         container_dwell_time_distribution, truck_arrival_distribution = self._get_distributions(container)
-        minimum_dwell_time_in_hours = container_dwell_time_distribution.minimum
-        maximum_dwell_time_in_hours = container_dwell_time_distribution.maximum
 
         # Example: Given the container arrives at 10:15, do not check for the hour that has already started.
         # Instead, just check for the truck arrival rate at 11:00. This is done because the truck arrival rate is
@@ -71,6 +71,21 @@ class TruckForImportContainersManager(AbstractTruckForContainersManager):
             else:
                 raise UnknownDistributionPropertyException(f"Unknown: {_debug_check_distribution_property}")
 
+        return self._get_truck_arrival_time(
+            container, container_arrival_time, pickup_time_window_start, random_time_component
+        )
+
+    def _get_truck_arrival_time(
+            self,
+            container: Container,
+            container_arrival_time: datetime.datetime,
+            pickup_time_window_start: int,
+            random_time_component: float
+    ) -> datetime.datetime:
+        container_dwell_time_distribution = self._get_distributions(container)[0]
+        minimum_dwell_time_in_hours = container_dwell_time_distribution.minimum
+        maximum_dwell_time_in_hours = container_dwell_time_distribution.maximum
+
         truck_arrival_time = (
             container_arrival_time.replace(minute=0, second=0, microsecond=0)
             + datetime.timedelta(hours=pickup_time_window_start)  # these are several days, comparable to time slot
@@ -87,44 +102,74 @@ class TruckForImportContainersManager(AbstractTruckForContainersManager):
 
         return truck_arrival_time
 
+    def _get_container_pickup_times(
+            self,
+            containers: Sequence[Container],
+            container_arrival_times: Sequence[datetime.datetime]
+    ) -> List[datetime.datetime]:
+        """Draws the pickup times of many containers at once, see :meth:`_get_container_pickup_time`."""
+        starts_of_distribution_slices = [
+            container_arrival_time.replace(minute=0, second=0, microsecond=0) + datetime.timedelta(hours=1)
+            for container_arrival_time in container_arrival_times
+        ]
+        pickup_time_window_starts = self._draw_time_windows_of_truck_arrivals(
+            containers, starts_of_distribution_slices
+        )
+        random_time_components = self._draw_random_time_components(len(containers))
+        return [
+            self._get_truck_arrival_time(
+                container, container_arrival_time, int(pickup_time_window_start), float(random_time_component)
+            )
+            for container, container_arrival_time, pickup_time_window_start, random_time_component in zip(
+                containers, container_arrival_times, pickup_time_window_starts, random_time_components
+            )
+        ]
+
     def generate_trucks_for_picking_up(self):
-        containers = Container.select().where(
+        # The join avoids lazily loading the vehicle of each container one after another
+        containers: List[Container] = list(Container.select(Container, LargeScheduledVehicle).join(
+            LargeScheduledVehicle, on=Container.delivered_by_large_scheduled_vehicle
+        ).where(
             Container.picked_up_by == ModeOfTransport.truck
         ).order_by(
             fn.assign_random_value(Container.id)
-        )
-        number_containers = containers.count()
+        ))
+        number_containers = len(containers)
         self.logger.info(
             f"In total {number_containers} containers are picked up by truck, creating these trucks now..."
         )
-        container: Container
-        teu_total = 0
-        for i, container in enumerate(containers):
-            i += 1
-            if i % 1000 == 0 or i == 1 or i == number_containers:
-                self.logger.info(f"Progress: {i} / {number_containers} ({i / number_containers:.2%}) trucks "
-                                 f"generated to pick up containers at the terminal.")
-            delivered_by: LargeScheduledVehicle = container.delivered_by_large_scheduled_vehicle
-
-            # assume that the vessel arrival time changes are communicated early enough so that the trucks which pick
-            # up a container never try to go to the terminal before the vessel has arrived
-            container_arrival_time: datetime.datetime = \
-                delivered_by.realized_arrival or delivered_by.scheduled_arrival
-
-            truck_arrival_time = self._get_container_pickup_time(container, container_arrival_time)
-            truck_arrival_information_for_pickup = TruckArrivalInformationForPickup.create(
-                planned_container_pickup_time_prior_berthing=None,  # TODO: set value if required
-                planned_container_pickup_time_after_initial_storage=None,  # TODO: set value if required
-                realized_container_pickup_time=truck_arrival_time
-            )
-            truck = self.vehicle_factory.create_truck(
-                delivers_container=False,
-                picks_up_container=True,
-                truck_arrival_information_for_delivery=None,
-                truck_arrival_information_for_pickup=truck_arrival_information_for_pickup
-            )
-            container.picked_up_by_truck = truck
-            container.save()
-            teu_total += ContainerLength.get_teu_factor(container.length)
+
+        # assume that the vessel arrival time changes are communicated early enough so that the trucks which pick
+        # up a container never try to go to the terminal before the vessel has arrived
+        container_arrival_times: List[datetime.datetime] = [
+            container.delivered_by_large_scheduled_vehicle.realized_arrival
+            or container.delivered_by_large_scheduled_vehicle.scheduled_arrival
+            for container in containers
+        ]
+        truck_arrival_times = self._get_container_pickup_times(containers, container_arrival_times)
+
+        with database_proxy.atomic():
+            for batch_start in range(0, number_containers, self.batch_size):
+                batch_end = min(batch_start + self.batch_size, number_containers)
+                containers_in_batch = containers[batch_start:batch_end]
+                trucks = self.vehicle_factory.create_trucks(
+                    delivers_container=False,
+                    picks_up_container=True,
+                    truck_arrival_information_for_delivery=None,
+                    truck_arrival_information_for_pickup=[
+                        TruckArrivalInformationForPickup(
+                            planned_container_pickup_time_prior_berthing=None,  # TODO: set value if required
+                            planned_container_pickup_time_after_initial_storage=None,  # TODO: set value if required
+                            realized_container_pickup_time=truck_arrival_time
+                        )
+                        for truck_arrival_time in truck_arrival_times[batch_start:batch_end]
+                    ]
+                )
+                for container, truck in zip(containers_in_batch, trucks):
+                    container.picked_up_by_truck = truck
+                bulk_update(containers_in_batch, [Container.picked_up_by_truck])
+                self.logger.info(f"Progress: {batch_end} / {number_containers} ({batch_end / number_containers:.2%}) "
+                                 f"trucks generated to pick up containers at the terminal.")
+        teu_total = sum(ContainerLength.get_teu_factor(container.length) for container in containers)
         self.logger.info(f"All {number_containers} trucks that pick up a container have been generated, moving "
                          f"{teu_total} TEU.")
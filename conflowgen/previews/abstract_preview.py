@@ -8,6 +8,10 @@ from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTranspor
 
 
 class AbstractPreview(abc.ABC):
+
+    #: The :class:`.DataSummariesCache` identifies instances by their attributes instead of their identity
+    cache_results_by_attributes = True
+
     def __init__(
             self,
             start_date: datetime.date,
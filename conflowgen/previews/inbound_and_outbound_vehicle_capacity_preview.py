@@ -63,7 +63,6 @@ class InboundAndOutboundVehicleCapacityPreview(AbstractPreview):
         return InboundAndOutboundVehicleCapacityCalculatorService.\
             get_truck_capacity_for_export_containers(inbound_capacity_of_vehicles)
 
-    @DataSummariesCache.cache_result
     def hypothesize_with_mode_of_transport_distribution(
             self,
             mode_of_transport_distribution: Dict[ModeOfTransport, Dict[ModeOfTransport, float]]
@@ -59,7 +59,6 @@ class ModalSplitPreview(AbstractPreview):
             transportation_buffer=transportation_buffer
         )
 
-    @DataSummariesCache.cache_result
     def hypothesize_with_mode_of_transport_distribution(
             self,
             mode_of_transport_distribution: Dict[ModeOfTransport, Dict[ModeOfTransport, float]]
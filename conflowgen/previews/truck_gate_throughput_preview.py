@@ -40,7 +40,6 @@ class TruckGateThroughputPreview(AbstractPreview, ABC):
             )
         )
 
-    @DataSummariesCache.cache_result
     def hypothesize_with_mode_of_transport_distribution(
             self,
             mode_of_transport_distribution: typing.Dict[ModeOfTransport, typing.Dict[ModeOfTransport, float]]
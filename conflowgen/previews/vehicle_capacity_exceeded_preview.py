@@ -75,7 +75,6 @@ class VehicleCapacityExceededPreview(AbstractPreview):
             transportation_buffer=transportation_buffer
         )
 
-    @DataSummariesCache.cache_result
     def hypothesize_with_mode_of_transport_distribution(
             self,
             mode_of_transport_distribution: Dict[ModeOfTransport, Dict[ModeOfTransport, float]]
@@ -1,7 +1,11 @@
 import datetime
 import unittest
 
-from conflowgen.analyses.abstract_analysis import get_hour_based_range
+import numpy as np
+
+from conflowgen.analyses.abstract_analysis import count_per_time_window, get_hour_based_range, \
+    get_hour_based_range_from_indices, get_hour_based_time_window_indices, get_week_based_range_from_indices, \
+    get_week_based_time_window, get_week_based_time_window_indices
 
 
 class TestHelpers(unittest.TestCase):
@@ -71,3 +75,44 @@ class TestHelpers(unittest.TestCase):
             include_end=False
         )
         self.assertEqual(0, len(_range))
+
+    def test_get_hour_based_range_from_indices(self):
+        points_in_time = np.array([
+            datetime.datetime(2022, 8, 15, 21, 59),
+            datetime.datetime(2022, 8, 15, 23, 1),
+        ], dtype="datetime64[us]")
+        indices = get_hour_based_time_window_indices(points_in_time)
+        self.assertEqual(2, indices[1] - indices[0])
+        self.assertListEqual(
+            [
+                datetime.datetime(2022, 8, 15, 21),
+                datetime.datetime(2022, 8, 15, 22),
+                datetime.datetime(2022, 8, 15, 23),
+            ],
+            get_hour_based_range_from_indices(indices[0], 3)
+        )
+
+    def test_get_week_based_range_from_indices(self):
+        points_in_time = np.array([
+            datetime.datetime(2022, 8, 14, 23, 59),  # Sunday
+            datetime.datetime(2022, 8, 15, 0, 0),  # Monday
+            datetime.datetime(2022, 8, 28, 12),  # Sunday
+        ], dtype="datetime64[us]")
+        indices = get_week_based_time_window_indices(points_in_time)
+        for index, point_in_time in zip(indices, points_in_time.tolist()):
+            self.assertListEqual(
+                [get_week_based_time_window(point_in_time)],
+                get_week_based_range_from_indices(index, 1)
+            )
+        self.assertListEqual(
+            [
+                datetime.date(2022, 8, 8),
+                datetime.date(2022, 8, 15),
+                datetime.date(2022, 8, 22),
+            ],
+            get_week_based_range_from_indices(indices[0], 3)
+        )
+
+    def test_count_per_time_window(self):
+        counts = count_per_time_window(np.array([11, 12, 12, 14]), 10, 6)
+        self.assertListEqual([0, 1, 2, 0, 1, 0], counts.tolist())
@@ -1,4 +1,5 @@
 import datetime
+import typing
 import unittest
 
 from conflowgen.analyses.container_dwell_time_analysis import ContainerDwellTimeAnalysis
@@ -296,3 +297,74 @@ class TestContainerDwellTimeAnalysis(unittest.TestCase):
             {
                 datetime.timedelta(hours=12),
             })
+
+    def _create_containers_picked_up_by_trucks(self, hours_in_yard: typing.List[int]):
+        now = datetime.datetime.now()
+        schedule = Schedule.create(
+            vehicle_type=ModeOfTransport.feeder,
+            service_name="TestFeederService",
+            vehicle_arrives_at=now.date(),
+            vehicle_arrives_at_time=now.time(),
+            average_vehicle_capacity=300,
+            average_inbound_container_volume=300,
+        )
+        feeder_lsv = LargeScheduledVehicle.create(
+            vehicle_name="TestFeeder1",
+            capacity_in_teu=300,
+            inbound_container_volume=schedule.average_inbound_container_volume,
+            scheduled_arrival=now,
+            schedule=schedule
+        )
+        for hours in hours_in_yard:
+            truck = Truck.create(
+                delivers_container=False,
+                picks_up_container=True,
+                truck_arrival_information_for_delivery=None,
+                truck_arrival_information_for_pickup=TruckArrivalInformationForPickup.create(
+                    realized_container_pickup_time=now + datetime.timedelta(hours=hours)
+                )
+            )
+            Container.create(
+                weight=20,
+                length=ContainerLength.twenty_feet,
+                storage_requirement=StorageRequirement.standard,
+                delivered_by=ModeOfTransport.feeder,
+                delivered_by_large_scheduled_vehicle=feeder_lsv,
+                picked_up_by=ModeOfTransport.truck,
+                picked_up_by_initial=ModeOfTransport.truck,
+                picked_up_by_truck=truck
+            )
+
+    def test_dwell_times_in_hours_include_each_container(self):
+        self._create_containers_picked_up_by_trucks([25, 12, 25])
+
+        container_dwell_times = self.analysis.get_container_dwell_times()
+        self.assertEqual(len(container_dwell_times), 2)
+
+        container_dwell_times_in_hours = self.analysis.get_container_dwell_times_in_hours()
+        self.assertListEqual(sorted(container_dwell_times_in_hours.tolist()), [12, 25, 25])
+
+    def test_dwell_time_statistics(self):
+        self._create_containers_picked_up_by_trucks([25, 12, 25, 30])
+
+        statistics = self.analysis.get_container_dwell_time_statistics()
+        self.assertEqual(statistics.number_containers, 4)
+        self.assertEqual(statistics.minimum, 12)
+        self.assertEqual(statistics.average, 23)
+        self.assertEqual(statistics.maximum, 30)
+        self.assertAlmostEqual(statistics.standard_deviation, 7.7028, places=3)
+
+    def test_dwell_time_statistics_with_no_data(self):
+        statistics = self.analysis.get_container_dwell_time_statistics()
+        self.assertEqual(statistics.number_containers, 0)
+        self.assertIsNone(statistics.standard_deviation)
+
+    def test_dwell_time_histogram(self):
+        self._create_containers_picked_up_by_trucks([25, 12, 25, 60])
+
+        histogram = self.analysis.get_container_dwell_time_histogram(bin_width_in_hours=24)
+        self.assertDictEqual(histogram, {0: 1, 24: 2, 48: 1})
+
+        self.assertDictEqual(self.analysis.get_container_dwell_time_histogram(
+            container_delivered_by_vehicle_type=ModeOfTransport.barge
+        ), {})
@@ -1,7 +1,10 @@
+import datetime
 import unittest
 
 from conflowgen.analyses.container_flow_adjustment_by_vehicle_type_analysis import \
     ContainerFlowAdjustmentByVehicleTypeAnalysis
+from conflowgen.domain_models.arrival_information import TruckArrivalInformationForDelivery, \
+    TruckArrivalInformationForPickup
 from conflowgen.domain_models.container import Container
 from conflowgen.domain_models.data_types.container_length import ContainerLength
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
@@ -22,6 +25,8 @@ class TestContainerFlowAdjustmentByVehicleTypeAnalysis(unittest.TestCase):
             Container,
             LargeScheduledVehicle,
             Truck,
+            TruckArrivalInformationForDelivery,
+            TruckArrivalInformationForPickup,
             Feeder,
             ModeOfTransportDistribution,
             Destination
@@ -146,3 +151,32 @@ class TestContainerFlowAdjustmentByVehicleTypeAnalysis(unittest.TestCase):
         self.assertEqual(truck_to_truck, 1, "One 20' container (from truck to truck) has been created previously")
         truck_to_truck = initial_to_adjusted_outbound_flow_in_teu[ModeOfTransport.truck][ModeOfTransport.truck]
         self.assertEqual(truck_to_truck, 1, "One 20' container (from truck to truck) has been created previously")
+
+    def test_with_time_window(self):
+        start_date = datetime.datetime(2021, 8, 1)
+        end_date = datetime.datetime(2021, 8, 31)
+        for (arrival_time, departure_time) in [
+            (datetime.datetime(2021, 8, 2), datetime.datetime(2021, 8, 5)),
+            (datetime.datetime(2021, 7, 30), datetime.datetime(2021, 8, 5)),  # arrives too early
+            (datetime.datetime(2021, 8, 30), datetime.datetime(2021, 9, 2)),  # departs too late
+        ]:
+            Container.create(
+                weight=20,
+                length=ContainerLength.forty_feet,
+                storage_requirement=StorageRequirement.standard,
+                delivered_by=ModeOfTransport.feeder,
+                picked_up_by=ModeOfTransport.truck,
+                picked_up_by_initial=ModeOfTransport.feeder,
+                cached_arrival_time=arrival_time,
+                cached_departure_time=departure_time
+            )
+
+        initial_to_adjusted_outbound_flow = self.analysis.get_initial_to_adjusted_outbound_flow(
+            start_date=start_date,
+            end_date=end_date
+        )
+
+        feeder_to_truck = initial_to_adjusted_outbound_flow.containers[ModeOfTransport.feeder][ModeOfTransport.truck]
+        self.assertEqual(feeder_to_truck, 1, "Only one container is within the time window")
+        feeder_to_truck = initial_to_adjusted_outbound_flow.teu[ModeOfTransport.feeder][ModeOfTransport.truck]
+        self.assertEqual(feeder_to_truck, 2, "Only one 40' container is within the time window")
@@ -0,0 +1,134 @@
+import datetime
+import unittest
+
+from conflowgen.analyses.container_flow_by_vehicle_instance_analysis import ContainerFlowByVehicleInstanceAnalysis
+from conflowgen.descriptive_datatypes import FlowDirection, VehicleIdentifier
+from conflowgen.domain_models.arrival_information import TruckArrivalInformationForDelivery, \
+    TruckArrivalInformationForPickup
+from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.data_types.container_length import ContainerLength
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
+from conflowgen.domain_models.large_vehicle_schedule import Schedule, Destination
+from conflowgen.domain_models.vehicle import LargeScheduledVehicle, Truck
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestContainerFlowByVehicleInstanceAnalysis(unittest.TestCase):
+    def setUp(self) -> None:
+        """Create container database in memory"""
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        self.sqlite_db.create_tables([
+            Schedule,
+            Container,
+            LargeScheduledVehicle,
+            Truck,
+            TruckArrivalInformationForDelivery,
+            TruckArrivalInformationForPickup,
+            Destination
+        ])
+        self.analysis = ContainerFlowByVehicleInstanceAnalysis()
+
+    @staticmethod
+    def _create_vehicle(vehicle_type: ModeOfTransport, vehicle_name: str, arrival: datetime.datetime):
+        schedule = Schedule.create(
+            vehicle_type=vehicle_type,
+            service_name=f"Test{vehicle_type}Service",
+            vehicle_arrives_at=arrival.date(),
+            vehicle_arrives_at_time=arrival.time(),
+            average_vehicle_capacity=300,
+            average_inbound_container_volume=300,
+        )
+        return LargeScheduledVehicle.create(
+            vehicle_name=vehicle_name,
+            capacity_in_teu=300,
+            inbound_container_volume=300,
+            scheduled_arrival=arrival,
+            schedule=schedule
+        )
+
+    def test_with_no_data(self):
+        container_flow = self.analysis.get_container_flow_by_vehicle()
+        self.assertDictEqual(
+            container_flow,
+            {
+                ModeOfTransport.train: {},
+                ModeOfTransport.feeder: {},
+                ModeOfTransport.deep_sea_vessel: {},
+                ModeOfTransport.barge: {},
+            }
+        )
+
+    def test_with_feeder_and_train(self):
+        feeder_arrival = datetime.datetime(2021, 8, 7, 13)
+        train_arrival = datetime.datetime(2021, 8, 9, 8)
+        feeder = self._create_vehicle(ModeOfTransport.feeder, "TestFeeder1", feeder_arrival)
+        train = self._create_vehicle(ModeOfTransport.train, "TestTrain1", train_arrival)
+        for length in (ContainerLength.forty_feet, ContainerLength.forty_five_feet):
+            Container.create(
+                weight=20,
+                length=length,
+                storage_requirement=StorageRequirement.standard,
+                delivered_by=ModeOfTransport.feeder,
+                delivered_by_large_scheduled_vehicle=feeder,
+                picked_up_by=ModeOfTransport.train,
+                picked_up_by_initial=ModeOfTransport.train,
+                picked_up_by_large_scheduled_vehicle=train
+            )
+        Container.create(
+            weight=20,
+            length=ContainerLength.twenty_feet,
+            storage_requirement=StorageRequirement.standard,
+            delivered_by=ModeOfTransport.truck,
+            picked_up_by=ModeOfTransport.feeder,
+            picked_up_by_initial=ModeOfTransport.feeder,
+            picked_up_by_large_scheduled_vehicle=feeder,
+            cached_arrival_time=datetime.datetime(2021, 8, 6, 10),
+            cached_departure_time=feeder_arrival
+        )
+
+        container_flow = self.analysis.get_container_flow_by_vehicle()
+
+        feeder_identifier = VehicleIdentifier(
+            id=feeder.id,
+            mode_of_transport=ModeOfTransport.feeder,
+            service_name="TestfeederService",
+            vehicle_name="TestFeeder1",
+            vehicle_arrival_time=feeder_arrival
+        )
+        train_identifier = VehicleIdentifier(
+            id=train.id,
+            mode_of_transport=ModeOfTransport.train,
+            service_name="TesttrainService",
+            vehicle_name="TestTrain1",
+            vehicle_arrival_time=train_arrival
+        )
+        self.assertListEqual(list(container_flow[ModeOfTransport.feeder].keys()), [feeder_identifier])
+        self.assertListEqual(list(container_flow[ModeOfTransport.train].keys()), [train_identifier])
+
+        feeder_flow = container_flow[ModeOfTransport.feeder][feeder_identifier]
+        self.assertDictEqual(feeder_flow[FlowDirection.import_flow], {"inbound": 4.25, "outbound": 0})
+        self.assertDictEqual(feeder_flow[FlowDirection.export_flow], {"inbound": 0, "outbound": 1})
+        self.assertDictEqual(feeder_flow[FlowDirection.transshipment_flow], {"inbound": 0, "outbound": 0})
+        train_flow = container_flow[ModeOfTransport.train][train_identifier]
+        self.assertDictEqual(train_flow[FlowDirection.import_flow], {"inbound": 0, "outbound": 2})
+
+    def test_with_subset_of_vehicle_types(self):
+        feeder = self._create_vehicle(ModeOfTransport.feeder, "TestFeeder1", datetime.datetime(2021, 8, 7, 13))
+        train = self._create_vehicle(ModeOfTransport.train, "TestTrain1", datetime.datetime(2021, 8, 9, 8))
+        Container.create(
+            weight=20,
+            length=ContainerLength.twenty_feet,
+            storage_requirement=StorageRequirement.standard,
+            delivered_by=ModeOfTransport.feeder,
+            delivered_by_large_scheduled_vehicle=feeder,
+            picked_up_by=ModeOfTransport.train,
+            picked_up_by_initial=ModeOfTransport.train,
+            picked_up_by_large_scheduled_vehicle=train
+        )
+
+        container_flow = self.analysis.get_container_flow_by_vehicle(vehicle_types=[ModeOfTransport.train])
+
+        self.assertListEqual(list(container_flow.keys()), [ModeOfTransport.train])
+        (train_flow, ) = container_flow[ModeOfTransport.train].values()
+        self.assertDictEqual(train_flow[FlowDirection.import_flow], {"inbound": 0, "outbound": 1})
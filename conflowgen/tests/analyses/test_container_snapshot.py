@@ -0,0 +1,127 @@
+import datetime
+import unittest
+
+from conflowgen.analyses.container_snapshot import ContainerSnapshot
+from conflowgen.domain_models.arrival_information import TruckArrivalInformationForDelivery, \
+    TruckArrivalInformationForPickup
+from conflowgen.domain_models.container import Container, NoPickupVehicleException
+from conflowgen.domain_models.data_types.container_length import ContainerLength
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
+from conflowgen.domain_models.large_vehicle_schedule import Destination, Schedule
+from conflowgen.domain_models.vehicle import LargeScheduledVehicle, Truck
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestContainerSnapshot(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Create container database in memory"""
+        sqlite_db = setup_sqlite_in_memory_db()
+        sqlite_db.create_tables([
+            Schedule,
+            Destination,
+            LargeScheduledVehicle,
+            Container,
+            Truck,
+            TruckArrivalInformationForDelivery,
+            TruckArrivalInformationForPickup,
+        ])
+        schedule = Schedule.create(
+            vehicle_type=ModeOfTransport.feeder,
+            service_name="TestFeederService",
+            vehicle_arrives_at=datetime.date(year=2021, month=8, day=7),
+            vehicle_arrives_at_time=datetime.time(hour=13, minute=15),
+            average_vehicle_capacity=300,
+            average_inbound_container_volume=250,
+        )
+        self.feeder_arrival = datetime.datetime(year=2021, month=8, day=7, hour=13, minute=15)
+        self.large_scheduled_vehicle = LargeScheduledVehicle.create(
+            vehicle_name="TestFeeder1",
+            capacity_in_teu=300,
+            inbound_container_volume=250,
+            scheduled_arrival=self.feeder_arrival,
+            schedule=schedule
+        )
+        self.truck_delivery_time = datetime.datetime(year=2021, month=8, day=5, hour=9, minute=12, second=3)
+        self.truck = Truck.create(
+            delivers_container=True,
+            picks_up_container=False,
+            truck_arrival_information_for_delivery=TruckArrivalInformationForDelivery.create(
+                realized_container_delivery_time=self.truck_delivery_time
+            )
+        )
+
+    def test_empty_database(self):
+        containers = ContainerSnapshot.get_containers()
+        self.assertEqual(len(containers), 0)
+        self.assertEqual(len(ContainerSnapshot.restrict_to_time_range(
+            containers, self.feeder_arrival, self.feeder_arrival)), 0)
+
+    def test_columns_and_times(self):
+        Container.create(
+            weight=20,
+            length=ContainerLength.forty_five_feet,
+            storage_requirement=StorageRequirement.reefer,
+            delivered_by=ModeOfTransport.truck,
+            delivered_by_truck=self.truck,
+            picked_up_by=ModeOfTransport.feeder,
+            picked_up_by_initial=ModeOfTransport.train,
+            picked_up_by_large_scheduled_vehicle=self.large_scheduled_vehicle
+        )
+
+        containers = ContainerSnapshot.get_containers()
+
+        self.assertEqual(len(containers), 1)
+        container = containers.iloc[0]
+        self.assertEqual(container["length"], 45)
+        self.assertEqual(container["occupied_teu"], 2.25)
+        self.assertEqual(container["storage_requirement"], StorageRequirement.reefer.value)
+        self.assertEqual(container["delivered_by"], ModeOfTransport.truck.value)
+        self.assertEqual(container["picked_up_by"], ModeOfTransport.feeder.value)
+        self.assertEqual(container["picked_up_by_initial"], ModeOfTransport.train.value)
+        self.assertEqual(container["delivered_by_truck"], self.truck.id)
+        self.assertEqual(container["picked_up_by_large_scheduled_vehicle"], self.large_scheduled_vehicle.id)
+        self.assertEqual(container["arrival_time"], self.truck_delivery_time)
+        self.assertEqual(container["departure_time"], self.feeder_arrival)
+
+    def test_snapshot_is_loaded_once(self):
+        self.assertIs(ContainerSnapshot.get_containers(), ContainerSnapshot.get_containers())
+
+    def test_restrict_to_values(self):
+        for storage_requirement in (StorageRequirement.standard, StorageRequirement.empty):
+            Container.create(
+                weight=20,
+                length=ContainerLength.twenty_feet,
+                storage_requirement=storage_requirement,
+                delivered_by=ModeOfTransport.feeder,
+                delivered_by_large_scheduled_vehicle=self.large_scheduled_vehicle,
+                picked_up_by=ModeOfTransport.feeder,
+                picked_up_by_initial=ModeOfTransport.feeder,
+                picked_up_by_large_scheduled_vehicle=self.large_scheduled_vehicle
+            )
+        containers = ContainerSnapshot.get_containers()
+
+        self.assertEqual(
+            len(ContainerSnapshot.restrict_to_values(containers, "storage_requirement", StorageRequirement.empty)), 1)
+        self.assertEqual(
+            len(ContainerSnapshot.restrict_to_values(
+                containers, "storage_requirement", [StorageRequirement.empty, StorageRequirement.standard])), 2)
+        self.assertEqual(
+            len(ContainerSnapshot.restrict_to_values(containers, "storage_requirement", StorageRequirement.reefer)), 0)
+
+    def test_restrict_to_time_range_without_pickup_vehicle(self):
+        Container.create(
+            weight=20,
+            length=ContainerLength.twenty_feet,
+            storage_requirement=StorageRequirement.standard,
+            delivered_by=ModeOfTransport.truck,
+            delivered_by_truck=self.truck,
+            picked_up_by=ModeOfTransport.feeder,
+            picked_up_by_initial=ModeOfTransport.feeder
+        )
+        containers = ContainerSnapshot.get_containers()
+
+        self.assertEqual(len(ContainerSnapshot.restrict_to_time_range(containers, self.truck_delivery_time, None)), 1)
+        with self.assertRaises(NoPickupVehicleException):
+            ContainerSnapshot.restrict_to_time_range(containers, None, self.feeder_arrival)
@@ -5,6 +5,8 @@ import numpy as np
 
 from conflowgen.analyses.inbound_and_outbound_vehicle_capacity_analysis import \
     InboundAndOutboundVehicleCapacityAnalysis
+from conflowgen.domain_models.arrival_information import TruckArrivalInformationForDelivery, \
+    TruckArrivalInformationForPickup
 from conflowgen.domain_models.container import Container
 from conflowgen.domain_models.data_types.container_length import ContainerLength
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
@@ -27,7 +29,9 @@ class TestInboundAndOutboundVehicleCapacityAnalysis(unittest.TestCase):
             Truck,
             Feeder,
             ModeOfTransportDistribution,
-            Destination
+            Destination,
+            TruckArrivalInformationForDelivery,
+            TruckArrivalInformationForPickup,
         ])
         mode_of_transport_distribution_seeder.seed()
         self.analysis = InboundAndOutboundVehicleCapacityAnalysis(
@@ -3,6 +3,8 @@ import datetime
 from conflowgen.analyses.inbound_and_outbound_vehicle_capacity_analysis_report import \
     InboundAndOutboundVehicleCapacityAnalysisReport
 from conflowgen.application.models.container_flow_generation_properties import ContainerFlowGenerationProperties
+from conflowgen.domain_models.arrival_information import TruckArrivalInformationForDelivery, \
+    TruckArrivalInformationForPickup
 from conflowgen.domain_models.container import Container
 from conflowgen.domain_models.data_types.container_length import ContainerLength
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
@@ -60,7 +62,9 @@ class TestInboundAndOutboundVehicleCapacityAnalysis(UnitTestCaseWithMatplotlib):
             Feeder,
             ModeOfTransportDistribution,
             Destination,
-            ContainerFlowGenerationProperties
+            ContainerFlowGenerationProperties,
+            TruckArrivalInformationForDelivery,
+            TruckArrivalInformationForPickup,
         ])
         mode_of_transport_distribution_seeder.seed()
         ContainerFlowGenerationProperties.create(
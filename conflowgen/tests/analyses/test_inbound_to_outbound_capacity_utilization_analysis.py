@@ -93,3 +93,45 @@ class TestInboundToOutboundCapacityUtilizationAnalysis(unittest.TestCase):
         (used_capacity_on_inbound_journey, used_capacity_on_outbound_journey) = value_of_entry
         self.assertEqual(used_capacity_on_inbound_journey, 250)
         self.assertEqual(used_capacity_on_outbound_journey, 1, "One 20' is loaded")
+
+    def test_outbound_with_several_container_lengths_and_empty_feeder(self):
+        one_week_later = datetime.datetime.now() + datetime.timedelta(weeks=1)
+        schedule = Schedule.create(
+            vehicle_type=ModeOfTransport.feeder,
+            service_name="TestFeederService",
+            vehicle_arrives_at=one_week_later.date(),
+            vehicle_arrives_at_time=one_week_later.time(),
+            average_vehicle_capacity=300,
+            average_inbound_container_volume=250,
+            vehicle_arrives_every_k_days=-1
+        )
+        now = datetime.datetime.now()
+        loaded_feeder_lsv, empty_feeder_lsv = [
+            LargeScheduledVehicle.create(
+                vehicle_name=f"TestFeeder{i}",
+                capacity_in_teu=schedule.average_vehicle_capacity,
+                inbound_container_volume=schedule.average_inbound_container_volume,
+                scheduled_arrival=now + datetime.timedelta(days=i),
+                schedule=schedule
+            )
+            for i in range(2)
+        ]
+        for container_length in ContainerLength:
+            Container.create(
+                weight=20,
+                length=container_length,
+                storage_requirement=StorageRequirement.standard,
+                delivered_by=ModeOfTransport.truck,
+                picked_up_by_large_scheduled_vehicle=loaded_feeder_lsv,
+                picked_up_by=ModeOfTransport.feeder,
+                picked_up_by_initial=ModeOfTransport.truck
+            )
+
+        capacities = self.analysis.get_inbound_and_outbound_capacity_of_each_vehicle()
+
+        self.assertEqual(len(capacities), 2)
+        capacities_by_vehicle_name = {
+            vehicle_identifier.vehicle_name: capacity for vehicle_identifier, capacity in capacities.items()
+        }
+        self.assertEqual(capacities_by_vehicle_name[loaded_feeder_lsv.vehicle_name], (250, 1 + 2 + 2.25 + 2.5))
+        self.assertEqual(capacities_by_vehicle_name[empty_feeder_lsv.vehicle_name], (250, 0))
@@ -4,7 +4,7 @@ import unittest
 from conflowgen.analyses.yard_capacity_analysis import YardCapacityAnalysis
 from conflowgen.domain_models.arrival_information import TruckArrivalInformationForPickup, \
     TruckArrivalInformationForDelivery
-from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.container import Container, NoPickupVehicleException
 from conflowgen.domain_models.data_types.container_length import ContainerLength
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
 from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
@@ -40,6 +40,28 @@ class TestYardCapacityAnalysis(unittest.TestCase):
         empty_yard = self.analysis.get_used_yard_capacity_over_time().teu
         self.assertEqual(empty_yard, {})
 
+    def test_with_container_without_pickup_vehicle(self):
+        now = datetime.datetime.now()
+        aid = TruckArrivalInformationForDelivery.create(realized_container_delivery_time=now)
+        truck = Truck.create(
+            delivers_container=True,
+            picks_up_container=False,
+            truck_arrival_information_for_delivery=aid,
+            truck_arrival_information_for_pickup=None
+        )
+        Container.create(
+            weight=20,
+            length=ContainerLength.twenty_feet,
+            storage_requirement=StorageRequirement.standard,
+            delivered_by=ModeOfTransport.truck,
+            delivered_by_truck=truck,
+            picked_up_by=ModeOfTransport.feeder,
+            picked_up_by_initial=ModeOfTransport.feeder
+        )
+
+        with self.assertRaises(NoPickupVehicleException):
+            self.analysis.get_used_yard_capacity_over_time()
+
     def test_with_single_container(self):
         now = datetime.datetime.now()
         schedule = Schedule.create(
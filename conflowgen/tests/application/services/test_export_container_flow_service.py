@@ -1,20 +1,29 @@
 import datetime
+import importlib.util
 import os
+import tempfile
 import unittest
+import zipfile
+from typing import Optional
 from unittest import mock
 
 import numpy as np
 import pandas as pd
+import pyarrow.parquet
 from peewee import IntegerField, Model, SqliteDatabase
 import yaml
 
+from conflowgen.application.data_types.export_compression import ExportCompression
 from conflowgen.application.data_types.export_file_format import ExportFileFormat
 from conflowgen.application.models.container_flow_generation_properties import ContainerFlowGenerationProperties
 from conflowgen.application.services.export_container_flow_service import (
     CastingException,
+    ChunkedExportNotSupportedException,
+    CompressionNotSupportedException,
     ExportContainerFlowService,
     ExportOnlyAllowedToNotExistingFolderException,
     EXPORTS_DEFAULT_DIR,
+    FileFormatNotSupportedException,
 )
 from conflowgen.domain_models.base_model import database_proxy
 from conflowgen.domain_models.container import Container
@@ -206,8 +215,7 @@ class TestExportContainerFlowService(unittest.TestCase):
         non_empty = pd.DataFrame([{"id": 1}]).set_index("id")
         empty = pd.DataFrame([])
 
-        def side_effect(model, resolved_column=None):
-            del resolved_column
+        def side_effect(model):
             return empty if "Feeder" in str(model) else non_empty
 
         with (
@@ -288,35 +296,6 @@ class TestExportContainerFlowService(unittest.TestCase):
 
     # FK recursion / edge cases
 
-    def test_convert_table_to_pandas_dataframe_resolved_column(self):
-        """Covers 228: nested column resolution."""
-        fake_model = mock.MagicMock(__name__="FakeModel")
-        fake_select = mock.MagicMock()
-        fake_select.model = fake_model
-        fk_map = {fake_model: {"some_fk": mock.MagicMock()}}
-        fake_df = mock.MagicMock(spec=pd.DataFrame)
-        fake_df.__len__.return_value = 1
-        fake_df.drop.return_value = fake_df
-        fake_df.set_index.return_value = None
-        fake_df.columns = ["id"]
-
-        with (
-            mock.patch.object(ExportContainerFlowService, "debug_once") as dbg,
-            mock.patch.object(
-                ExportContainerFlowService, "foreign_keys_to_resolve", fk_map
-            ),
-            mock.patch.object(pd, "DataFrame", return_value=fake_df),
-            mock.patch(
-                "conflowgen.application.services.export_container_flow_service.isinstance",
-                return_value=True,
-            ),
-        ):
-            ExportContainerFlowService._convert_table_to_pandas_dataframe(  # pylint: disable=protected-access
-                fake_select, resolved_column="col_x"
-            )
-
-        dbg.assert_called_once_with("This is a nested call to resolve the column 'col_x'")
-
     def test_foreign_key_paths_recursion(self):
         """Covers lines 166–180."""
         db = SqliteDatabase(":memory:")
@@ -405,8 +384,8 @@ class TestExportContainerFlowService(unittest.TestCase):
         original_columns = ExportContainerFlowService.columns_to_drop.copy()
         try:
             database_proxy.initialize(db)
-            db.bind([Container])
-            db.create_tables([Container])
+            db.bind([Container, Destination])
+            db.create_tables([Container, Destination])
 
             def raise_keyerror(*_, **__):
                 raise KeyError("forced keyerror for coverage")
@@ -465,3 +444,255 @@ class TestExportContainerFlowService(unittest.TestCase):
             svc._convert_table_to_pandas_dataframe(DummyModel)  # pylint: disable=protected-access
 
         self.assertTrue(rename_called["hit"])
+
+    # Resolved foreign keys
+
+    def test_foreign_keys_are_resolved(self):
+        db = SqliteDatabase(":memory:")
+        database_proxy.initialize(db)
+        db.bind(self._all_models)
+        db.create_tables(self._all_models)
+        delivery = TruckArrivalInformationForDelivery.create(
+            planned_container_delivery_time_at_window_start=datetime.datetime(2021, 7, 1, 8),
+            realized_container_delivery_time=datetime.datetime(2021, 7, 1, 9)
+        )
+        truck_with_delivery = Truck.create(
+            delivers_container=True,
+            picks_up_container=False,
+            truck_arrival_information_for_delivery=delivery
+        )
+        truck_without_arrival_information = Truck.create(delivers_container=False, picks_up_container=False)
+        schedule = Schedule.create(
+            service_name="TestService",
+            vehicle_type=ModeOfTransport.feeder,
+            average_vehicle_capacity=300,
+            average_inbound_container_volume=150,
+            vehicle_arrives_at=datetime.date(2021, 7, 2),
+            vehicle_arrives_every_k_days=7,
+        )
+        destination = Destination.create(
+            belongs_to_schedule=schedule, sequence_id=1, destination_name="TestDestination", fraction=1
+        )
+        container = Container.create(
+            weight=20,
+            length=ContainerLength.twenty_feet,
+            storage_requirement=StorageRequirement.standard,
+            delivered_by=ModeOfTransport.truck,
+            delivered_by_truck=truck_with_delivery,
+            picked_up_by_initial=ModeOfTransport.feeder,
+            picked_up_by=ModeOfTransport.feeder,
+            destination=destination,
+        )
+
+        try:
+            df_trucks = ExportContainerFlowService._convert_table_to_pandas_dataframe(Truck)  # pylint: disable=protected-access
+            df_containers = ExportContainerFlowService._convert_table_to_pandas_dataframe(Container)  # pylint: disable=protected-access
+        finally:
+            db.close()
+            self._test_db.bind(self._all_models)
+            database_proxy.initialize(self._test_db)
+
+        self.assertListEqual(
+            list(df_trucks.columns), ["delivers_container", "picks_up_container", "realized_container_delivery_time"]
+        )
+        self.assertEqual(
+            df_trucks.loc[truck_with_delivery.id, "realized_container_delivery_time"],
+            datetime.datetime(2021, 7, 1, 9)
+        )
+        self.assertTrue(pd.isna(df_trucks.loc[truck_without_arrival_information.id, "realized_container_delivery_time"]))
+        self.assertEqual(df_containers.loc[container.id, "destination_sequence_id"], 1)
+        self.assertEqual(df_containers.loc[container.id, "destination_name"], "TestDestination")
+        self.assertNotIn("fraction", df_containers.columns)
+
+    # Typed file formats
+
+    def _create_temporary_folder(self) -> str:
+        temporary_folder = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(temporary_folder.cleanup)
+        return temporary_folder.name
+
+    def _export_sample_data(
+            self,
+            file_format: ExportFileFormat,
+            chunk_size: Optional[int] = None,
+            max_workers: int = 1,
+            path_to_database: str = ":memory:",
+            compression: Optional[ExportCompression] = None,
+    ) -> str:
+        db = SqliteDatabase(path_to_database, pragmas={"journal_mode": "wal"})
+        database_proxy.initialize(db)
+        db.bind(self._all_models)
+        db.create_tables(self._all_models)
+        ContainerFlowGenerationProperties.create(
+            start_date=datetime.date(2021, 7, 1), end_date=datetime.date(2021, 7, 31)
+        )
+        truck = Truck.create(delivers_container=True, picks_up_container=False)
+        for _ in range(3):
+            Container.create(
+                weight=20,
+                length=ContainerLength.forty_feet,
+                storage_requirement=StorageRequirement.reefer,
+                delivered_by=ModeOfTransport.truck,
+                delivered_by_truck=truck,
+                picked_up_by_initial=ModeOfTransport.feeder,
+                picked_up_by=ModeOfTransport.feeder,
+            )
+        path_to_export_folder = self._create_temporary_folder()
+        try:
+            with mock.patch.object(ExportContainerFlowService, "logger"):
+                return self.svc.export(
+                    "sample", path_to_export_folder, file_format, overwrite=False, chunk_size=chunk_size,
+                    max_workers=max_workers, compression=compression
+                )
+        finally:
+            db.close()
+            self._test_db.bind(self._all_models)
+            database_proxy.initialize(self._test_db)
+
+    def test_export_as_parquet(self):
+        path_to_target_folder = self._export_sample_data(ExportFileFormat.parquet)
+        path_to_containers = os.path.join(path_to_target_folder, "containers.parquet")
+
+        df_containers = pd.read_parquet(path_to_containers)
+        self.assertIsInstance(df_containers["delivered_by"].dtype, pd.CategoricalDtype)
+        self.assertListEqual(
+            list(df_containers["delivered_by"].cat.categories), [value.value for value in ModeOfTransport]
+        )
+        self.assertEqual(df_containers["delivered_by_vehicle"].dtype, pd.Int64Dtype())
+        self.assertTrue(pd.isna(df_containers["delivered_by_vehicle"].iloc[0]))
+        self.assertEqual(df_containers["storage_requirement"].iloc[0], StorageRequirement.reefer.value)
+        self.assertEqual(df_containers["length"].dtype, np.int64, "Parquet only keeps dictionaries of text values")
+
+        schema = pyarrow.parquet.read_schema(path_to_containers)
+        self.assertEqual(
+            schema.field("storage_requirement").metadata[b"description"].decode("utf-8"),
+            Container.storage_requirement.help_text
+        )
+        self.assertIn(b"conflowgen", schema.metadata)
+        self.assertTrue(os.path.isfile(os.path.join(path_to_target_folder, "metadata.yaml")))
+
+        df_trucks = pd.read_parquet(os.path.join(path_to_target_folder, "trucks.parquet"))
+        self.assertEqual(df_trucks["delivers_container"].dtype, pd.BooleanDtype())
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(df_trucks["realized_container_delivery_time"]))
+
+    def test_export_as_feather(self):
+        path_to_target_folder = self._export_sample_data(ExportFileFormat.feather)
+
+        df_containers = pd.read_feather(os.path.join(path_to_target_folder, "containers.feather"))
+        self.assertIsInstance(df_containers["length"].dtype, pd.CategoricalDtype)
+        self.assertEqual(df_containers["length"].iloc[0], ContainerLength.forty_feet.value)
+        self.assertEqual(df_containers.index.name, "id")
+
+    def test_export_as_parquet_without_pyarrow(self):
+        find_spec = importlib.util.find_spec
+        with mock.patch.object(
+                importlib.util, "find_spec", side_effect=lambda name: None if name == "pyarrow" else find_spec(name)
+        ):
+            with self.assertRaises(FileFormatNotSupportedException):
+                self.svc.export("typed", "X", ExportFileFormat.parquet, overwrite=False)
+
+    # Chunked export
+
+    def test_export_in_chunks(self):
+        path_to_target_folder = self._export_sample_data(ExportFileFormat.csv, chunk_size=2)
+
+        df_containers = pd.read_csv(os.path.join(path_to_target_folder, "containers.csv"), index_col="id")
+        self.assertListEqual(list(df_containers.index), [1, 2, 3])
+        self.assertListEqual(list(df_containers["storage_requirement"]), [StorageRequirement.reefer.value] * 3)
+        self.assertIn("destination_name", df_containers.columns, "Columns of joined tables are always included")
+
+        df_feeders = pd.read_csv(os.path.join(path_to_target_folder, "feeders.csv"))
+        self.assertEqual(len(df_feeders), 0)
+        self.assertIn("vehicle_name", df_feeders.columns, "The header is written for empty tables")
+        self.assertTrue(os.path.isfile(os.path.join(path_to_target_folder, "metadata.yaml")))
+
+    def test_export_in_chunks_only_for_csv(self):
+        with self.assertRaises(ChunkedExportNotSupportedException):
+            self.svc.export("chunked", "X", ExportFileFormat.xlsx, overwrite=False, chunk_size=10)
+
+    # Parallel export
+
+    def test_export_in_parallel(self):
+        path_to_database = os.path.join(self._create_temporary_folder(), "export.sqlite")
+        path_to_sequential_export = self._export_sample_data(
+            ExportFileFormat.csv, path_to_database=path_to_database
+        )
+        os.remove(path_to_database)
+        path_to_parallel_export = self._export_sample_data(
+            ExportFileFormat.csv, max_workers=2, path_to_database=path_to_database
+        )
+
+        for file_name in ("containers.csv", "trucks.csv", "feeders.csv", "metadata.yaml"):
+            with open(os.path.join(path_to_sequential_export, file_name), encoding="utf-8") as sequential_file, \
+                    open(os.path.join(path_to_parallel_export, file_name), encoding="utf-8") as parallel_file:
+                self.assertEqual(sequential_file.read(), parallel_file.read(), file_name)
+
+    def test_export_in_parallel_requires_database_file(self):
+        path_to_target_folder = self._export_sample_data(ExportFileFormat.csv, max_workers=2)
+        df_containers = pd.read_csv(os.path.join(path_to_target_folder, "containers.csv"), index_col="id")
+        self.assertEqual(len(df_containers), 3)
+
+    # Compressed export
+
+    def test_export_with_compression(self):
+        path_to_target_folder = self._export_sample_data(ExportFileFormat.csv, compression=ExportCompression.gzip)
+
+        self.assertFalse(os.path.isfile(os.path.join(path_to_target_folder, "containers.csv")))
+        df_containers = pd.read_csv(os.path.join(path_to_target_folder, "containers.csv.gz"), index_col="id")
+        self.assertListEqual(list(df_containers["storage_requirement"]), [StorageRequirement.reefer.value] * 3)
+        self.assertTrue(os.path.isfile(os.path.join(path_to_target_folder, "metadata.yaml")))
+
+    def test_export_in_chunks_with_compression(self):
+        for compression in (ExportCompression.bz2, ExportCompression.xz):
+            with self.subTest(compression=compression):
+                path_to_target_folder = self._export_sample_data(
+                    ExportFileFormat.csv, chunk_size=2, compression=compression
+                )
+                df_containers = pd.read_csv(
+                    os.path.join(path_to_target_folder, "containers.csv." + compression.value), index_col="id"
+                )
+                self.assertListEqual(list(df_containers.index), [1, 2, 3])
+                df_feeders = pd.read_csv(os.path.join(path_to_target_folder, "feeders.csv." + compression.value))
+                self.assertIn("vehicle_name", df_feeders.columns)
+
+    def test_export_as_zip_archive(self):
+        for file_format, chunk_size in ((ExportFileFormat.csv, None), (ExportFileFormat.csv, 2),
+                                        (ExportFileFormat.parquet, None)):
+            with self.subTest(file_format=file_format, chunk_size=chunk_size):
+                path_to_archive = self._export_sample_data(
+                    file_format, chunk_size=chunk_size, compression=ExportCompression.zip
+                )
+                self.assertTrue(path_to_archive.endswith("sample.zip"))
+                self.assertFalse(os.path.isdir(os.path.join(os.path.dirname(path_to_archive), "sample")))
+                with zipfile.ZipFile(path_to_archive) as zip_file:
+                    self.assertIn("sample/metadata.yaml", zip_file.namelist())
+                    self.assertIn(f"sample/trucks.{file_format.value}", zip_file.namelist())
+                    with zip_file.open(f"sample/containers.{file_format.value}") as file:
+                        if file_format == ExportFileFormat.csv:
+                            df_containers = pd.read_csv(file, index_col="id")
+                        else:
+                            df_containers = pd.read_parquet(file)
+                    self.assertEqual(len(df_containers), 3)
+
+    def test_export_as_zip_archive_not_overwriting(self):
+        path_to_export_folder = self._create_temporary_folder()
+        with open(os.path.join(path_to_export_folder, "archived.zip"), "w", encoding="utf-8"):
+            pass
+        with self.assertRaises(ExportOnlyAllowedToNotExistingFolderException):
+            self.svc.export(
+                "archived", path_to_export_folder, ExportFileFormat.csv, overwrite=False,
+                compression=ExportCompression.zip
+            )
+
+    def test_compression_of_compressed_file_format(self):
+        with self.assertRaises(CompressionNotSupportedException):
+            self.svc.export(
+                "compressed", "X", ExportFileFormat.parquet, overwrite=False, compression=ExportCompression.gzip
+            )
+
+    @unittest.skipIf(importlib.util.find_spec("zstandard") is not None, "zstandard is installed")
+    def test_compression_with_zstandard_not_installed(self):
+        with self.assertRaises(CompressionNotSupportedException):
+            self.svc.export(
+                "compressed", "X", ExportFileFormat.csv, overwrite=False, compression=ExportCompression.zstd
+            )
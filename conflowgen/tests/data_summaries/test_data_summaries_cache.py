@@ -1,5 +1,7 @@
+import gc
 import unittest
 import datetime
+import weakref
 from functools import wraps
 
 from conflowgen import ContainerLength, TruckArrivalDistributionManager, ModeOfTransport, TruckGateThroughputPreview
@@ -532,3 +534,167 @@ class TestDataSummariesCache(unittest.TestCase):
         self.assertTrue(4 in list(DataSummariesCache.cached_results.values()), "Both results should be cached")
         # pylint: disable=protected-access
         self.assertEqual(DataSummariesCache._hit_counter['method'], 3)
+
+
+class TestDataSummariesCacheLimitsAndStatistics(unittest.TestCase):
+
+    def setUp(self) -> None:
+        DataSummariesCache.reset_cache()
+        DataSummariesCache.reset_statistics()
+
+    def tearDown(self) -> None:
+        DataSummariesCache.set_limits()
+        DataSummariesCache.reset_cache()
+        DataSummariesCache.reset_statistics()
+
+    def test_least_recently_used_result_is_evicted(self):
+        DataSummariesCache.set_limits(max_entries=2)
+
+        @DataSummariesCache.cache_result
+        def square(n):
+            return n ** 2
+
+        square(1)
+        square(2)
+        square(1)  # 1 is now used more recently than 2
+        square(3)
+        self.assertEqual(len(DataSummariesCache.cached_results), 2)
+        self.assertSetEqual(set(DataSummariesCache.cached_results.values()), {1, 9})
+
+    def test_memory_limit(self):
+        DataSummariesCache.set_limits(max_entries=None, max_memory_in_bytes=20_000)
+
+        @DataSummariesCache.cache_result
+        def get_numbers(n):
+            return list(range(n))
+
+        get_numbers(10)
+        get_numbers(1000)  # far larger than the limit on its own
+        self.assertEqual(len(DataSummariesCache.cached_results), 0)
+
+        get_numbers(10)
+        get_numbers(20)
+        self.assertEqual(len(DataSummariesCache.cached_results), 2)
+
+    def test_statistics(self):
+        @DataSummariesCache.cache_result
+        def cube(n):
+            return n ** 3
+
+        cube(2)
+        cube(2)
+        cube(3)
+        statistics = DataSummariesCache.get_statistics()
+        (function_identifier, ) = [identifier for identifier in statistics if identifier.endswith(".cube")]
+        self.assertEqual(statistics[function_identifier].hits, 1)
+        self.assertEqual(statistics[function_identifier].misses, 2)
+        self.assertGreaterEqual(statistics[function_identifier].compute_time_in_seconds, 0)
+
+        DataSummariesCache.reset_cache()
+        self.assertEqual(DataSummariesCache.get_statistics()[function_identifier].misses, 2,
+                         "Statistics are kept when the cache is reset")
+
+    def test_excluded_function(self):
+        calls = []
+
+        @DataSummariesCache.cache_result
+        def record_call(n):
+            calls.append(n)
+            return n
+
+        record_call(1)
+        DataSummariesCache.exclude_function(record_call)
+        self.assertEqual(len(DataSummariesCache.cached_results), 0, "Previous results are removed")
+        record_call(1)
+        record_call(1)
+        self.assertListEqual(calls, [1, 1, 1])
+        self.assertEqual(len(DataSummariesCache.cached_results), 0)
+
+        DataSummariesCache.include_function(record_call)
+        record_call(1)
+        record_call(1)
+        self.assertListEqual(calls, [1, 1, 1, 1])
+
+
+class SummaryWithAttributes:
+    cache_results_by_attributes = True
+    number_computations = 0
+
+    def __init__(self, transportation_buffer: float, nested_summary=None):
+        self.transportation_buffer = transportation_buffer
+        self.nested_summary = nested_summary
+
+    @DataSummariesCache.cache_result
+    def get_volume(self, vehicle_types):
+        SummaryWithAttributes.number_computations += 1
+        volume = sum(len(vehicle_type) for vehicle_type in vehicle_types) * (1 + self.transportation_buffer)
+        if self.nested_summary is not None:
+            volume += self.nested_summary.transportation_buffer
+        return volume
+
+
+class Manager:
+    number_computations = 0
+
+    @DataSummariesCache.cache_result
+    def get_arrival(self, schedule):
+        Manager.number_computations += 1
+        return schedule.vehicle_arrives_at
+
+
+class TestDataSummariesCacheKeys(unittest.TestCase):
+
+    def setUp(self) -> None:
+        DataSummariesCache.reset_cache()
+        SummaryWithAttributes.number_computations = 0
+
+    def tearDown(self) -> None:
+        DataSummariesCache.reset_cache()
+
+    def test_instances_with_same_attributes_share_results(self):
+        SummaryWithAttributes(0.2).get_volume(("feeder", "train"))
+        SummaryWithAttributes(0.2).get_volume(("feeder", "train"))
+        self.assertEqual(SummaryWithAttributes.number_computations, 1)
+        self.assertEqual(len(DataSummariesCache.cached_results), 1)
+
+    def test_attributes_are_part_of_the_key(self):
+        summary = SummaryWithAttributes(0.2)
+        self.assertAlmostEqual(summary.get_volume(("feeder", )), 7.2)
+        summary.transportation_buffer = 0.5
+        self.assertAlmostEqual(summary.get_volume(("feeder", )), 9)
+        self.assertEqual(SummaryWithAttributes.number_computations, 2)
+
+    def test_attributes_of_nested_instances_are_part_of_the_key(self):
+        first_result = SummaryWithAttributes(0.2, SummaryWithAttributes(0.1)).get_volume(("feeder", ))
+        second_result = SummaryWithAttributes(0.2, SummaryWithAttributes(0.3)).get_volume(("feeder", ))
+        self.assertAlmostEqual(second_result - first_result, 0.2)
+        self.assertEqual(SummaryWithAttributes.number_computations, 2)
+
+    def test_unhashable_arguments(self):
+        summary = SummaryWithAttributes(0.2)
+        summary.get_volume(["feeder", "train"])
+        summary.get_volume(["feeder", "train"])
+        summary.get_volume({"feeder": 1, "train": 2})
+        summary.get_volume({"train": 2, "feeder": 1})
+        self.assertEqual(SummaryWithAttributes.number_computations, 2)
+        summary.get_volume(("feeder", "train"))
+        self.assertEqual(SummaryWithAttributes.number_computations, 3, "Lists and tuples are distinguished")
+
+    def test_keys_do_not_keep_arguments_alive(self):
+        setup_sqlite_in_memory_db().create_tables([Schedule])
+        Manager.number_computations = 0
+        manager = Manager()
+        schedule = Schedule.create(
+            vehicle_type=ModeOfTransport.feeder, service_name="TestFeederService",
+            vehicle_arrives_at=datetime.date(2021, 7, 9), vehicle_arrives_at_time=datetime.time(11),
+            average_vehicle_capacity=300, average_inbound_container_volume=300
+        )
+        manager.get_arrival(schedule)
+        manager.get_arrival(Schedule.get_by_id(schedule.id))
+        self.assertEqual(Manager.number_computations, 1, "Database records are identified by their primary key")
+
+        reference_to_manager, reference_to_schedule = weakref.ref(manager), weakref.ref(schedule)
+        del manager, schedule
+        gc.collect()
+        self.assertIsNone(reference_to_manager())
+        self.assertIsNone(reference_to_schedule())
@@ -0,0 +1,159 @@
+import datetime
+import unittest
+
+from conflowgen.application.models.data_summaries_cache_entry import DataSummariesCacheEntry, \
+    DataSummariesContentVersion
+from conflowgen.data_summaries.cache_key import NotCanonicalizableException, canonicalize, canonicalize_arguments
+from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
+from conflowgen.data_summaries.persistent_data_summaries_cache import PersistentDataSummariesCache
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class Summary:
+    number_computations = 0
+
+    def __init__(self, transportation_buffer: float):
+        self.transportation_buffer = transportation_buffer
+
+    @DataSummariesCache.cache_result
+    def get_volume(self, vehicle_types, start_date=None):
+        Summary.number_computations += 1
+        return {vehicle_type: self.transportation_buffer for vehicle_type in vehicle_types}
+
+
+class IntermediateSummary:
+    number_computations = 0
+
+    @staticmethod
+    @DataSummariesCache.cache_result(persist=False)
+    def get_table():
+        IntermediateSummary.number_computations += 1
+        return list(range(1000))
+
+
+class TestPersistentDataSummariesCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Create container database in memory"""
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        DataSummariesCache.enable_persistent_cache()
+        Summary.number_computations = 0
+        IntermediateSummary.number_computations = 0
+
+    def tearDown(self) -> None:
+        DataSummariesCache.disable_persistent_cache()
+
+    @staticmethod
+    def _forget_results_in_memory():
+        """Behave like a new process that opens the same database"""
+        DataSummariesCache.cached_results.clear()
+
+    def test_result_is_reused_by_another_instance(self):
+        summary = Summary(transportation_buffer=0.2)
+        result = summary.get_volume([ModeOfTransport.feeder], start_date=datetime.datetime(2021, 7, 1))
+        self.assertEqual(Summary.number_computations, 1)
+        self.assertEqual(DataSummariesCacheEntry.select().count(), 1)
+
+        self._forget_results_in_memory()
+        other_summary = Summary(transportation_buffer=0.2)
+        other_result = other_summary.get_volume([ModeOfTransport.feeder], start_date=datetime.datetime(2021, 7, 1))
+        self.assertEqual(Summary.number_computations, 1, "The result has been loaded from the database")
+        self.assertDictEqual(result, other_result)
+
+    def test_instance_state_is_part_of_the_key(self):
+        Summary(transportation_buffer=0.2).get_volume([ModeOfTransport.feeder])
+
+        self._forget_results_in_memory()
+        other_summary = Summary(transportation_buffer=0.5)
+        result = other_summary.get_volume([ModeOfTransport.feeder])
+        self.assertEqual(Summary.number_computations, 2)
+        self.assertDictEqual(result, {ModeOfTransport.feeder: 0.5})
+
+    def test_reset_invalidates_persisted_results(self):
+        Summary(transportation_buffer=0.2).get_volume([ModeOfTransport.feeder])
+
+        DataSummariesCache.reset_cache()
+        self.assertEqual(DataSummariesCacheEntry.select().count(), 0)
+        Summary(transportation_buffer=0.2).get_volume([ModeOfTransport.feeder])
+        self.assertEqual(Summary.number_computations, 2)
+
+    def test_results_of_other_versions_are_removed(self):
+        Summary(transportation_buffer=0.2).get_volume([ModeOfTransport.feeder])
+        DataSummariesContentVersion.update(conflowgen_version="0.0.1").execute()
+
+        self._forget_results_in_memory()
+        PersistentDataSummariesCache._database_with_tables = None  # pylint: disable=protected-access
+        Summary(transportation_buffer=0.2).get_volume([ModeOfTransport.feeder])
+        self.assertEqual(Summary.number_computations, 2, "The result of the other version has not been used")
+        self.assertEqual(DataSummariesCacheEntry.select().count(), 1)
+
+    def test_intermediate_results_are_not_persisted(self):
+        self.assertTrue(PersistentDataSummariesCache.is_available())
+        IntermediateSummary.get_table()
+        self.assertEqual(DataSummariesCacheEntry.select().count(), 0)
+        IntermediateSummary.get_table()
+        self.assertEqual(IntermediateSummary.number_computations, 1, "The result is still cached in memory")
+
+    def test_reset_while_disabled_invalidates_persisted_results(self):
+        Summary(transportation_buffer=0.2).get_volume([ModeOfTransport.feeder])
+
+        DataSummariesCache.disable_persistent_cache()
+        DataSummariesCache.reset_cache()  # e.g., a new container flow is generated
+        self._forget_results_in_memory()
+        DataSummariesCache.enable_persistent_cache()
+        Summary(transportation_buffer=0.2).get_volume([ModeOfTransport.feeder])
+        self.assertEqual(Summary.number_computations, 2, "The outdated result has not been used")
+
+    def test_disabled_persistent_cache(self):
+        DataSummariesCache.disable_persistent_cache()
+        Summary(transportation_buffer=0.2).get_volume([ModeOfTransport.feeder])
+
+        self._forget_results_in_memory()
+        Summary(transportation_buffer=0.2).get_volume([ModeOfTransport.feeder])
+        self.assertEqual(Summary.number_computations, 2)
+
+    def test_arguments_without_stable_representation_are_not_persisted(self):
+        Summary(transportation_buffer=0.2).get_volume([object()])
+        self.assertEqual(DataSummariesCacheEntry.select().count(), 0)
+
+
+class TestCacheKey(unittest.TestCase):
+
+    def test_order_of_sets_and_dicts_is_irrelevant(self):
+        self.assertEqual(
+            canonicalize({ModeOfTransport.feeder, ModeOfTransport.train}),
+            canonicalize({ModeOfTransport.train, ModeOfTransport.feeder})
+        )
+        self.assertEqual(
+            canonicalize({"a": 1, "b": 2}),
+            canonicalize({"b": 2, "a": 1})
+        )
+
+    def test_lists_and_tuples_differ(self):
+        self.assertNotEqual(canonicalize([1, 2]), canonicalize((1, 2)))
+
+    def test_arguments_without_stable_representation(self):
+        with self.assertRaises(NotCanonicalizableException):
+            canonicalize(object())
+
+    def test_bound_instance(self):
+        key_1 = canonicalize_arguments(Summary.get_volume, (Summary(0.2), [ModeOfTransport.feeder]), {})
+        key_2 = canonicalize_arguments(Summary.get_volume, (Summary(0.2), [ModeOfTransport.feeder]), {})
+        key_3 = canonicalize_arguments(Summary.get_volume, (Summary(0.3), [ModeOfTransport.feeder]), {})
+        self.assertEqual(key_1, key_2)
+        self.assertNotEqual(key_1, key_3)
+
+    def test_nested_instance(self):
+        class NestedSummary:
+            cache_results_by_attributes = True
+
+            def __init__(self, transportation_buffer: float):
+                self.transportation_buffer = transportation_buffer
+
+        summary_1, summary_2 = Summary(0.2), Summary(0.2)
+        summary_1.nested_summary = NestedSummary(0.1)
+        summary_2.nested_summary = NestedSummary(0.3)
+        key_1 = canonicalize_arguments(Summary.get_volume, (summary_1, [ModeOfTransport.feeder]), {})
+        key_2 = canonicalize_arguments(Summary.get_volume, (summary_2, [ModeOfTransport.feeder]), {})
+        self.assertNotEqual(key_1, key_2)
@@ -0,0 +1,37 @@
+import unittest
+
+from conflowgen.database_connection.create_tables import CONTAINER_SECONDARY_INDEXES, create_secondary_indexes, \
+    create_tables, drop_secondary_indexes, secondary_indexes_dropped
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestCreateTables(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Create container database in memory"""
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        create_tables(self.sqlite_db)
+
+    def _get_names_of_container_indexes(self):
+        return {index.name for index in self.sqlite_db.get_indexes("container")}
+
+    def test_secondary_indexes_are_created_with_tables(self):
+        self.assertTrue(set(CONTAINER_SECONDARY_INDEXES).issubset(self._get_names_of_container_indexes()))
+
+    def test_drop_and_recreate_secondary_indexes(self):
+        drop_secondary_indexes(self.sqlite_db)
+        self.assertFalse(set(CONTAINER_SECONDARY_INDEXES) & self._get_names_of_container_indexes())
+
+        create_secondary_indexes(self.sqlite_db)
+        self.assertTrue(set(CONTAINER_SECONDARY_INDEXES).issubset(self._get_names_of_container_indexes()))
+
+    def test_create_secondary_indexes_twice(self):
+        create_secondary_indexes(self.sqlite_db)
+        self.assertTrue(set(CONTAINER_SECONDARY_INDEXES).issubset(self._get_names_of_container_indexes()))
+
+    def test_secondary_indexes_dropped_temporarily(self):
+        with self.assertRaises(RuntimeError):
+            with secondary_indexes_dropped(self.sqlite_db):
+                self.assertFalse(set(CONTAINER_SECONDARY_INDEXES) & self._get_names_of_container_indexes())
+                raise RuntimeError("The indexes are created again nonetheless")
+        self.assertTrue(set(CONTAINER_SECONDARY_INDEXES).issubset(self._get_names_of_container_indexes()))
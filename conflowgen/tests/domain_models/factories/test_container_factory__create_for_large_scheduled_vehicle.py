@@ -148,3 +148,34 @@ class TestContainerFactory(unittest.TestCase):
 
         self.assertGreater(container_volume_in_teu, 500, "A bit less than 600 is acceptable but common!")
         self.assertLess(container_volume_in_teu, 700, "A bit more than 600 is acceptable but common!")
+
+    def test_containers_for_large_scheduled_vehicle_are_saved_in_bulk(self):
+        schedule = Schedule.create(
+            service_name="SunExpress",
+            vehicle_type=ModeOfTransport.deep_sea_vessel,
+            vehicle_arrives_at=datetime.date(2021, 7, 9),
+            vehicle_arrives_at_time=datetime.time(11),
+            average_vehicle_capacity=24000,
+            average_inbound_container_volume=3000
+        )
+        vessel = FleetFactory().create_deep_sea_vessel_fleet(
+            schedule=schedule,
+            first_at=datetime.date(2021, 7, 8),
+            latest_at=datetime.date(2021, 7, 10)
+        )[0]
+
+        # noinspection PyTypeChecker
+        containers = self.container_factory.create_containers_for_large_scheduled_vehicle(vessel)
+
+        self.assertEqual(
+            len(containers),
+            Container.select().where(
+                Container.delivered_by_large_scheduled_vehicle == vessel.large_scheduled_vehicle
+            ).count()
+        )
+        for container in containers:
+            container_in_database = Container.get_by_id(container.id)
+            self.assertEqual(container.length, container_in_database.length)
+            self.assertEqual(container.weight, container_in_database.weight)
+            self.assertEqual(container.storage_requirement, container_in_database.storage_requirement)
+            self.assertEqual(container.picked_up_by, container_in_database.picked_up_by)
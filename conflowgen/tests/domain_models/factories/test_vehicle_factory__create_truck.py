@@ -60,3 +60,36 @@ class TestVehicleFactory__create_truck(unittest.TestCase):  # pylint: disable=in
                 delivers_container=False,
                 picks_up_container=False
             )
+
+    def test_create_trucks_picking_up_containers(self) -> None:
+        now = datetime.datetime.now()
+        trucks = self.vehicle_factory.create_trucks(
+            delivers_container=False,
+            picks_up_container=True,
+            truck_arrival_information_for_pickup=[
+                TruckArrivalInformationForPickup(realized_container_pickup_time=now + datetime.timedelta(hours=i))
+                for i in range(5)
+            ]
+        )
+        self.assertEqual(len(trucks), 5)
+        self.assertEqual(Truck.select().count(), 5)
+        for i, truck in enumerate(trucks):
+            truck_in_db = Truck.get_by_id(truck.id)
+            self.assertTrue(truck_in_db.picks_up_container)
+            self.assertIsNone(truck_in_db.truck_arrival_information_for_delivery)
+            self.assertEqual(
+                truck_in_db.truck_arrival_information_for_pickup.realized_container_pickup_time,
+                now + datetime.timedelta(hours=i)
+            )
+
+    def test_create_trucks_with_missing_arrival_time_information(self) -> None:
+        with self.assertRaises(MissingInformationException):
+            self.vehicle_factory.create_trucks(
+                delivers_container=True,
+                picks_up_container=False,
+                truck_arrival_information_for_delivery=[
+                    TruckArrivalInformationForDelivery(realized_container_delivery_time=datetime.datetime.now()),
+                    None
+                ]
+            )
+        self.assertEqual(Truck.select().count(), 0)
@@ -0,0 +1,110 @@
+import datetime
+import unittest
+
+from conflowgen.domain_models.arrival_information import TruckArrivalInformationForDelivery, \
+    TruckArrivalInformationForPickup
+from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.data_types.container_length import ContainerLength
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
+from conflowgen.domain_models.large_vehicle_schedule import Destination, Schedule
+from conflowgen.domain_models.repositories.container_repository import ContainerRepository
+from conflowgen.domain_models.vehicle import LargeScheduledVehicle, Truck
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestContainerRepository(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Create container database in memory"""
+        sqlite_db = setup_sqlite_in_memory_db()
+        sqlite_db.create_tables([
+            Schedule,
+            Destination,
+            LargeScheduledVehicle,
+            Container,
+            Truck,
+            TruckArrivalInformationForDelivery,
+            TruckArrivalInformationForPickup,
+        ])
+        schedule = Schedule.create(
+            vehicle_type=ModeOfTransport.feeder,
+            service_name="TestFeederService",
+            vehicle_arrives_at=datetime.date(year=2021, month=8, day=7),
+            vehicle_arrives_at_time=datetime.time(hour=13, minute=15),
+            average_vehicle_capacity=300,
+            average_inbound_container_volume=250,
+        )
+        self.feeder_arrival = datetime.datetime(year=2021, month=8, day=7, hour=13, minute=15)
+        self.large_scheduled_vehicle = LargeScheduledVehicle.create(
+            vehicle_name="TestFeeder1",
+            capacity_in_teu=300,
+            inbound_container_volume=250,
+            scheduled_arrival=self.feeder_arrival,
+            schedule=schedule
+        )
+
+    def _create_container(self, **kwargs) -> Container:
+        return Container.create(
+            weight=20,
+            length=ContainerLength.twenty_feet,
+            storage_requirement=StorageRequirement.standard,
+            **kwargs
+        )
+
+    def test_materialize_cached_times(self):
+        truck_delivery_time = datetime.datetime(year=2021, month=8, day=5, hour=9)
+        delivering_truck = Truck.create(
+            delivers_container=True,
+            picks_up_container=False,
+            truck_arrival_information_for_delivery=TruckArrivalInformationForDelivery.create(
+                realized_container_delivery_time=truck_delivery_time
+            )
+        )
+        truck_pickup_time = datetime.datetime(year=2021, month=8, day=9, hour=11)
+        picking_up_truck = Truck.create(
+            delivers_container=False,
+            picks_up_container=True,
+            truck_arrival_information_for_pickup=TruckArrivalInformationForPickup.create(
+                realized_container_pickup_time=truck_pickup_time
+            )
+        )
+        export_container = self._create_container(
+            delivered_by=ModeOfTransport.truck,
+            delivered_by_truck=delivering_truck,
+            picked_up_by=ModeOfTransport.feeder,
+            picked_up_by_initial=ModeOfTransport.feeder,
+            picked_up_by_large_scheduled_vehicle=self.large_scheduled_vehicle
+        )
+        import_container = self._create_container(
+            delivered_by=ModeOfTransport.feeder,
+            delivered_by_large_scheduled_vehicle=self.large_scheduled_vehicle,
+            picked_up_by=ModeOfTransport.truck,
+            picked_up_by_initial=ModeOfTransport.truck,
+            picked_up_by_truck=picking_up_truck
+        )
+
+        ContainerRepository.materialize_cached_times()
+
+        export_container = Container.get_by_id(export_container.id)
+        self.assertEqual(export_container.cached_arrival_time, truck_delivery_time)
+        self.assertEqual(export_container.cached_departure_time, self.feeder_arrival)
+        import_container = Container.get_by_id(import_container.id)
+        self.assertEqual(import_container.cached_arrival_time, self.feeder_arrival)
+        self.assertEqual(import_container.cached_departure_time, truck_pickup_time)
+
+    def test_get_arrival_time_does_not_write_to_database(self):
+        container = self._create_container(
+            delivered_by=ModeOfTransport.feeder,
+            delivered_by_large_scheduled_vehicle=self.large_scheduled_vehicle,
+            picked_up_by=ModeOfTransport.feeder,
+            picked_up_by_initial=ModeOfTransport.feeder,
+            picked_up_by_large_scheduled_vehicle=self.large_scheduled_vehicle
+        )
+
+        self.assertEqual(container.get_arrival_time(), self.feeder_arrival)
+        self.assertEqual(container.get_departure_time(), self.feeder_arrival)
+
+        container = Container.get_by_id(container.id)
+        self.assertIsNone(container.cached_arrival_time)
+        self.assertIsNone(container.cached_departure_time)
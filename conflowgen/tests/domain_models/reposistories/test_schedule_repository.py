@@ -307,3 +307,96 @@ class TestScheduleRepository(unittest.TestCase):
             ramp_up_period_end=datetime.datetime(2023, 1, 1),
             ramp_down_period_start=datetime.datetime(2024, 1, 1)
         )
+
+    def _create_train(self, schedule: Schedule, name: str, scheduled_arrival: datetime.datetime) -> Train:
+        train_lsv = LargeScheduledVehicle.create(
+            vehicle_name=name,
+            capacity_in_teu=90,
+            inbound_container_volume=7,
+            scheduled_arrival=scheduled_arrival,
+            schedule=schedule
+        )
+        return Train.create(
+            large_scheduled_vehicle=train_lsv
+        )
+
+    def test_departure_index_finds_same_vehicles_as_query(self):
+        schedule = Schedule.create(
+            vehicle_type=ModeOfTransport.train,
+            service_name="TestTrainService",
+            vehicle_arrives_at=datetime.date(year=2021, month=8, day=7),
+            vehicle_arrives_at_time=datetime.time(hour=13, minute=15),
+            average_vehicle_capacity=90,
+            average_inbound_container_volume=7,
+        )
+        trains = [
+            self._create_train(schedule, f"TestTrain{day}", datetime.datetime(year=2021, month=8, day=day, hour=13))
+            for day in (9, 3, 7, 5, 11)
+        ]
+        start = datetime.datetime(year=2021, month=8, day=5, hour=13)
+        end = datetime.datetime(year=2021, month=8, day=9, hour=13)
+
+        vehicles_from_query = self.schedule_repository.get_departing_vehicles(
+            start=start,
+            end=end,
+            vehicle_type=ModeOfTransport.train,
+            required_capacity=ContainerLength.twenty_feet,
+            flow_direction=FlowDirection.undefined
+        )
+        self.schedule_repository.load_departure_index()
+        vehicles_from_index = self.schedule_repository.get_departing_vehicles(
+            start=start,
+            end=end,
+            vehicle_type=ModeOfTransport.train,
+            required_capacity=ContainerLength.twenty_feet,
+            flow_direction=FlowDirection.undefined
+        )
+
+        self.assertSetEqual(set(vehicles_from_query), set(vehicles_from_index))
+        self.assertListEqual(vehicles_from_index, [trains[3], trains[2], trains[0]])
+
+    def test_reset_departure_index(self):
+        self.schedule_repository.load_departure_index()
+        self.assertIsNotNone(self.schedule_repository.departure_index)
+        self.schedule_repository.reset_departure_index()
+        self.assertIsNone(self.schedule_repository.departure_index)
+
+    def test_vehicle_with_exhausted_capacity_is_dropped_from_departure_index(self):
+        schedule = Schedule.create(
+            vehicle_type=ModeOfTransport.train,
+            service_name="TestTrainService",
+            vehicle_arrives_at=datetime.date(year=2021, month=8, day=7),
+            vehicle_arrives_at_time=datetime.time(hour=13, minute=15),
+            average_vehicle_capacity=90,
+            average_inbound_container_volume=7,
+        )
+        train = self._create_train(schedule, "TestTrain", datetime.datetime(year=2021, month=8, day=7, hour=13))
+        container = Container.create(
+            weight=20,
+            length=ContainerLength.forty_feet,
+            storage_requirement=StorageRequirement.standard,
+            delivered_by=ModeOfTransport.truck,
+            picked_up_by=ModeOfTransport.train,
+            picked_up_by_initial=ModeOfTransport.train,
+        )
+        self.schedule_repository.load_departure_index()
+
+        def get_departing_vehicles():
+            return self.schedule_repository.get_departing_vehicles(
+                start=datetime.datetime(year=2021, month=8, day=5),
+                end=datetime.datetime(year=2021, month=8, day=10),
+                vehicle_type=ModeOfTransport.train,
+                required_capacity=ContainerLength.forty_feet,
+                flow_direction=container.flow_direction
+            )
+
+        capacity_is_exhausted = False
+        while not capacity_is_exhausted:
+            self.assertListEqual(get_departing_vehicles(), [train])
+            capacity_is_exhausted = self.schedule_repository.block_capacity_for_outbound_journey(train, container)
+
+        with unittest.mock.patch.object(
+                self.schedule_repository.vehicle_capacity_manager,
+                'get_free_capacity_for_outbound_journey') as mock_method:
+            self.assertListEqual(get_departing_vehicles(), [])
+        mock_method.assert_not_called()
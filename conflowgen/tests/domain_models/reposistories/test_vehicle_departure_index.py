@@ -0,0 +1,74 @@
+import datetime
+import unittest
+
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.large_vehicle_schedule import Schedule
+from conflowgen.domain_models.repositories.vehicle_departure_index import VehicleDepartureIndex
+from conflowgen.domain_models.vehicle import LargeScheduledVehicle, Feeder
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestVehicleDepartureIndex(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Create container database in memory"""
+        sqlite_db = setup_sqlite_in_memory_db()
+        sqlite_db.create_tables([
+            Schedule,
+            LargeScheduledVehicle,
+            Feeder,
+        ])
+        self.schedule = Schedule.create(
+            vehicle_type=ModeOfTransport.feeder,
+            service_name="TestFeederService",
+            vehicle_arrives_at=datetime.date(year=2021, month=8, day=7),
+            vehicle_arrives_at_time=datetime.time(hour=13, minute=15),
+            average_vehicle_capacity=300,
+            average_inbound_container_volume=100,
+        )
+
+    def _create_feeder(self, scheduled_arrival: datetime.datetime) -> Feeder:
+        feeder_lsv = LargeScheduledVehicle.create(
+            vehicle_name="TestFeeder",
+            capacity_in_teu=300,
+            inbound_container_volume=100,
+            scheduled_arrival=scheduled_arrival,
+            schedule=self.schedule
+        )
+        return Feeder.create(
+            large_scheduled_vehicle=feeder_lsv
+        )
+
+    def test_empty_index(self):
+        index = VehicleDepartureIndex([])
+        self.assertEqual(len(index), 0)
+        self.assertListEqual(
+            index.get_vehicles_arriving_within(datetime.datetime(2021, 8, 1), datetime.datetime(2021, 8, 30)),
+            []
+        )
+
+    def test_boundaries_are_included(self):
+        feeder_1 = self._create_feeder(datetime.datetime(2021, 8, 5))
+        feeder_2 = self._create_feeder(datetime.datetime(2021, 8, 7))
+        feeder_3 = self._create_feeder(datetime.datetime(2021, 8, 9))
+        index = VehicleDepartureIndex([feeder_3, feeder_1, feeder_2])
+
+        self.assertListEqual(
+            index.get_vehicles_arriving_within(datetime.datetime(2021, 8, 5), datetime.datetime(2021, 8, 7)),
+            [feeder_1, feeder_2]
+        )
+
+    def test_remove_vehicle_with_same_arrival(self):
+        feeder_1 = self._create_feeder(datetime.datetime(2021, 8, 7))
+        feeder_2 = self._create_feeder(datetime.datetime(2021, 8, 7))
+        index = VehicleDepartureIndex([feeder_1, feeder_2])
+        index_copy = index.copy()
+
+        index.remove(feeder_2)
+        index.remove(feeder_2)
+
+        self.assertListEqual(
+            index.get_vehicles_arriving_within(datetime.datetime(2021, 8, 1), datetime.datetime(2021, 8, 30)),
+            [feeder_1]
+        )
+        self.assertEqual(len(index_copy), 2, "Copies are not affected")
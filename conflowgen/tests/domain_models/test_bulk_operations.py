@@ -0,0 +1,92 @@
+import datetime
+import unittest
+
+from conflowgen.domain_models.bulk_operations import bulk_insert, bulk_update
+from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.data_types.container_length import ContainerLength
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
+from conflowgen.domain_models.large_vehicle_schedule import Schedule, Destination
+from conflowgen.domain_models.vehicle import LargeScheduledVehicle, Truck
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestBulkOperations(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Create container database in memory"""
+        sqlite_db = setup_sqlite_in_memory_db()
+        sqlite_db.create_tables([
+            Schedule,
+            LargeScheduledVehicle,
+            Container,
+            Truck,
+            Destination,
+        ])
+
+    @staticmethod
+    def _create_unsaved_containers(number_containers: int):
+        return [
+            Container(
+                weight=10 + i % 20,
+                length=ContainerLength.forty_feet if i % 2 else ContainerLength.twenty_feet,
+                storage_requirement=StorageRequirement.standard,
+                delivered_by=ModeOfTransport.truck,
+                picked_up_by=ModeOfTransport.feeder,
+                picked_up_by_initial=ModeOfTransport.feeder,
+            )
+            for i in range(number_containers)
+        ]
+
+    def test_bulk_insert_of_nothing(self):
+        bulk_insert([])
+        self.assertEqual(Container.select().count(), 0)
+
+    def test_bulk_insert_sets_ids(self):
+        Container.create(
+            weight=20,
+            length=ContainerLength.twenty_feet,
+            storage_requirement=StorageRequirement.empty,
+            delivered_by=ModeOfTransport.truck,
+            picked_up_by=ModeOfTransport.truck,
+            picked_up_by_initial=ModeOfTransport.truck,
+        )
+        containers = self._create_unsaved_containers(500)  # more than fit into a single batch
+
+        bulk_insert(containers)
+
+        self.assertEqual(Container.select().count(), 501)
+        for container in containers:
+            container_in_database = Container.get_by_id(container.id)
+            self.assertEqual(container.weight, container_in_database.weight)
+            self.assertEqual(container.length, container_in_database.length)
+
+    def test_bulk_update(self):
+        schedule = Schedule.create(
+            vehicle_type=ModeOfTransport.feeder,
+            service_name="TestFeederService",
+            vehicle_arrives_at=datetime.date(year=2021, month=8, day=7),
+            vehicle_arrives_at_time=datetime.time(hour=13, minute=15),
+            average_vehicle_capacity=300,
+            average_inbound_container_volume=300,
+        )
+        feeder_lsv = LargeScheduledVehicle.create(
+            vehicle_name="TestFeeder1",
+            capacity_in_teu=300,
+            inbound_container_volume=300,
+            scheduled_arrival=datetime.datetime(year=2021, month=8, day=7, hour=13, minute=15),
+            schedule=schedule
+        )
+        containers = self._create_unsaved_containers(400)
+        bulk_insert(containers)
+        for container in containers[::2]:
+            container.picked_up_by_large_scheduled_vehicle = feeder_lsv
+            container.emergency_pickup = True
+
+        bulk_update(containers[::2], [Container.picked_up_by_large_scheduled_vehicle, Container.emergency_pickup])
+
+        self.assertEqual(
+            Container.select().where(Container.picked_up_by_large_scheduled_vehicle == feeder_lsv).count(),
+            200
+        )
+        self.assertEqual(Container.select().where(Container.emergency_pickup).count(), 200)
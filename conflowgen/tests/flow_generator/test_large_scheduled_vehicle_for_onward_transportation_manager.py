@@ -445,3 +445,23 @@ class TestLargeScheduledVehicleForExportContainersManager(unittest.TestCase):
         # Ensure that the number of departed containers is 90% of the total inbound container volume
         self.assertEqual(Container.delivered_by_large_scheduled_vehicle, expected_departed_containers,
                          "During ramp-down, exactly 10% of containers should be unloaded.")
+
+    def test_assignments_are_written_when_write_buffer_is_flushed_several_times(self):
+        train = self._create_train(datetime.datetime(year=2021, month=8, day=5, hour=9, minute=0))
+        for _ in range(train.large_scheduled_vehicle.inbound_container_volume):  # here only 20' containers
+            self._create_container_for_large_scheduled_vehicle(train)
+
+        feeder = self._create_feeder(datetime.datetime(year=2021, month=8, day=7, hour=13, minute=15))
+
+        self.manager.write_buffer_size = 7
+        self.manager.choose_departing_vehicle_for_containers()
+
+        self.assertEqual(self.manager.containers_to_update, {}, "All buffered assignments must be flushed")
+        number_containers_on_feeder = Container.select().where(
+            Container.picked_up_by_large_scheduled_vehicle == feeder.large_scheduled_vehicle
+        ).count()
+        number_containers_for_trucks = Container.select().where(
+            (Container.picked_up_by == ModeOfTransport.truck) & Container.emergency_pickup
+        ).count()
+        self.assertEqual(number_containers_on_feeder + number_containers_for_trucks, 90)
+        self.assertGreater(number_containers_on_feeder, 0)
@@ -12,7 +12,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 from conflowgen.application.models.random_seed_store import RandomSeedStore
-from conflowgen.domain_models.arrival_information import TruckArrivalInformationForDelivery
+from conflowgen.domain_models.arrival_information import TruckArrivalInformationForDelivery, \
+    TruckArrivalInformationForPickup
 from conflowgen.flow_generator.truck_for_export_containers_manager import \
     TruckForExportContainersManager
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
@@ -48,6 +49,7 @@ class TestTruckForExportContainersManager(unittest.TestCase):
             LargeScheduledVehicle,
             Schedule,
             TruckArrivalInformationForDelivery,
+            TruckArrivalInformationForPickup,
             RandomSeedStore,
         ])
         truck_arrival_distribution_seeder.seed()
@@ -240,10 +242,10 @@ class TestTruckForExportContainersManager(unittest.TestCase):
 
     def test_nothing_to_do(self):
         with unittest.mock.patch.object(
-                self.manager.vehicle_factory, "create_truck", return_value=None) as create_truck_method:
+                self.manager.vehicle_factory, "create_trucks", return_value=None) as create_trucks_method:
             self.manager.generate_trucks_for_delivering()
 
-        create_truck_method.assert_not_called()
+        create_trucks_method.assert_not_called()
 
     def test_happy_path(self):
         container_arrival_time = datetime.datetime(
@@ -278,11 +280,11 @@ class TestTruckForExportContainersManager(unittest.TestCase):
                 length=ContainerLength.twenty_feet
             )
 
-        with unittest.mock.patch.object(
-                self.manager.vehicle_factory, "create_truck", return_value=None) as create_truck_method:
-            self.manager.generate_trucks_for_delivering()
+        self.manager.batch_size = 300
+        self.manager.generate_trucks_for_delivering()
 
-        self.assertEqual(create_truck_method.call_count, 1000)
+        self.assertEqual(Truck.select().count(), 1000)
+        self.assertEqual(Container.select().where(Container.delivered_by_truck.is_null()).count(), 0)
 
     @staticmethod
     def _use_uniform_distribution():
@@ -399,3 +401,32 @@ class TestTruckForExportContainersManager(unittest.TestCase):
         container_dwell_time = (container_departure_time - average).total_seconds() / 3600
         self.assertGreater(distribution.maximum, container_dwell_time)
         self.assertLess(distribution.minimum, container_dwell_time)
+
+    def test_delivery_times_drawn_at_once_are_in_required_time_range(self):
+        container_departure_times = [
+            datetime.datetime(year=2021, month=7, day=30, hour=hour, minute=55)
+            for hour in range(24)
+        ] * 40
+        containers = [
+            Container.create(
+                delivered_by=ModeOfTransport.truck,
+                picked_up_by=ModeOfTransport.deep_sea_vessel,
+                picked_up_by_initial=ModeOfTransport.deep_sea_vessel,
+                storage_requirement=StorageRequirement.standard,
+                weight=23,
+                length=ContainerLength.twenty_feet
+            )
+        ] * len(container_departure_times)
+        dwell_time_distribution = self.container_dwell_time_distributions_from_truck_to[
+            ModeOfTransport.deep_sea_vessel][StorageRequirement.standard]
+
+        # pylint: disable=protected-access
+        delivery_times = self.manager._get_container_delivery_times(containers, container_departure_times)
+
+        self.assertEqual(len(delivery_times), len(containers))
+        for container_departure_time, delivery_time in zip(container_departure_times, delivery_times):
+            dwell_time = (container_departure_time - delivery_time).total_seconds() / 3600
+            self.assertGreaterEqual(dwell_time, dwell_time_distribution.minimum)
+            self.assertLessEqual(dwell_time, dwell_time_distribution.maximum)
+            self.assertTrue(delivery_time.weekday() != 6,
+                            f"containers do not arrive on Sundays, but here we had {delivery_time}")
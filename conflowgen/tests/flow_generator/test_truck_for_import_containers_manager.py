@@ -16,7 +16,8 @@ from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTranspor
 from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
 from conflowgen.domain_models.data_types.container_length import ContainerLength
 from conflowgen.api.container_dwell_time_distribution_manager import ContainerDwellTimeDistributionManager
-from conflowgen.domain_models.arrival_information import TruckArrivalInformationForPickup
+from conflowgen.domain_models.arrival_information import TruckArrivalInformationForDelivery, \
+    TruckArrivalInformationForPickup
 from conflowgen.domain_models.container import Container
 from conflowgen.domain_models.distribution_models.container_dwell_time_distribution import \
     ContainerDwellTimeDistribution
@@ -48,6 +49,7 @@ class TestTruckForImportContainersManager(unittest.TestCase):
             Destination,
             Schedule,
             TruckArrivalInformationForPickup,
+            TruckArrivalInformationForDelivery,
             RandomSeedStore,
         ])
         truck_arrival_distribution_seeder.seed()
@@ -260,10 +262,10 @@ class TestTruckForImportContainersManager(unittest.TestCase):
 
     def test_nothing_to_do(self):
         with unittest.mock.patch.object(
-                self.manager.vehicle_factory, "create_truck", return_value=None) as create_truck_method:
+                self.manager.vehicle_factory, "create_trucks", return_value=None) as create_trucks_method:
             self.manager.generate_trucks_for_picking_up()
 
-        create_truck_method.assert_not_called()
+        create_trucks_method.assert_not_called()
 
     def test_happy_path(self):
         container_arrival_time = datetime.datetime(
@@ -298,11 +300,11 @@ class TestTruckForImportContainersManager(unittest.TestCase):
                 length=ContainerLength.twenty_feet
             )
 
-        with unittest.mock.patch.object(
-                self.manager.vehicle_factory, "create_truck", return_value=None) as create_truck_method:
-            self.manager.generate_trucks_for_picking_up()
+        self.manager.batch_size = 300
+        self.manager.generate_trucks_for_picking_up()
 
-        self.assertEqual(create_truck_method.call_count, 1000)
+        self.assertEqual(Truck.select().count(), 1000)
+        self.assertEqual(Container.select().where(Container.picked_up_by_truck.is_null()).count(), 0)
 
     @staticmethod
     def _use_uniform_distribution():
@@ -426,3 +428,33 @@ class TestTruckForImportContainersManager(unittest.TestCase):
         containder_dwell_time = (average - container_arrival_time).total_seconds() / 3600
         self.assertGreater(distribution.maximum, containder_dwell_time)
         self.assertLess(distribution.minimum, containder_dwell_time)
+
+    def test_pickup_times_drawn_at_once_are_in_required_time_range(self):
+        container_arrival_times = [
+            datetime.datetime(year=2021, month=8, day=1, hour=hour, minute=13)
+            for hour in range(24)
+        ] * 40
+        containers = [
+            Container.create(
+                delivered_by=ModeOfTransport.deep_sea_vessel,
+                picked_up_by=ModeOfTransport.truck,
+                picked_up_by_initial=ModeOfTransport.truck,
+                storage_requirement=StorageRequirement.standard,
+                weight=23,
+                length=ContainerLength.twenty_feet
+            )
+        ] * len(container_arrival_times)
+        dwell_time_distribution = self.container_dwell_time_distributions_from_x_to_truck[
+            ModeOfTransport.deep_sea_vessel][StorageRequirement.standard]
+
+        # pylint: disable=protected-access
+        pickup_times = self.manager._get_container_pickup_times(containers, container_arrival_times)
+
+        self.assertEqual(len(pickup_times), len(containers))
+        self.assertEqual(len(self.manager.time_window_probabilities), 24, "One entry per hour of the week")
+        for container_arrival_time, pickup_time in zip(container_arrival_times, pickup_times):
+            dwell_time = (pickup_time - container_arrival_time).total_seconds() / 3600
+            self.assertGreaterEqual(dwell_time, dwell_time_distribution.minimum)
+            self.assertLessEqual(dwell_time, dwell_time_distribution.maximum)
+            self.assertTrue(pickup_time.weekday() != 6,
+                            f"containers are not picked up on Sundays but {pickup_time} was presented")
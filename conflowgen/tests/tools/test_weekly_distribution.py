@@ -202,3 +202,31 @@ class TestWeeklyDistribution(unittest.TestCase):
         hour_of_the_week = WeeklyDistribution._get_hour_of_the_week_from_datetime(datetime.datetime(2022, 8, 9, 11, 30))
 
         self.assertEqual(hour_of_the_week, 35)
+
+    def test_slice_as_arrays_is_computed_once(self):
+        weekly_distribution = WeeklyDistribution([
+            (0, .5),
+            (24, .2),
+            (48, .2),
+            (72, .1),
+            (96, 0),
+            (120, 0),
+            (144, 0)
+        ],
+            size_of_time_window_in_hours=48
+        )
+        _datetime = datetime.datetime(
+            year=2021, month=8, day=2, hour=3, minute=30
+        )
+        self.assertEqual(WeeklyDistribution.get_hour_of_the_week(_datetime), 3)
+
+        hours_after_start, fractions = weekly_distribution.get_distribution_slice_as_arrays(_datetime)
+        self.assertListEqual(hours_after_start.tolist(), [21, 45])
+        self.assertAlmostEqual(fractions.sum(), 1)
+        self.assertDictEqual(
+            weekly_distribution.get_distribution_slice(_datetime),
+            dict(zip(hours_after_start.tolist(), fractions.tolist()))
+        )
+
+        hours_after_start_for_same_hour, _ = weekly_distribution.get_distribution_slice_for_hour_of_the_week(3)
+        self.assertIs(hours_after_start, hours_after_start_for_same_hour)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 import datetime
-from typing import List, Tuple, Union, Dict
+from typing import List, Tuple, Union, Dict, Optional
+
+import numpy as np
 
 
 class InvalidDistributionSliceException(Exception):
@@ -8,6 +10,11 @@ class InvalidDistributionSliceException(Exception):
 
 
 class WeeklyDistribution:
+    """
+    A distribution that repeats itself every week, such as the truck arrival distribution.
+    For each of the hours of the week, the normalized slice of the distribution that starts at that hour and spans the
+    time window is computed on first use and then reused, so looking up a slice takes constant time.
+    """
 
     HOURS_IN_WEEK = 168
 
@@ -30,6 +37,8 @@ class WeeklyDistribution:
                     )
                 )
 
+        self._distribution_slices: List[Optional[Tuple[np.ndarray, np.ndarray]]] = [None] * self.HOURS_IN_WEEK
+
     @classmethod
     def _get_hour_of_the_week_from_datetime(cls, point_in_time: datetime.datetime) -> int:
         # Get the monday at midnight before the given point in time
@@ -45,10 +54,19 @@ class WeeklyDistribution:
             f"Time since Monday in completed hours: {completed_hours_since_monday}"
         return completed_hours_since_monday
 
-    def get_distribution_slice(self, start_as_datetime: datetime.datetime) -> Dict[int, float]:
+    @classmethod
+    def get_hour_of_the_week(cls, point_in_time: datetime.datetime) -> int:
+        """
+        Args:
+            point_in_time: Any point in time
 
-        # Convert the datetime into the week hour. Hour 36 corresponds to a Tuesday at 12:00 noon.
-        start_hour = self._get_hour_of_the_week_from_datetime(start_as_datetime)
+        Returns:
+            The completed hours since the Monday at midnight before the point in time, e.g., 36 for a Tuesday at
+            12:30.
+        """
+        return cls._get_hour_of_the_week_from_datetime(point_in_time)
+
+    def _compute_distribution_slice(self, start_hour: int) -> Tuple[np.ndarray, np.ndarray]:
 
         # Calculate the week hour of when to end the distribution slice
         end_hour = start_hour + self.size_of_time_window_in_hours
@@ -68,12 +86,54 @@ class WeeklyDistribution:
             )
 
         total_fraction_sum = sum((fraction for _, fraction in not_normalized_distribution_slice))
-        distribution_slice = {
-            hour_after_start: (hour_fraction / total_fraction_sum)
-            for (hour_after_start, hour_fraction) in not_normalized_distribution_slice
-        }
+        hours_after_start = np.array(
+            [hour_after_start for (hour_after_start, _) in not_normalized_distribution_slice], dtype=np.int64
+        )
+        fractions = np.array(
+            [(hour_fraction / total_fraction_sum) for (_, hour_fraction) in not_normalized_distribution_slice],
+            dtype=np.float64
+        )
+        return hours_after_start, fractions
+
+    def get_distribution_slice_for_hour_of_the_week(self, start_hour: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Args:
+            start_hour: The hour of the week the slice starts at, see :meth:`get_hour_of_the_week`.
+
+        Returns:
+            The hours after the start hour and the normalized fractions of the distribution slice.
+            The returned arrays are shared between all callers and must not be modified.
+        """
+        distribution_slice = self._distribution_slices[start_hour]
+        if distribution_slice is None:
+            distribution_slice = self._compute_distribution_slice(start_hour)
+            self._distribution_slices[start_hour] = distribution_slice
         return distribution_slice
 
+    def get_distribution_slice_as_arrays(self, start_as_datetime: datetime.datetime) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Args:
+            start_as_datetime: The point in time the slice starts at.
+
+        Returns:
+            The hours after the start and the normalized fractions of the distribution slice.
+            The returned arrays are shared between all callers and must not be modified.
+        """
+        # Convert the datetime into the week hour. Hour 36 corresponds to a Tuesday at 12:00 noon.
+        start_hour = self.get_hour_of_the_week(start_as_datetime)
+        return self.get_distribution_slice_for_hour_of_the_week(start_hour)
+
+    def get_distribution_slice(self, start_as_datetime: datetime.datetime) -> Dict[int, float]:
+        """
+        Args:
+            start_as_datetime: The point in time the slice starts at.
+
+        Returns:
+            The normalized distribution slice as a mapping of hours after the start to fractions.
+        """
+        hours_after_start, fractions = self.get_distribution_slice_as_arrays(start_as_datetime)
+        return dict(zip(hours_after_start.tolist(), fractions.tolist()))
+
     def __repr__(self) -> str:
         return (
             "<"